@@ -0,0 +1,244 @@
+# translator_project/translator_app/core/async_translator_engine.py
+import asyncio
+import concurrent.futures
+import contextvars
+import time
+
+from .translator_engine import TranslatorEngine
+
+
+class AsyncTranslatorEngine(TranslatorEngine):
+    """asyncio 기반 번역 엔진 - 적은 수의 스레드로 수백 개의 요청을 동시에 처리
+
+    공개 인터페이스(start_translation_process 등)는 TranslatorEngine과 같습니다. 번역 스레드 안에서
+    이벤트 루프를 실행하고, 동시 요청 수는 세마포어(최대 작업 수 설정)로 제한합니다.
+    중지 요청 시 진행 중인 요청 작업을 취소합니다.
+    """
+
+    # 파일 저장/검증처럼 블로킹되는 마무리 작업용 스레드 수
+    BLOCKING_WORKERS = 4
+    STOP_POLL_INTERVAL = 0.2
+
+    def __init__(self, *args, **kwargs):
+        # 이벤트 루프의 작업끼리 파일명/통계가 섞이지 않도록 스레드 로컬 대신 컨텍스트 변수 사용
+        self._current_file_var = contextvars.ContextVar('current_file', default="")
+        self._file_stats_var = contextvars.ContextVar('file_stats', default=None)
+        self._blocking_executor = None
+        super().__init__(*args, **kwargs)
+
+    def _get_current_file_for_log(self):
+        return self._current_file_var.get()
+
+    def _set_current_file_for_log(self, filename):
+        self._current_file_var.set(filename)
+
+    def _get_current_file_stats(self):
+        return self._file_stats_var.get()
+
+    def _set_current_file_stats(self, file_stats):
+        self._file_stats_var.set(file_stats)
+
+    def _run_file_jobs(self, jobs, finalize_file, on_job_error):
+        """동기 래퍼 - 번역 스레드에서 이벤트 루프를 실행하고 끝날 때까지 대기"""
+        asyncio.run(self._run_file_jobs_async(jobs, finalize_file, on_job_error))
+
+    def _run_blocking(self, func, *args):
+        """파일 기록/번역 메모리 조회처럼 블로킹되는 작업을 이벤트 루프 밖 스레드에서 실행 (현재 컨텍스트 유지)"""
+        context = contextvars.copy_context()
+        return asyncio.get_running_loop().run_in_executor(self._blocking_executor, context.run, func, *args)
+
+    async def _run_file_jobs_async(self, jobs, finalize_file, on_job_error):
+        loop = asyncio.get_running_loop()
+        in_flight = max(1, self.max_workers)
+        semaphore = asyncio.Semaphore(in_flight)
+        blocking_executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.BLOCKING_WORKERS)
+        self._blocking_executor = blocking_executor
+        self.log_callback("log_concurrent_workers", in_flight)
+
+        def finalize_safely(job):
+            try:
+                finalize_file(job)
+            except Exception as e:
+                on_job_error(job, e)
+
+        async def run_batch(job, index):
+            translated_lines = []
+            try:
+                async with semaphore:
+                    if self.stop_event.is_set() or job.failed:
+                        job.failed = True
+                    else:
+                        translated_lines = await self._translate_file_job_batch_async(job, index)
+            except asyncio.CancelledError:
+                job.failed = True
+                job.set_result(index, [])
+                raise
+            except Exception as e:
+                job.failed = True
+                on_job_error(job, e)
+
+            if not job.failed and not self.stop_event.is_set():
+                # 번역 기록(fsync)과 출력 임시 파일 기록은 다른 요청을 막지 않도록 스레드에서 실행
+                # 완료 표시 전에 기록해야 마지막 배치의 마무리(번역 기록 삭제)가 이 기록보다 늦게 옴
+                try:
+                    await self._run_blocking(self._record_file_job_batch, job, index, translated_lines)
+                except asyncio.CancelledError:
+                    job.failed = True
+                    job.set_result(index, [])
+                    raise
+            is_last, _ = job.set_result(index, translated_lines)
+            if job.failed or self.stop_event.is_set():
+                return
+            if is_last:
+                await loop.run_in_executor(blocking_executor, finalize_safely, job)
+
+        # 세마포어는 대기 순서대로 통과하므로 작은 파일의 배치를 먼저 등록
+        tasks = []
+        for job in sorted(jobs, key=lambda file_job: file_job.size):
+            pending_indices = job.pending_indices()
+            if pending_indices:
+                tasks.extend(loop.create_task(run_batch(job, index)) for index in pending_indices)
+            else:
+                tasks.append(loop.run_in_executor(blocking_executor, finalize_safely, job))
+
+        async def cancel_on_stop():
+            while True:
+                if self.stop_event.is_set():
+                    for task in tasks:
+                        task.cancel()
+                    return
+                await asyncio.sleep(self.STOP_POLL_INTERVAL)
+
+        watcher = loop.create_task(cancel_on_stop())
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            watcher.cancel()
+            blocking_executor.shutdown(wait=True)
+            self._blocking_executor = None
+
+    async def _translate_file_job_batch_async(self, job, index):
+        batch_to_translate = self._begin_file_job_batch(job, index)
+        try:
+            batch_start_time = time.time()
+            translated_batch_lines = await self._translate_batch_core_async(batch_to_translate)
+            self._end_file_job_batch(batch_to_translate, translated_batch_lines, batch_start_time)
+            return translated_batch_lines
+        finally:
+            self._set_current_file_stats(None)
+            self._set_current_file_for_log("")
+
+    async def _translate_batch_core_async(self, text_batch, temperature=None, retry=False):
+        """_translate_batch_core의 비동기 버전 (스킵/번역 메모리/중복 제거 계획은 공유)"""
+        # 번역 메모리(SQLite) 조회가 이벤트 루프를 막지 않도록 스레드에서 계획
+        plan_future = self._run_blocking(self._plan_batch_translation, text_batch)
+        try:
+            plan = await asyncio.shield(plan_future)
+        except asyncio.CancelledError:
+            # 계획은 스레드에서 끝까지 진행되므로, 맡게 된 반복 값은 끝난 뒤 실패로 넘겨 대기 배치가 멈추지 않게 함
+            plan_future.add_done_callback(lambda future: self._release_abandoned_plan(future, text_batch))
+            raise
+        if plan is None:
+            return text_batch
+
+        try:
+            if plan['indices']:
+                lines_to_translate = [text_batch[idx] for idx in plan['indices']]
+                translated_lines = await self._translate_batch_core_original_async(lines_to_translate, temperature, retry)
+                self._merge_planned_translation(plan, lines_to_translate, translated_lines)
+        finally:
+            # 취소되더라도 같은 값을 기다리는 다른 배치가 멈추지 않도록 결과 전달
+            if plan['owned_values']:
+                self._resolve_owned_values(plan['owned_values'], text_batch, plan['final_result'])
+
+        if plan['waiting_lines']:
+            shared_results = {}
+            for idx, (value, future) in plan['waiting_lines'].items():
+                # 공유 Future는 다른 작업도 기다리므로 취소가 전파되지 않게 보호
+                shared_results[idx] = await asyncio.shield(asyncio.wrap_future(future))
+            fallback_indices = self._apply_shared_translations(shared_results, text_batch, plan['final_result'])
+            if fallback_indices and not self.stop_event.is_set():
+                fallback_lines = [text_batch[idx] for idx in fallback_indices]
+                translated_lines = await self._translate_batch_core_original_async(fallback_lines, temperature, retry)
+                self._merge_translated_lines(fallback_indices, translated_lines, plan['final_result'])
+
+        return plan['final_result']
+
+    def _store_translation_memory(self, pairs):
+        """번역 메모리(SQLite) 저장은 이벤트 루프를 막지 않도록 블로킹 작업 스레드에 넘김"""
+        if not pairs or self._blocking_executor is None:
+            super()._store_translation_memory(pairs)
+            return
+        context = contextvars.copy_context()
+        self._blocking_executor.submit(context.run, super()._store_translation_memory, pairs)
+
+    def _release_abandoned_plan(self, plan_future, text_batch):
+        if plan_future.cancelled() or plan_future.exception() is not None:
+            return
+        plan = plan_future.result()
+        if plan is not None and plan['owned_values']:
+            self._resolve_owned_values(plan['owned_values'], text_batch, plan['final_result'])
+
+    async def _translate_batch_core_original_async(self, text_batch, temperature=None, retry=False):
+        """_translate_batch_core_original의 비동기 버전 - generate_content_async 사용"""
+        state = self._new_translation_state(temperature)
+        request_batch = self._mask_translation_batch(text_batch, state)
+        if not self._encode_request_payload(request_batch, state):
+            return text_batch
+
+        while state['retry_count'] <= state['max_retries']:
+            payload_lines = self._pending_payload_lines(state)
+            try:
+                final_prompt = self._build_translation_prompt(payload_lines, state['json_response'])
+            except KeyError as e:
+                self.log_callback("log_batch_unknown_error", self._get_current_file_for_log(),
+                                  f"Prompt formatting error (KeyError: {e}).")
+                return text_batch
+
+            try:
+                if self.stop_event.is_set():
+                    return text_batch
+
+                reserved_tokens = self._estimate_request_tokens(final_prompt, payload_lines)
+                if not await self._acquire_rate_limit_async(reserved_tokens):
+                    return text_batch
+
+                self._refresh_prompt_cache()
+                response = await self.model.generate_content_async(
+                    final_prompt,
+                    generation_config=self._build_generation_config(state['temperature'], payload_lines, state)
+                )
+                self._settle_rate_limit(response, reserved_tokens)
+                action, payload = self._interpret_translation_response(text_batch, response, state)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.stop_event.is_set():
+                    return text_batch
+                action, payload = self._interpret_translation_error(text_batch, e, state)
+
+            if action == 'done':
+                return payload
+            if action == 'split':
+                mid = len(text_batch) // 2
+                first_half = await self._translate_batch_core_original_async(text_batch[:mid], state['temperature'])
+                if self.stop_event.is_set():
+                    return text_batch
+                second_half = await self._translate_batch_core_original_async(text_batch[mid:], state['temperature'])
+                return first_half + second_half
+            if action == 'retry':
+                if payload:
+                    await asyncio.sleep(payload)
+                continue
+            if action == 'exhausted':
+                break
+            return self._salvaged_translation_result(text_batch, state)
+
+        self.log_callback("log_batch_max_retries_exceeded", self._get_current_file_for_log(), state['max_retries'])
+        return self._salvaged_translation_result(text_batch, state)
+
+    async def _acquire_rate_limit_async(self, reserved_tokens):
+        if self.rate_limiter is None:
+            return not self.stop_event.is_set()
+        return await self.rate_limiter.acquire_async(reserved_tokens, self.stop_event)
@@ -0,0 +1,114 @@
+# translator_project/translator_app/core/batch_builder.py
+import math
+import re
+
+# 문자 종류별 글자당 토큰 수 (Gemini 토크나이저 기준 근사치)
+_CJK_PATTERN = re.compile(r'[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF]')
+_HANGUL_PATTERN = re.compile(r'[\u1100-\u11FF\u3130-\u318F\uAC00-\uD7AF]')
+_NON_LATIN_PATTERN = re.compile(r'[\u0370-\u03FF\u0400-\u04FF\u0590-\u05FF\u0600-\u06FF\u0E00-\u0E7F]')
+_WHITESPACE_PATTERN = re.compile(r'\s')
+
+_CJK_TOKENS_PER_CHAR = 0.8
+_HANGUL_TOKENS_PER_CHAR = 0.7
+_NON_LATIN_TOKENS_PER_CHAR = 0.35
+_LATIN_TOKENS_PER_CHAR = 0.25
+
+# 영어 원문 대비 번역문 토큰 수 비율 (대상 언어별)
+TARGET_EXPANSION_RATIOS = {
+    'English': 1.0,
+    'Korean': 1.6,
+    'Japanese': 1.5,
+    'Simplified Chinese': 1.2,
+    'Traditional Chinese': 1.2,
+    'Russian': 1.5,
+    'French': 1.3,
+    'German': 1.3,
+    'Spanish': 1.3,
+    'Italian': 1.3,
+    'Portuguese': 1.3,
+    'Polish': 1.4,
+    'Turkish': 1.4,
+    'Arabic': 1.5,
+    'Hebrew': 1.5,
+    'Thai': 2.0,
+    'Vietnamese': 1.5,
+}
+DEFAULT_EXPANSION_RATIO = 1.4
+
+
+class TokenEstimator:
+    """라인별 입력/출력 토큰 수 추정기"""
+
+    def __init__(self, target_lang, extract_value):
+        self.expansion_ratio = TARGET_EXPANSION_RATIOS.get(target_lang, DEFAULT_EXPANSION_RATIO)
+        self._extract_value = extract_value
+
+    @staticmethod
+    def estimate_tokens(text):
+        """문자 종류(한중일/한글/기타 비라틴/라틴)별 비율로 토큰 수 추정"""
+        if not text:
+            return 0
+        cjk = len(_CJK_PATTERN.findall(text))
+        hangul = len(_HANGUL_PATTERN.findall(text))
+        non_latin = len(_NON_LATIN_PATTERN.findall(text))
+        whitespace = len(_WHITESPACE_PATTERN.findall(text))
+        latin = max(0, len(text) - cjk - hangul - non_latin - whitespace)
+        return int(math.ceil(cjk * _CJK_TOKENS_PER_CHAR + hangul * _HANGUL_TOKENS_PER_CHAR
+                             + non_latin * _NON_LATIN_TOKENS_PER_CHAR + latin * _LATIN_TOKENS_PER_CHAR)) + 1
+
+    def estimate_line(self, line):
+        """(입력 토큰, 예상 출력 토큰) 반환 - 키/따옴표는 그대로, 값만 대상 언어 비율로 늘어남"""
+        input_tokens = self.estimate_tokens(line)
+        value = self._extract_value(line)
+        if not value:
+            return input_tokens, input_tokens
+        value_tokens = self.estimate_tokens(value)
+        markup_tokens = max(0, input_tokens - value_tokens)
+        return input_tokens, markup_tokens + int(math.ceil(value_tokens * self.expansion_ratio))
+
+    def estimate_batch_output(self, lines):
+        return sum(self.estimate_line(line)[1] for line in lines)
+
+
+class BatchBuilder:
+    """고정 라인 수 대신 예상 출력 토큰 예산에 맞춰 배치를 구성"""
+
+    # 추정 오차를 감안한 출력 토큰 여유분
+    OUTPUT_SAFETY_FACTOR = 1.5
+    OUTPUT_OVERHEAD_TOKENS = 256
+    # 생각(thinking) 토큰도 max_output_tokens에 포함되는 모델용 여유분
+    THINKING_ALLOWANCE_TOKENS = 8192
+
+    def __init__(self, target_lang, token_budget, extract_value):
+        self.estimator = TokenEstimator(target_lang, extract_value)
+        self.token_budget = max(1, int(token_budget))
+
+    def build(self, lines, max_lines):
+        """출력 토큰 예산 또는 최대 라인 수에 도달하면 배치를 나눔 (예산보다 큰 한 줄은 단독 배치)"""
+        batches = []
+        current = []
+        current_tokens = 0
+        for line in lines:
+            _, output_tokens = self.estimator.estimate_line(line)
+            if current and (len(current) >= max_lines or current_tokens + output_tokens > self.token_budget):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(line)
+            current_tokens += output_tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def output_token_limit(self, lines, model_name, max_tokens):
+        """배치 요청의 max_output_tokens (모델 최대값 이하)"""
+        estimated = self.estimator.estimate_batch_output(lines)
+        limit = int(estimated * self.OUTPUT_SAFETY_FACTOR) + self.OUTPUT_OVERHEAD_TOKENS
+        if self.is_thinking_model(model_name):
+            limit += self.THINKING_ALLOWANCE_TOKENS
+        return max(1, min(max_tokens, limit))
+
+    @staticmethod
+    def is_thinking_model(model_name):
+        name = (model_name or "").lower()
+        return "2.5" in name or "thinking" in name
@@ -0,0 +1,126 @@
+# translator_project/translator_app/core/batch_payload.py
+import json
+import re
+
+from .yml_lexer import lex_line_cached
+
+# 응답 라인: 1: "번역된 값"
+VALUE_LINE_PATTERN = re.compile(r'^\s*(\d+)\s*:\s*"(.*)"\s*$')
+UNESCAPED_QUOTE_PATTERN = re.compile(r'(?<!\\)"')
+
+# JSON 응답 모드에서 프롬프트 끝에 붙이는 안내
+JSON_RESPONSE_INSTRUCTION = (
+    "\n\nReturn ONLY a JSON object that maps each id to its translated value, "
+    "e.g. {\"1\": \"translated text\"}. Keep every <number> token unchanged."
+)
+
+
+def build_response_schema(line_ids):
+    """id별 문자열을 모두 요구하는 응답 스키마"""
+    return {
+        'type': 'OBJECT',
+        'properties': {line_id: {'type': 'STRING'} for line_id in line_ids},
+        'required': list(line_ids)
+    }
+
+
+def split_yml_entry(line):
+    """YML 항목 라인을 (앞부분, 값, 뒷부분)으로 분리 - 항목이 아니면 None"""
+    record = lex_line_cached(line)
+    if not record.is_entry:
+        return None
+    return record.prefix, record.value, record.suffix
+
+
+class ValuesPayload:
+    """배치에서 값만 '<id>: "값"' 형식으로 보내고, 응답의 id로 원래 라인을 재구성
+
+    들여쓰기/키/버전/주석/빈 줄은 보내지 않으므로 응답에서 키가 사라질 수 없습니다.
+    """
+
+    def __init__(self, lines):
+        self.entries = {}  # id -> (라인 인덱스, 앞부분, 뒷부분)
+        self.lines = []
+        for index, line in enumerate(lines):
+            parts = split_yml_entry(line)
+            if parts is None or not parts[1].strip():
+                continue
+            line_id = str(len(self.entries) + 1)
+            self.entries[line_id] = (index, parts[0], parts[2])
+            self.lines.append(f'{line_id}: "{parts[1]}"')
+
+    def decode(self, response_text):
+        """응답에서 {id: 값} 추출 (알 수 없는 id는 무시, 같은 id는 처음 것만 사용)"""
+        values = {}
+        for response_line in response_text.split('\n'):
+            match = VALUE_LINE_PATTERN.match(response_line)
+            if match and match.group(1) in self.entries and match.group(1) not in values:
+                values[match.group(1)] = match.group(2)
+        return values
+
+    def decode_json(self, response_text):
+        """JSON 객체 응답에서 {id: 값} 추출 (문자열이 아닌 값과 알 수 없는 id는 무시)"""
+        start = response_text.find('{')
+        end = response_text.rfind('}')
+        if start < 0 or end < start:
+            return {}
+        try:
+            data = json.loads(response_text[start:end + 1])
+        except ValueError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        values = {}
+        for line_id, value in data.items():
+            line_id = str(line_id).strip()
+            if line_id in self.entries and isinstance(value, str):
+                # JSON 디코딩으로 풀린 따옴표/줄바꿈을 YML 값 형식으로 되돌림
+                values[line_id] = UNESCAPED_QUOTE_PATTERN.sub(r'\\"', value.replace('\n', '\\n'))
+        return values
+
+    def pending_lines(self, accepted):
+        """아직 결과를 받지 못한 id의 요청 라인"""
+        return [line for line_id, line in zip(self.entries, self.lines) if line_id not in accepted]
+
+    def rebuild_line(self, line_id, value):
+        _, prefix, suffix = self.entries[line_id]
+        return f'{prefix}"{value}"{suffix}'
+
+
+class RawLinesPayload(ValuesPayload):
+    """원본 라인(키 포함)을 그대로 보내고, 응답 라인은 키로 원래 라인에 맞춤
+
+    같은 키가 배치에 여러 번 나오면 등장 순서로 구분합니다. 주석/빈 줄은 보내지 않습니다.
+    """
+
+    def __init__(self, lines):
+        self.entries = {}
+        self.lines = []
+        seen_keys = {}
+        for index, line in enumerate(lines):
+            parts = split_yml_entry(line)
+            if parts is None or not parts[1].strip():
+                continue
+            line_id = self._line_id(parts[0], seen_keys)
+            self.entries[line_id] = (index, parts[0], parts[2])
+            self.lines.append(line.rstrip('\r\n'))
+
+    @staticmethod
+    def _line_id(prefix, seen_keys):
+        key = prefix.split(':', 1)[0].strip()
+        occurrence = seen_keys.get(key, 0)
+        seen_keys[key] = occurrence + 1
+        return key if occurrence == 0 else f"{key}#{occurrence}"
+
+    def decode(self, response_text):
+        values = {}
+        seen_keys = {}
+        for response_line in response_text.split('\n'):
+            parts = split_yml_entry(response_line)
+            if parts is None:
+                continue
+            line_id = self._line_id(parts[0], seen_keys)
+            if line_id in self.entries and line_id not in values:
+                values[line_id] = parts[1]
+        return values
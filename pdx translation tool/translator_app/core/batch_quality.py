@@ -0,0 +1,136 @@
+# translator_project/translator_app/core/batch_quality.py
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성 - 없으면 같은 계산을 순수 파이썬으로 수행
+    np = None
+
+from .language_profiles import get_language_profile
+from .placeholder_masker import PLACEHOLDER_PATTERN
+
+# 감점 기준 (길이 비율이 범위를 벗어나면 감점)
+SEVERE_LENGTH_RATIO = (0.3, 3.0)
+MILD_LENGTH_RATIO = (0.5, 2.0)
+SEVERE_LENGTH_PENALTY = 25
+MILD_LENGTH_PENALTY = 15
+CODE_PENALTY = 30
+REMNANT_PENALTY = 40
+TOO_SHORT_PENALTY = 30
+UNCHANGED_PENALTY = 20
+
+
+class LineQuality:
+    """번역 라인 하나의 품질 검사 결과 (통계, 미리보기, 재요청 판단에 같은 결과를 사용)"""
+
+    __slots__ = ('score', 'length_ratio', 'codes_preserved', 'colors_balanced', 'has_remnants')
+
+    def __init__(self, score, length_ratio, codes_preserved, colors_balanced, has_remnants):
+        self.score = score
+        self.length_ratio = length_ratio
+        self.codes_preserved = codes_preserved
+        self.colors_balanced = colors_balanced
+        self.has_remnants = has_remnants
+
+
+def placeholder_multiset(value):
+    """값에 있는 게임 코드의 다중집합"""
+    return Counter(match.group(0) for match in PLACEHOLDER_PATTERN.finditer(value))
+
+
+def colors_balanced(value):
+    """§색상 ... §! 쌍이 스택 순서대로 열리고 닫히는지"""
+    depth = 0
+    position = value.find('§')
+    while position >= 0:
+        marker = value[position + 1:position + 2]
+        if marker == '!':
+            if depth == 0:
+                return False
+            depth -= 1
+        elif marker:
+            depth += 1
+        position = value.find('§', position + 2)
+    return depth == 0
+
+
+def _length_penalties(originals, translations):
+    """(길이 비율 목록, 길이 감점 목록) - 원문이 비었으면 비율은 None"""
+    if np is not None and originals:
+        original_lengths = np.fromiter((len(value) for value in originals), dtype=np.float64, count=len(originals))
+        translated_lengths = np.fromiter((len(value) for value in translations), dtype=np.float64,
+                                         count=len(translations))
+        has_original = original_lengths > 0
+        ratios = np.divide(translated_lengths, original_lengths, out=np.ones_like(original_lengths),
+                           where=has_original)
+        severe = (ratios < SEVERE_LENGTH_RATIO[0]) | (ratios > SEVERE_LENGTH_RATIO[1])
+        mild = (ratios < MILD_LENGTH_RATIO[0]) | (ratios > MILD_LENGTH_RATIO[1])
+        penalties = np.where(severe, SEVERE_LENGTH_PENALTY, np.where(mild, MILD_LENGTH_PENALTY, 0))
+        return ([float(ratio) if present else None for ratio, present in zip(ratios, has_original)],
+                penalties.tolist())
+
+    ratios = []
+    penalties = []
+    for original, translated in zip(originals, translations):
+        if not original:
+            ratios.append(None)
+            penalties.append(0)
+            continue
+        ratio = len(translated) / len(original)
+        ratios.append(ratio)
+        if ratio < SEVERE_LENGTH_RATIO[0] or ratio > SEVERE_LENGTH_RATIO[1]:
+            penalties.append(SEVERE_LENGTH_PENALTY)
+        elif ratio < MILD_LENGTH_RATIO[0] or ratio > MILD_LENGTH_RATIO[1]:
+            penalties.append(MILD_LENGTH_PENALTY)
+        else:
+            penalties.append(0)
+    return ratios, penalties
+
+
+class BatchQualityChecker:
+    """배치 전체의 (원문 값, 번역 값) 쌍을 한 번에 검사해 라인별 LineQuality 반환
+
+    길이 비율은 배열로 한 번에 계산하고(NumPy가 있으면 벡터 연산), 원문의 게임 코드 다중집합과
+    색상 코드 균형은 원문마다 한 번만 구합니다. 원본 언어 잔존 검사는 언어쌍이 다를 때만 합니다.
+    """
+
+    def __init__(self, source_lang, target_lang):
+        self.source_profile = get_language_profile(source_lang)
+        self.check_remnants = source_lang != target_lang
+
+    def assess(self, originals, translations):
+        ratios, length_penalties = _length_penalties(originals, translations)
+        source_codes = {}
+        results = []
+        for original, translated, ratio, length_penalty in zip(originals, translations, ratios, length_penalties):
+            score = 100 - length_penalty
+
+            # 게임 코드 보존 - 코드 다중집합이 같고, 원문에서 맞던 색상 코드 쌍이 깨지지 않아야 함
+            original_info = source_codes.get(original)
+            if original_info is None:
+                original_info = (placeholder_multiset(original), colors_balanced(original))
+                source_codes[original] = original_info
+            translated_balanced = colors_balanced(translated)
+            codes_preserved = placeholder_multiset(translated) == original_info[0] and \
+                (translated_balanced or not original_info[1])
+            if not codes_preserved:
+                score -= CODE_PENALTY
+
+            has_remnants = self.check_remnants and self.source_profile.has_remnants(translated, original)
+            if has_remnants:
+                score -= REMNANT_PENALTY
+
+            # 번역 완전성 - 빈 번역이나 너무 짧은 번역
+            stripped_original = original.strip()
+            stripped_translated = translated.strip()
+            if not stripped_translated:
+                score = 0
+            elif len(stripped_translated) < 2 and len(stripped_original) > 5:
+                score -= TOO_SHORT_PENALTY
+
+            # 동일한 텍스트인 경우 (번역되지 않음)
+            if stripped_original == stripped_translated and len(stripped_original) > 3:
+                score -= UNCHANGED_PENALTY
+
+            results.append(LineQuality(max(0, score), ratio, codes_preserved, translated_balanced, has_remnants))
+        return results
@@ -0,0 +1,146 @@
+# translator_project/translator_app/core/batch_scheduler.py
+import itertools
+import os
+import queue
+import threading
+
+
+class FileJob:
+    """한 파일의 배치 작업 묶음 - 배치 결과를 원래 순서대로 모아 파일을 재조립"""
+
+    def __init__(self, input_file, output_file, header_lines, batches, batch_offsets, total_lines):
+        self.input_file = input_file
+        self.display_name = os.path.basename(input_file)
+        self.output_file = output_file
+        self.header_lines = header_lines      # 번역하지 않는 앞부분 (언어 식별자)
+        self.batches = batches
+        self.batch_offsets = batch_offsets    # 각 배치 첫 줄의 파일 내 위치 (로그/번역 기록용)
+        self.total_lines = total_lines
+        self.results = [None] * len(batches)
+        self.stats = {}
+        self.failed = False
+        self.lock = threading.Lock()
+        self._remaining = len(batches)
+        self._contiguous = 0
+
+    @property
+    def size(self):
+        return sum(len(batch) for batch in self.batches)
+
+    def set_result(self, index, translated_lines):
+        """배치 결과 저장 후 (마지막 배치 여부, 앞에서부터 연속으로 완료된 배치 수) 반환"""
+        with self.lock:
+            self.results[index] = translated_lines
+            self._remaining -= 1
+            while self._contiguous < len(self.results) and self.results[self._contiguous] is not None:
+                self._contiguous += 1
+            return self._remaining == 0, self._contiguous
+
+    def pending_indices(self):
+        """아직 결과가 없는 배치 번호 (번역 기록으로 복원한 배치 제외)"""
+        with self.lock:
+            return [index for index, result in enumerate(self.results) if result is None]
+
+    def assembled_lines(self):
+        lines = list(self.header_lines)
+        for translated_lines in self.results:
+            lines.extend(translated_lines or [])
+        return lines
+
+
+class BatchScheduler:
+    """모든 파일의 배치를 고정된 수의 워커로 처리하는 전역 스케줄러
+
+    작은 파일이 큰 파일 뒤에서 기다리지 않도록 (파일 크기, 제출 순서, 배치 순서) 우선순위로 꺼냅니다.
+    파일의 마지막 배치를 끝낸 워커가 해당 파일의 마무리(저장/검증)를 수행합니다.
+    """
+
+    _STOP = object()
+
+    def __init__(self, max_workers, stop_event, process_batch, finalize_job, on_batch_done=None, on_error=None):
+        self.max_workers = max(1, int(max_workers))
+        self.stop_event = stop_event
+        self._process_batch = process_batch    # (job, index) -> 번역된 줄 목록
+        self._finalize_job = finalize_job      # (job) -> None
+        self._on_batch_done = on_batch_done    # (job, index, 번역된 줄 목록) -> None (완료 표시 전에 호출)
+        self._on_error = on_error              # (job, exception) -> None
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._threads = []
+        self._pending = 0
+        self._idle = threading.Condition()
+
+    def start(self):
+        for index in range(self.max_workers):
+            thread = threading.Thread(target=self._worker, name=f"batch-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, job):
+        """파일 작업의 남은 배치를 큐에 등록 (남은 배치가 없으면 마무리만 등록)"""
+        priority = job.size
+        sequence = next(self._sequence)
+        indices = job.pending_indices() or [None]
+        with self._idle:
+            self._pending += len(indices)
+        for index in indices:
+            self._queue.put((priority, sequence, -1 if index is None else index, job))
+
+    def wait(self):
+        """등록된 모든 배치가 끝날 때까지 대기 후 워커 종료"""
+        with self._idle:
+            while self._pending > 0:
+                self._idle.wait(0.5)
+        for _ in self._threads:
+            self._queue.put((float('inf'), next(self._sequence), 0, self._STOP))
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _worker(self):
+        while True:
+            _, _, index, job = self._queue.get()
+            if job is self._STOP:
+                return
+            try:
+                self._run_item(job, index)
+            finally:
+                with self._idle:
+                    self._pending -= 1
+                    if self._pending == 0:
+                        self._idle.notify_all()
+
+    def _run_item(self, job, index):
+        if index < 0:
+            if not self.stop_event.is_set():
+                self._finalize(job)
+            return
+
+        # 중지되었거나 같은 파일의 다른 배치가 실패하면 남은 배치는 건너뜀 (큐만 비움)
+        if self.stop_event.is_set() or job.failed:
+            job.failed = True
+            job.set_result(index, [])
+            return
+
+        try:
+            translated_lines = self._process_batch(job, index)
+        except Exception as e:
+            job.failed = True
+            job.set_result(index, [])
+            if self._on_error:
+                self._on_error(job, e)
+            return
+
+        # 기록을 먼저 하고 완료로 표시 - 마지막 배치의 마무리(번역 기록 삭제)가 다른 배치의 기록보다 늦게 오도록
+        if self._on_batch_done and not job.failed:
+            self._on_batch_done(job, index, translated_lines)
+        is_last, _ = job.set_result(index, translated_lines)
+        if is_last and not job.failed and not self.stop_event.is_set():
+            self._finalize(job)
+
+    def _finalize(self, job):
+        try:
+            self._finalize_job(job)
+        except Exception as e:
+            if self._on_error:
+                self._on_error(job, e)
@@ -1 +1,3 @@
-CONFIG_FILE = "translation_gui_config.json"
\ No newline at end of file
+CONFIG_FILE = "translation_gui_config.json"
+TRANSLATION_MEMORY_FILE = "translation_memory.db"
+GLOSSARY_CACHE_DIR = "glossary_cache"
\ No newline at end of file
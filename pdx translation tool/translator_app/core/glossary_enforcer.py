@@ -0,0 +1,74 @@
+# translator_project/translator_app/core/glossary_enforcer.py
+import re
+
+from .glossary_index import needs_word_boundary
+from .placeholder_masker import PLACEHOLDER_PATTERN
+
+
+class GlossaryEnforcer:
+    """번역 결과가 용어집을 따르는지 검사하고, 간단한 경우는 로컬에서 바로 고침
+
+    원문 값에 나오는 용어(게임 코드 안은 제외)의 번역어가 번역 값에 있어야 준수로 봅니다.
+    번역 값에 원문 용어가 그대로 남아 있으면 번역어로 치환하고, 그래도 빠진 용어가 있으면
+    해당 라인만 다시 요청하도록 알려줍니다.
+    """
+
+    def __init__(self, glossary_index):
+        self.glossary_index = glossary_index
+        self._term_patterns = {}
+
+    def required_entries(self, source_value):
+        """원문 값에 나오는 용어집 항목 (게임 코드 안의 일치는 무시)"""
+        if not source_value:
+            return []
+        return self.glossary_index.find_entries(PLACEHOLDER_PATTERN.sub(" ", source_value))
+
+    def enforce(self, source_value, translated_value, required=None):
+        """(고친 번역 값, 로컬에서 고친 용어 수, 여전히 빠진 항목 목록) 반환 - 검사할 용어가 없으면 (값, 0, [])"""
+        if required is None:
+            required = self.required_entries(source_value)
+        if not required or translated_value is None:
+            return translated_value, 0, []
+
+        fixed_count = 0
+        missing = []
+        for term, translation in required:
+            if self._contains(translated_value, translation):
+                continue
+            replaced_value = self._replace_term(translated_value, term, translation)
+            if replaced_value is not None:
+                translated_value = replaced_value
+                fixed_count += 1
+            else:
+                missing.append((term, translation))
+        return translated_value, fixed_count, missing
+
+    @staticmethod
+    def _contains(value, translation):
+        return translation.casefold() in value.casefold()
+
+    def _replace_term(self, value, term, translation):
+        """게임 코드 밖에서 단어 단위로 남아 있는 원문 용어를 번역어로 치환 - 없으면 None"""
+        pattern = self._term_patterns.get(term)
+        if pattern is None:
+            pattern = re.compile(re.escape(term), re.IGNORECASE)
+            self._term_patterns[term] = pattern
+
+        protected_spans = [match.span() for match in PLACEHOLDER_PATTERN.finditer(value)]
+        parts = []
+        last_end = 0
+        for match in pattern.finditer(value):
+            start, end = match.span()
+            if any(start < span_end and span_start < end for span_start, span_end in protected_spans):
+                continue
+            if start > 0 and needs_word_boundary(value[start]) and needs_word_boundary(value[start - 1]):
+                continue
+            if end < len(value) and needs_word_boundary(value[end - 1]) and needs_word_boundary(value[end]):
+                continue
+            parts.append(value[last_end:start])
+            parts.append(translation)
+            last_end = end
+        if not parts:
+            return None
+        parts.append(value[last_end:])
+        return "".join(parts)
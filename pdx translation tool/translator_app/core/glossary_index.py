@@ -0,0 +1,90 @@
+# translator_project/translator_app/core/glossary_index.py
+from collections import deque
+
+GLOSSARY_HEADER = "Please refer to the following glossary for translation. Ensure these terms are translated as specified:\n"
+
+
+def format_glossary_section(entries):
+    """(용어, 번역) 목록을 프롬프트의 용어집 섹션으로 변환"""
+    if not entries:
+        return ""
+    lines = [f"- \"{term}\" should be translated as \"{translation}\"" for term, translation in entries]
+    return GLOSSARY_HEADER + "\n".join(lines) + "\n\n"
+
+
+def needs_word_boundary(char):
+    # 띄어쓰기로 단어를 나누는 문자(라틴/키릴 등)만 단어 경계 검사 - 한중일 문자는 붙여 써도 일치
+    return char.isalnum() and ord(char) < 0x2E80
+
+
+class GlossaryIndex:
+    """원문 용어 전체로 만든 Aho-Corasick 오토마톤 - 텍스트에 실제로 나오는 용어만 찾음
+
+    대소문자를 구분하지 않으며, 라틴 문자로 시작/끝나는 용어는 단어 중간에서 일치하지 않습니다
+    (예: "Art"는 "Party"에서 찾지 않음).
+    """
+
+    def __init__(self, entries):
+        self.entries = [(term, translation) for term, translation in entries if term and translation]
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for entry_index, (term, _) in enumerate(self.entries):
+            self._add_term(term.lower(), entry_index)
+        self._build_failure_links()
+
+    def _add_term(self, term, entry_index):
+        state = 0
+        for char in term:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(entry_index)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_entries(self, text):
+        """텍스트에 나오는 용어의 (용어, 번역) 목록 (처음 나온 순서, 중복 없음)"""
+        if not self.entries or not text:
+            return []
+        lowered = text.lower()
+        found = []
+        seen = set()
+        state = 0
+        for position, char in enumerate(lowered):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for entry_index in self._output[state]:
+                if entry_index in seen:
+                    continue
+                term_length = len(self.entries[entry_index][0])
+                start = position - term_length + 1
+                if self._is_whole_word(lowered, start, position):
+                    seen.add(entry_index)
+                    found.append(self.entries[entry_index])
+        return found
+
+    @staticmethod
+    def _is_whole_word(text, start, end):
+        if start > 0 and needs_word_boundary(text[start]) and needs_word_boundary(text[start - 1]):
+            return False
+        if end + 1 < len(text) and needs_word_boundary(text[end]) and needs_word_boundary(text[end + 1]):
+            return False
+        return True
@@ -0,0 +1,214 @@
+# translator_project/translator_app/core/glossary_store.py
+import bisect
+import hashlib
+import json
+import os
+import threading
+import zlib
+
+from .config import GLOSSARY_CACHE_DIR
+
+# 캐시 형식이 바뀌면 올려서 이전 캐시를 무시
+CACHE_FORMAT_VERSION = 3
+
+
+def normalize_term(term):
+    """비교용 용어 (대소문자 무시, 연속 공백 하나로)"""
+    return " ".join(term.casefold().split())
+
+
+def parse_glossary_text(text):
+    """'용어: 번역' 라인 파싱 - (항목 목록, 비어 있지 않은 라인 수)"""
+    entries = []
+    line_count = 0
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        line_count += 1
+        if ':' in line:
+            term, translation = line.split(':', 1)
+            term, translation = term.strip(), translation.strip()
+            if term and translation:
+                entries.append((term, translation))
+    return entries, line_count
+
+
+def find_conflicts(entries):
+    """같은 용어(정규화 기준)에 번역이 여러 개인 항목 - [(용어, [번역...])]"""
+    translations_by_term = {}
+    first_terms = {}
+    for term, translation in entries:
+        normalized = normalize_term(term)
+        first_terms.setdefault(normalized, term)
+        translations = translations_by_term.setdefault(normalized, [])
+        if translation not in translations:
+            translations.append(translation)
+    return [(first_terms[normalized], translations)
+            for normalized, translations in translations_by_term.items() if len(translations) > 1]
+
+
+class CompiledGlossary:
+    """파싱이 끝난 용어집 파일 하나 (용어 표, 정규화된 용어, 충돌 목록, 접두사 조회용 정렬 색인)"""
+
+    def __init__(self, entries, line_count=0, content_hash=None, error_key=None, error_detail=None, index=None):
+        self.entries = entries
+        self.line_count = line_count
+        self.content_hash = content_hash
+        self.error_key = error_key
+        self.error_detail = error_detail
+        if not error_key:
+            if not line_count:
+                self.error_key = "glossary_error_empty"
+            elif not entries:
+                self.error_key = "glossary_error_no_valid"
+        # 디스크 캐시에서 불러올 때는 저장된 색인(index)을 그대로 사용
+        if index is None:
+            normalized_terms = [normalize_term(term) for term, _ in entries]
+            index = {
+                'normalized': normalized_terms,
+                'order': sorted(range(len(entries)), key=normalized_terms.__getitem__),
+                'conflicts': find_conflicts(entries)
+            }
+        self.normalized = index['normalized']
+        self.conflicts = index['conflicts']
+        self._order = index['order']
+        self._sorted_terms = [self.normalized[entry_index] for entry_index in self._order]
+
+    @property
+    def entry_count(self):
+        return len(self.entries)
+
+    def lookup_prefix(self, prefix, limit=20):
+        """정규화된 용어가 prefix로 시작하는 (용어, 번역) 목록 (용어 순, 정렬 색인에서 이진 탐색)"""
+        prefix = normalize_term(prefix)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        results = []
+        for position in range(start, len(self._sorted_terms)):
+            if len(results) >= limit or not self._sorted_terms[position].startswith(prefix):
+                break
+            results.append(self.entries[self._order[position]])
+        return results
+
+    def to_bytes(self, stat_key):
+        """디스크 캐시 내용 (zlib로 압축한 JSON)"""
+        data = {
+            'version': CACHE_FORMAT_VERSION,
+            'stat': list(stat_key),
+            'hash': self.content_hash,
+            'line_count': self.line_count,
+            'entries': self.entries,
+            'normalized': self.normalized,
+            'order': self._order,
+            'conflicts': self.conflicts
+        }
+        return zlib.compress(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    @classmethod
+    def from_bytes(cls, raw):
+        """(CompiledGlossary, 파일 상태) 반환 - 형식이 맞지 않으면 ValueError"""
+        data = json.loads(zlib.decompress(raw).decode('utf-8'))
+        if data.get('version') != CACHE_FORMAT_VERSION:
+            raise ValueError("glossary cache version mismatch")
+        entries = [(term, translation) for term, translation in data['entries']]
+        index = {
+            'normalized': data['normalized'],
+            'order': data['order'],
+            'conflicts': [(term, translations) for term, translations in data['conflicts']]
+        }
+        return cls(entries, data['line_count'], data['hash'], index=index), tuple(data['stat'])
+
+
+class GlossaryStore:
+    """용어집 파일을 한 번만 파싱해 재사용하는 저장소
+
+    메모리 캐시는 (수정 시각, 크기)가 같으면 그대로 쓰고, 디스크 캐시(zlib로 압축한 JSON)는 프로그램을
+    다시 시작해도 재사용합니다. 수정 시각만 바뀌고 내용 해시가 같으면 다시 파싱하지 않습니다.
+    """
+
+    def __init__(self, cache_dir=GLOSSARY_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._compiled = {}  # 경로 -> ((mtime_ns, size), CompiledGlossary)
+        self.parse_count = 0
+
+    def get(self, path):
+        """용어집 파일의 CompiledGlossary (파일이 없거나 읽기 실패 시 error_key 설정)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return CompiledGlossary([], error_key="glossary_error_not_found")
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._compiled.get(path)
+        if cached and cached[0] == stat_key:
+            return cached[1]
+
+        disk_cached = self._load_disk_cache(path)
+        if disk_cached and disk_cached[1] == stat_key:
+            compiled = disk_cached[0]
+        else:
+            try:
+                with open(path, 'rb') as f:
+                    raw = f.read()
+                content_hash = hashlib.sha1(raw).hexdigest()
+                if disk_cached and disk_cached[0].content_hash == content_hash:
+                    compiled = disk_cached[0]
+                else:
+                    entries, line_count = parse_glossary_text(raw.decode('utf-8-sig'))
+                    compiled = CompiledGlossary(entries, line_count, content_hash)
+                    self.parse_count += 1
+            except (OSError, UnicodeDecodeError) as e:
+                return CompiledGlossary([], error_key="glossary_item_error", error_detail=str(e))
+            self._save_disk_cache(path, compiled, stat_key)
+
+        with self._lock:
+            self._compiled[path] = (stat_key, compiled)
+        return compiled
+
+    def combine(self, paths):
+        """여러 파일의 유효한 항목을 순서대로 합친 목록과 파일 간 충돌 목록"""
+        entries = []
+        for path in paths:
+            compiled = self.get(path)
+            if not compiled.error_key:
+                entries.extend(compiled.entries)
+        return entries, find_conflicts(entries)
+
+    def lookup_prefix(self, paths, prefix, limit=20):
+        """여러 파일에서 prefix로 시작하는 용어의 (용어, 번역) 목록 - 앞 파일 우선, 같은 항목은 한 번만"""
+        results = []
+        for path in paths:
+            compiled = self.get(path)
+            if compiled.error_key:
+                continue
+            for entry in compiled.lookup_prefix(prefix, limit):
+                if entry not in results:
+                    results.append(entry)
+            if len(results) >= limit:
+                break
+        return results[:limit]
+
+    def _cache_path(self, path):
+        key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + ".json.z")
+
+    def _load_disk_cache(self, path):
+        try:
+            with open(self._cache_path(path), 'rb') as f:
+                return CompiledGlossary.from_bytes(f.read())
+        except (OSError, ValueError, KeyError, TypeError, zlib.error):
+            return None
+
+    def _save_disk_cache(self, path, compiled, stat_key):
+        cache_path = self._cache_path(path)
+        temp_path = cache_path + ".tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(compiled.to_bytes(stat_key))
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # 캐시는 최적화일 뿐이므로 저장 실패는 무시
+            pass
@@ -0,0 +1,132 @@
+# translator_project/translator_app/core/language_profiles.py
+import re
+
+# 언어 감지 전에 지우는 게임 코드 ($변수$, [스코프], §색상, £아이콘£, <태그>, {변수}, %변수%, #색상)
+DETECTION_CODE_PATTERN = re.compile(
+    r'\$[^$]*\$|\[[^\]]*\]|§[A-Za-z0-9]|£[^£]*£|<[^>]*>|\{[^}]*\}|%[^%]*%|#[A-Fa-f0-9]{6}')
+# 원본 언어 잔존 검사 전에 지우는 게임 코드
+REMNANT_CODE_PATTERN = re.compile(r'\$[^$]+\$|\[[^\]]+\]|§[A-Z]|£[^£]+£|<[^>]+>|\{[^}]+\}')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# 3개 이상 이어진 라틴 문자 단어
+LATIN_PHRASE_PATTERN = r'\b[a-zA-Z]+(?:\s+[a-zA-Z]+){2,}\b'
+
+# 영어로 보지 않는 문자 (한글, 가나, 한자, 키릴)
+NON_LATIN_SCRIPTS = r'[\uAC00-\uD7AF\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF\u0400-\u04FF]'
+
+GAME_ALLOWED_WORDS = {'ok', 'id', 'max', 'min', 'fps', 'dps', 'pvp', 'pve', 'dlc', 'mod'}
+BASIC_ALLOWED_WORDS = {'ok', 'id', 'max', 'min'}
+
+# 언어명 -> (감지 패턴, 단어 패턴, 허용 단어) - 감지 패턴이 None이면 감지하지 않음
+_PROFILE_DEFINITIONS = {
+    'English': (r'\b[a-zA-Z]{2,}\b', r'\b[a-zA-Z]{3,}\b',
+                {'ok', 'yes', 'no', 'id', 'hp', 'mp', 'exp', 'lv', 'level', 'max', 'min', 'fps', 'ui', 'ai', 'cpu',
+                 'gpu', 'ram', 'dps', 'aoe', 'rpg', 'mmo', 'pvp', 'pve', 'dlc', 'mod', 'beta', 'alpha'}),
+    'Korean': (r'[\uAC00-\uD7AF]', r'[\uAC00-\uD7AF]+', set()),
+    'Japanese': (r'[\u3040-\u309F\u30A0-\u30FF]', r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+', set()),
+    'Simplified Chinese': (r'[\u4E00-\u9FFF]', r'[\u4E00-\u9FFF]+', set()),
+    'Traditional Chinese': (r'[\u4E00-\u9FFF]', r'[\u4E00-\u9FFF]+', set()),
+    'Russian': (r'[\u0400-\u04FF]', r'[\u0400-\u04FF]+', BASIC_ALLOWED_WORDS),
+    'French': (r'[àâäçèéêëîïôùûüÿœæ]',
+               r'\b[a-zA-Z\u00C0-\u017FàâäçèéêëîïôùûüÿœæÀÂÄÇÈÉÊËÎÏÔÙÛÜŸŒÆ]{3,}\b', GAME_ALLOWED_WORDS),
+    'German': (r'[äöüßÄÖÜ]', r'\b[a-zA-Z\u00C0-\u017FäöüßÄÖÜ]{3,}\b', GAME_ALLOWED_WORDS),
+    'Spanish': (r'[áéíóúñ¿¡]', r'\b[a-zA-Z\u00C0-\u017FáéíóúñÁÉÍÓÚÑüÜ]{3,}\b', GAME_ALLOWED_WORDS),
+    'Italian': (r'[àèéìíîòóùú]', r'\b[a-zA-Z\u00C0-\u017FàèéìíîòóùúÀÈÉÌÍÎÒÓÙÚ]{3,}\b', GAME_ALLOWED_WORDS),
+    'Portuguese': (r'[àáâãçéêíóôõúü]', r'\b[a-zA-Z\u00C0-\u017FàáâãçéêíóôõúüÀÁÂÃÇÉÊÍÓÔÕÚÜ]{3,}\b',
+                   GAME_ALLOWED_WORDS),
+    'Polish': (r'[ąćęłńóśźż]', r'\b[a-zA-Z\u0100-\u017FąćęłńóśźżĄĆĘŁŃÓŚŹŻ]{3,}\b', GAME_ALLOWED_WORDS),
+    'Turkish': (r'[çğıöşü]', r'\b[a-zA-ZçğıöşüÇĞIİÖŞÜ]{3,}\b', BASIC_ALLOWED_WORDS),
+    'Arabic': (r'[\u0600-\u06FF]', r'[\u0600-\u06FF]+', set()),
+    'Hebrew': (None, r'[\u0590-\u05FF]+', set()),
+    'Thai': (r'[\u0E00-\u0E7F]', r'[\u0E00-\u0E7F]+', set()),
+    'Vietnamese': (r'[àáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]',
+                   r'\b[a-zA-Zàáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ'
+                   r'ÀÁẠẢÃÂẦẤẬẨẪĂẰẮẶẲẴÈÉẸẺẼÊỀẾỆỂỄÌÍỊỈĨÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠÙÚỤỦŨƯỪỨỰỬỮỲÝỴỶỸĐ]{2,}\b',
+                   BASIC_ALLOWED_WORDS),
+}
+# 구문 잔존 검사에서 공백 없이 이어지는 단어 패턴을 그대로 쓰는 언어
+_SCRIPT_PHRASE_LANGUAGES = {'Korean', 'Japanese', 'Simplified Chinese'}
+
+
+class LanguageProfile:
+    """언어 하나의 미리 컴파일된 감지/단어/구문 패턴과 허용 단어"""
+
+    __slots__ = ('name', 'detect_pattern', 'excluded_pattern', 'word_pattern', 'phrase_pattern', 'allowed_words')
+
+    def __init__(self, name, detect_pattern, word_pattern, allowed_words):
+        self.name = name
+        self.detect_pattern = re.compile(detect_pattern, re.IGNORECASE) if detect_pattern else None
+        # 영어는 다른 문자 체계가 섞여 있으면 영어로 보지 않음
+        self.excluded_pattern = re.compile(NON_LATIN_SCRIPTS) if name == 'English' else None
+        self.word_pattern = re.compile(word_pattern, re.IGNORECASE)
+        self.phrase_pattern = self.word_pattern if name in _SCRIPT_PHRASE_LANGUAGES else \
+            re.compile(LATIN_PHRASE_PATTERN, re.IGNORECASE)
+        self.allowed_words = frozenset(allowed_words)
+
+    def is_present(self, cleaned_text):
+        """정리된 텍스트에 이 언어가 쓰였는지"""
+        if self.detect_pattern is None:
+            return False
+        if self.excluded_pattern is not None and self.excluded_pattern.search(cleaned_text):
+            return False
+        return self.detect_pattern.search(cleaned_text) is not None
+
+    def has_remnants(self, translated_value, original_value):
+        """번역 결과에 이 언어(원본 언어)의 단어나 긴 구문이 그대로 남아 있는지"""
+        cleaned_translated = REMNANT_CODE_PATTERN.sub('', translated_value)
+        cleaned_original = REMNANT_CODE_PATTERN.sub('', original_value)
+
+        original_words = {word.lower() for word in self.word_pattern.findall(cleaned_original)}
+        if original_words:
+            translated_words = {word.lower() for word in self.word_pattern.findall(cleaned_translated)}
+            common_words = (translated_words & original_words) - self.allowed_words
+            # 원본 단어의 30% 이상이 남아있으면 번역 실패로 간주
+            if len(common_words) > len(original_words) * 0.3:
+                return True
+
+        # 10글자 이상의 긴 구문이 그대로 남아 있는지 확인
+        lowered_translated = None
+        for phrase in self.phrase_pattern.findall(cleaned_original):
+            if len(phrase) > 10:
+                if lowered_translated is None:
+                    lowered_translated = cleaned_translated.lower()
+                if phrase.lower() in lowered_translated:
+                    return True
+        return False
+
+
+def clean_text_for_detection(text):
+    """언어 감지를 위해 게임 코드를 지우고 공백 정리"""
+    return WHITESPACE_PATTERN.sub(' ', DETECTION_CODE_PATTERN.sub('', text)).strip()
+
+
+def _build_profiles():
+    return {name: LanguageProfile(name, *definition) for name, definition in _PROFILE_DEFINITIONS.items()}
+
+
+_PROFILES = _build_profiles()
+
+
+def get_language_profile(name):
+    """언어명의 프로필 - 등록되지 않은 언어는 감지하지 않고 영어 단어 패턴으로 잔존 검사"""
+    profile = _PROFILES.get(name)
+    if profile is None:
+        profile = LanguageProfile(name, None, _PROFILE_DEFINITIONS['English'][1], set())
+        _PROFILES.setdefault(name, profile)
+    return profile
+
+
+def classify_translated(values, source_lang, target_lang):
+    """값 목록을 한 번에 훑어 값별로 이미 대상 언어로 번역됐는지 반환 (값이 비었으면 None)
+
+    대상 언어가 쓰였고 원본 언어는 쓰이지 않은 값만 번역된 것으로 봅니다.
+    """
+    source_profile = get_language_profile(source_lang)
+    target_profile = get_language_profile(target_lang)
+    results = []
+    for value in values:
+        if not value or not value.strip():
+            results.append(None)
+            continue
+        cleaned = clean_text_for_detection(value)
+        results.append(bool(cleaned) and target_profile.is_present(cleaned) and not source_profile.is_present(cleaned))
+    return results
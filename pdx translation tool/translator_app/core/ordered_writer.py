@@ -0,0 +1,97 @@
+# translator_project/translator_app/core/ordered_writer.py
+import codecs
+import os
+import threading
+from collections import deque
+
+
+class OrderedFileWriter:
+    """배치 결과를 끝난 순서와 관계없이 받아, 앞 배치가 모두 끝난 부분부터 임시 파일(.part)에 바로 기록
+
+    증분 번역의 줄 배치(line_layout)가 있으면 재사용 라인 사이에 번역 라인을 끼워 넣습니다.
+    finish()는 남은 부분만 기록하고 출력 파일로 교체하므로 전체를 다시 읽거나 합치지 않습니다.
+    기록한 라인은 lines에 남겨 두어 누락 검증을 파일을 다시 읽지 않고 메모리에서 합니다.
+    """
+
+    def __init__(self, output_file, header_lines, line_layout=None):
+        self.output_file = output_file
+        self.part_file = output_file + ".part"
+        self.line_count = 0
+        self.lines = []
+        self.finished = False
+        self._lock = threading.Lock()
+        self._unwritten = list(header_lines)
+        self._layout = line_layout
+        self._layout_position = 0
+        self._ready = {}           # 앞 배치를 기다리는 결과
+        self._next_index = 0
+        self._translated = deque()  # 순서가 확정됐지만 아직 줄 배치에 넣지 않은 번역 라인
+        self._started = False
+
+    def add(self, index, translated_lines):
+        """배치 결과 추가 - 앞 배치가 모두 끝났으면 이어지는 부분을 바로 기록"""
+        with self._lock:
+            if self.finished:
+                return
+            self._ready[index] = translated_lines
+            self._drain_ready()
+            self._write_unwritten()
+
+    def finish(self, results):
+        """남은 라인을 기록하고 임시 파일을 출력 파일로 교체
+
+        다른 스레드의 add()보다 먼저 불릴 수 있으므로 아직 받지 못한 배치는 results에서 채웁니다.
+        """
+        with self._lock:
+            for index in range(self._next_index, len(results)):
+                self._ready.setdefault(index, results[index])
+            self._drain_ready()
+            if self._layout is not None:
+                # 번역 결과가 모자라면 해당 라인은 빠짐 (이후 누락 검증에서 다시 번역)
+                self._unwritten.extend(line for line in self._layout[self._layout_position:] if line is not None)
+                self._layout_position = len(self._layout)
+            self._write_unwritten()
+            os.replace(self.part_file, self.output_file)
+            self.finished = True
+
+    def discard(self):
+        """마무리하지 못한 임시 파일 삭제 (이어서 번역할 내용은 번역 기록에 있음)"""
+        with self._lock:
+            if self._started and not self.finished and os.path.exists(self.part_file):
+                os.remove(self.part_file)
+
+    def _drain_ready(self):
+        while self._next_index in self._ready:
+            self._translated.extend(self._ready.pop(self._next_index) or [])
+            self._next_index += 1
+        self._place_translated_lines()
+
+    def _place_translated_lines(self):
+        if self._layout is None:
+            self._unwritten.extend(self._translated)
+            self._translated.clear()
+            return
+        while self._layout_position < len(self._layout):
+            line = self._layout[self._layout_position]
+            if line is None:
+                if not self._translated:
+                    break
+                line = self._translated.popleft()
+            self._unwritten.append(line)
+            self._layout_position += 1
+
+    def _write_unwritten(self):
+        if self._started and not self._unwritten:
+            return
+        if not self._started:
+            output_dir = os.path.dirname(self.part_file)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+        with open(self.part_file, 'ab' if self._started else 'wb') as f:
+            if not self._started:
+                f.write(codecs.BOM_UTF8)
+            f.write("".join(self._unwritten).encode('utf-8'))
+        self.line_count += len(self._unwritten)
+        self.lines.extend(self._unwritten)
+        self._unwritten = []
+        self._started = True
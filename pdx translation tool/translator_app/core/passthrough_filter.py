@@ -0,0 +1,49 @@
+# translator_project/translator_app/core/passthrough_filter.py
+import re
+
+from .placeholder_masker import PLACEHOLDER_PATTERN
+from .yml_lexer import lex_lines
+
+# 글자 판단 전에 지우는 서식 코드 (#P 텍스트#!, @아이콘!)
+FORMAT_CODE_PATTERN = re.compile(r'#[A-Za-z_]+|#!|@[A-Za-z0-9_]+!')
+GFX_PATTERN = re.compile(r'GFX_\w+')
+URL_PATTERN = re.compile(r'(?:https?://|www\.)\S+', re.IGNORECASE)
+# 경로 구분자가 있고 마지막 부분에 확장자가 있거나, 알려진 게임 파일 확장자로 끝나는 공백 없는 값
+PATH_PATTERN = re.compile(r'[\w.\-]+(?:[/\\][\w.\-]+)+\.[A-Za-z0-9]{1,6}'
+                          r'|[\w.\-/\\]+\.(?:dds|png|tga|jpg|gfx|gui|txt|yml|mesh|asset|anim|shader|fxh|'
+                          r'wav|ogg|mp3|csv|json|lua)', re.IGNORECASE)
+
+
+def is_never_translated(key, value):
+    """번역할 필요가 없는 값인지 (코드만 있는 값, 숫자/기호, 파일 경로, GFX_ 식별자, 키를 그대로 쓴 값)
+
+    기본 프롬프트에서 번역하지 말라고 하는 값을 API로 보내기 전에 걸러냅니다.
+    """
+    stripped = value.strip()
+    if not stripped or stripped == key:
+        return True
+    if GFX_PATTERN.fullmatch(stripped) or URL_PATTERN.fullmatch(stripped) or PATH_PATTERN.fullmatch(stripped):
+        return True
+    remainder = FORMAT_CODE_PATTERN.sub('', PLACEHOLDER_PATTERN.sub('', stripped))
+    # 게임 코드를 지우고 남은 부분에 글자가 없으면 숫자/기호뿐
+    return not any(char.isalpha() for char in remainder)
+
+
+def plan_passthrough(content_lines, line_layout=None):
+    """API로 보내지 않고 원문 그대로 쓸 라인을 줄 배치(line_layout)에 채워 반환
+
+    주석/빈 줄/키가 아닌 라인과 번역할 필요가 없는 값은 원문 라인을, 번역할 라인은 None을 둡니다.
+    기존 줄 배치(증분 번역, 빈칸 채우기)가 있으면 그 배치에서 번역할 라인만 검사합니다.
+    (줄 배치, 걸러낸 값 수) 반환
+    """
+    layout = list(line_layout) if line_layout is not None else [None] * len(content_lines)
+    skipped_values = 0
+    for record in lex_lines(content_lines):
+        if layout[record.index] is not None:
+            continue
+        if not record.is_content:
+            layout[record.index] = record.text
+        elif record.is_entry and is_never_translated(record.key, record.value):
+            layout[record.index] = record.text
+            skipped_values += 1
+    return layout, skipped_values
@@ -0,0 +1,89 @@
+# translator_project/translator_app/core/placeholder_masker.py
+import re
+
+# 모델이 건드리면 안 되는 게임 코드
+PLACEHOLDER_PATTERN = re.compile(
+    r'\$[^$\s"]+\$'      # $VARIABLE$, $VAL|+=$
+    r'|\[[^\[\]"]+\]'    # [Concept|E], [Root.GetName]
+    r'|£[^£\s"]+£'       # £gold£
+    r'|§[A-Za-z0-9!]'    # §Y ... §!
+    r'|\\n'              # 값 안의 줄바꿈 이스케이프
+)
+TOKEN_PATTERN = re.compile(r'<(\d+)>')
+# 템플릿으로 묶을 때 게임 코드와 함께 추상화하는 숫자 (단어에 붙은 숫자 제외)
+TEMPLATE_PATTERN = re.compile(PLACEHOLDER_PATTERN.pattern + r'|(?<![\w.])\d+(?:[.,]\d+)*(?!\w)')
+
+
+def _tokenize(value, pattern):
+    """(토큰으로 바꾼 값, 코드 목록) - 붙어 있는 코드는 토큰 하나로 합침"""
+    spans = []
+    for match in pattern.finditer(value):
+        if spans and spans[-1][1] == match.start():
+            spans[-1][1] = match.end()
+        else:
+            spans.append([match.start(), match.end()])
+    if not spans:
+        return value, []
+
+    parts = []
+    codes = []
+    last_end = 0
+    for start, end in spans:
+        parts.append(value[last_end:start])
+        parts.append(f"<{len(codes)}>")
+        codes.append(value[start:end])
+        last_end = end
+    parts.append(value[last_end:])
+    return "".join(parts), codes
+
+
+def fill_tokens(value, codes):
+    """토큰을 코드로 채움 - 토큰이 빠졌거나 중복/알 수 없는 번호면 None"""
+    if value is None:
+        return None
+    found = [int(number) for number in TOKEN_PATTERN.findall(value)]
+    if sorted(found) != list(range(len(codes))):
+        return None
+    return TOKEN_PATTERN.sub(lambda match: codes[int(match.group(1))], value)
+
+
+def make_template(value):
+    """(템플릿, 슬롯 목록) - 게임 코드와 숫자를 <0>, <1> 토큰으로 바꾼 값과 바뀐 원래 부분
+
+    게임 코드와 숫자만 다른 값은 같은 템플릿이 됩니다. 원문에 이미 토큰 형태가 있으면 슬롯은 None입니다.
+    """
+    if TOKEN_PATTERN.search(value):
+        return value, None
+    return _tokenize(value, TEMPLATE_PATTERN)
+
+
+def extract_template(translated_value, slots):
+    """make_template로 만든 슬롯을 번역 결과에서 찾아 번역된 템플릿 반환 - 대응시킬 수 없으면 None
+
+    번역 결과의 코드/숫자가 슬롯과 정확히 같고, 슬롯끼리 서로 구별될 때만 템플릿을 만듭니다.
+    """
+    if slots is None or len(set(slots)) != len(slots) or TOKEN_PATTERN.search(translated_value):
+        return None
+    template, codes = _tokenize(translated_value, TEMPLATE_PATTERN)
+    if sorted(codes) != sorted(slots):
+        return None
+    slot_numbers = {slot: number for number, slot in enumerate(slots)}
+    return TOKEN_PATTERN.sub(lambda match: f"<{slot_numbers[codes[int(match.group(1))]]}>", template)
+
+
+class PlaceholderMasker:
+    """게임 코드를 <0>, <1> 같은 짧은 토큰으로 바꿔 모델에 보내고, 응답에서 원래 코드로 복원
+
+    붙어 있는 코드(예: §Y$VAL$§!)는 토큰 하나로 합칩니다. 토큰 번호는 값마다 0부터 시작합니다.
+    """
+
+    def mask(self, value):
+        """(마스킹된 값, 코드 목록) 반환 - 코드가 없거나 원문에 이미 토큰 형태가 있으면 코드 목록은 None"""
+        if not value or TOKEN_PATTERN.search(value):
+            return value, None
+        masked, codes = _tokenize(value, PLACEHOLDER_PATTERN)
+        return masked, codes or None
+
+    def unmask(self, value, codes):
+        """토큰을 원래 코드로 복원 - 토큰이 빠졌거나 중복/알 수 없는 번호면 None"""
+        return fill_tokens(value, codes)
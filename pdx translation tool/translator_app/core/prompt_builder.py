@@ -0,0 +1,70 @@
+# translator_project/translator_app/core/prompt_builder.py
+import re
+import threading
+
+# 고정 부분에서 배치 텍스트 자리에 남기는 안내
+BATCH_TEXT_NOTE = "[provided in the user message]"
+_BATCH_SENTINEL = "\x00BATCH_TEXT\x00"
+_OPEN_FENCE_PATTERN = re.compile(r'```[^\n`]*\n$')
+_CLOSE_FENCE_PATTERN = re.compile(r'^\n```[^\n`]*')
+
+
+class PromptBuilder:
+    """프롬프트를 고정 부분(규칙/게임 설명/용어집)과 배치별 부분으로 나눔
+
+    고정 부분은 모델의 시스템 지시(또는 캐시된 콘텐츠)로 한 번만 전달하고, 요청마다
+    배치 텍스트만 보냅니다. 템플릿에서 {batch_text}를 감싼 코드 블록은 배치 부분으로 옮깁니다.
+    """
+
+    def __init__(self, template, source_lang, target_lang, glossary_section, estimate_tokens, extra_instruction=""):
+        rendered = template.format(
+            source_lang_for_prompt=source_lang,
+            target_lang_for_prompt=target_lang,
+            glossary_section=glossary_section or "",
+            batch_text=_BATCH_SENTINEL
+        )
+        head, _, tail = rendered.partition(_BATCH_SENTINEL)
+        self.open_fence = ""
+        self.close_fence = ""
+        open_match = _OPEN_FENCE_PATTERN.search(head)
+        close_match = _CLOSE_FENCE_PATTERN.match(tail)
+        if open_match and close_match:
+            self.open_fence = open_match.group(0)
+            self.close_fence = close_match.group(0)
+            head = head[:open_match.start()]
+            tail = tail[close_match.end():]
+
+        self.system_instruction = head + BATCH_TEXT_NOTE + tail + extra_instruction
+        self._estimate_tokens = estimate_tokens
+        self.static_tokens = estimate_tokens(self.system_instruction)
+        self.cached = False
+
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._dynamic_tokens = 0
+        self._cached_tokens = 0
+
+    def build_request(self, batch_text, glossary_section=""):
+        """요청마다 보내는 부분 (배치에 나오는 용어의 용어집 + 배치 텍스트)"""
+        request_text = glossary_section + self.open_fence + batch_text + self.close_fence
+        with self._lock:
+            self._request_count += 1
+            self._dynamic_tokens += self._estimate_tokens(request_text)
+        return request_text
+
+    def record_usage(self, usage):
+        """응답의 usage_metadata에서 캐시 적중 토큰 수 누적"""
+        cached_tokens = getattr(usage, 'cached_content_token_count', 0) if usage else 0
+        if cached_tokens:
+            with self._lock:
+                self._cached_tokens += cached_tokens
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'static_tokens': self.static_tokens,
+                'requests': self._request_count,
+                'dynamic_tokens': self._dynamic_tokens,
+                'cached_tokens': self._cached_tokens,
+                'cached': self.cached
+            }
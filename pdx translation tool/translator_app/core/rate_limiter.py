@@ -0,0 +1,161 @@
+# translator_project/translator_app/core/rate_limiter.py
+import asyncio
+import hashlib
+import threading
+import time
+
+
+class TokenBucketRateLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 지키는 토큰 버킷
+
+    호출자는 acquire() 시점에 예산을 예약하고(부족하면 빚으로 기록) 빚이 갚아질 때까지 대기하므로
+    모든 스레드가 도착 순서대로 공평하게 API를 호출합니다.
+    """
+
+    def __init__(self, requests_per_minute, tokens_per_minute, burst_seconds=10.0):
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._blocked_until = 0.0
+        self._last_refill = time.monotonic()
+        self.total_wait_time = 0.0
+        self.rate_limited_count = 0
+        self.configure(requests_per_minute, tokens_per_minute, burst_seconds)
+        self._request_level = self._request_capacity
+        self._token_level = self._token_capacity
+
+    def configure(self, requests_per_minute, tokens_per_minute, burst_seconds=10.0):
+        """예산 변경 (0 이하이면 해당 항목은 제한하지 않음)"""
+        with self._lock:
+            self.requests_per_minute = max(0, int(requests_per_minute or 0))
+            self.tokens_per_minute = max(0, int(tokens_per_minute or 0))
+            self._request_rate = self.requests_per_minute / 60.0
+            self._token_rate = self.tokens_per_minute / 60.0
+            # 순간 폭주를 막기 위해 버킷 용량은 몇 초 분량으로 제한 (최소 1회 요청은 허용)
+            self._request_capacity = max(1.0, self._request_rate * burst_seconds)
+            self._token_capacity = max(1.0, self._token_rate * burst_seconds)
+            if hasattr(self, '_request_level'):
+                self._request_level = min(self._request_level, self._request_capacity)
+                self._token_level = min(self._token_level, self._token_capacity)
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._request_level = min(self._request_capacity, self._request_level + elapsed * self._request_rate)
+            self._token_level = min(self._token_capacity, self._token_level + elapsed * self._token_rate)
+            self._last_refill = now
+
+    def reserve(self, tokens=0):
+        """예산을 예약하고 호출 전에 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait_time = max(0.0, self._blocked_until - now)
+
+            if self._request_rate > 0:
+                self._request_level -= 1
+                if self._request_level < 0:
+                    wait_time = max(wait_time, -self._request_level / self._request_rate)
+            if self._token_rate > 0 and tokens > 0:
+                self._token_level -= tokens
+                if self._token_level < 0:
+                    wait_time = max(wait_time, -self._token_level / self._token_rate)
+            return wait_time
+
+    def acquire(self, tokens=0, stop_event=None):
+        """예산이 생길 때까지 대기 (중지 요청 시 False 반환)"""
+        wait_time = self.reserve(tokens)
+        if wait_time <= 0:
+            return True
+
+        with self._lock:
+            self._waiting += 1
+            self.total_wait_time += wait_time
+        try:
+            if stop_event is not None:
+                return not stop_event.wait(wait_time)
+            time.sleep(wait_time)
+            return True
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    async def acquire_async(self, tokens=0, stop_event=None, poll_interval=0.5):
+        """acquire()의 asyncio 버전 - 대기 중에도 이벤트 루프를 막지 않음"""
+        wait_time = self.reserve(tokens)
+        if wait_time <= 0:
+            return True
+
+        with self._lock:
+            self._waiting += 1
+            self.total_wait_time += wait_time
+        try:
+            deadline = time.monotonic() + wait_time
+            while True:
+                if stop_event is not None and stop_event.is_set():
+                    return False
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return True
+                await asyncio.sleep(min(remaining, poll_interval))
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def settle(self, reserved_tokens, actual_tokens):
+        """응답의 실제 토큰 사용량으로 예약분 보정"""
+        if self._token_rate <= 0 or actual_tokens is None:
+            return
+        with self._lock:
+            self._token_level = min(self._token_capacity, self._token_level + reserved_tokens - actual_tokens)
+
+    def penalize(self, backoff_seconds):
+        """429 응답 시 모든 호출자를 잠시 멈추게 함 (개별 재시도 폭주 방지)"""
+        with self._lock:
+            self.rate_limited_count += 1
+            self._blocked_until = max(self._blocked_until, time.monotonic() + backoff_seconds)
+
+    @property
+    def available_tokens(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0, int(self._token_level))
+
+    @property
+    def available_requests(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0, int(self._request_level))
+
+    @property
+    def queued_callers(self):
+        with self._lock:
+            return self._waiting
+
+    def get_stats(self):
+        return {
+            'requests_per_minute': self.requests_per_minute,
+            'tokens_per_minute': self.tokens_per_minute,
+            'available_requests': self.available_requests,
+            'available_tokens': self.available_tokens,
+            'queued_callers': self.queued_callers,
+            'rate_limited_count': self.rate_limited_count,
+            'total_wait_time': round(self.total_wait_time, 2)
+        }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model_name, api_key, requests_per_minute, tokens_per_minute):
+    """모델/API 키 조합별로 하나의 리미터를 공유 (같은 조합이면 예산만 갱신)"""
+    key_hash = hashlib.sha256((api_key or "").encode('utf-8')).hexdigest()[:16]
+    registry_key = (model_name, key_hash)
+    with _limiters_lock:
+        limiter = _limiters.get(registry_key)
+        if limiter is None:
+            limiter = TokenBucketRateLimiter(requests_per_minute, tokens_per_minute)
+            _limiters[registry_key] = limiter
+        else:
+            limiter.configure(requests_per_minute, tokens_per_minute)
+        return limiter
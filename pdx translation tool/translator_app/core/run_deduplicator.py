@@ -0,0 +1,147 @@
+# translator_project/translator_app/core/run_deduplicator.py
+import concurrent.futures
+import hashlib
+import threading
+from collections import Counter
+
+from .placeholder_masker import make_template, extract_template, fill_tokens
+
+
+def _dedup_key(value):
+    """(중복 제거 키, 슬롯 목록) - 템플릿으로 만들 수 없는 값은 값 자체로 구분"""
+    template, slots = make_template(value)
+    return (template if slots is not None else (value,)), slots
+
+
+class RunDeduplicator:
+    """실행 단위 중복 제거 - 여러 파일에 반복되는 원문 값과 동일한 파일을 한 번만 번역
+
+    값은 게임 코드와 숫자를 토큰으로 바꾼 템플릿 단위로 묶습니다. 템플릿마다 한 값만 번역하고,
+    번역에서 코드/숫자 위치를 찾아 만든 번역 템플릿에 다른 값의 코드/숫자를 채워 넣습니다.
+    템플릿을 만들거나 채우지 못하면 그 값은 따로 번역합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results = {}        # 템플릿 키 -> (원문 값, 번역 값, 번역 템플릿) (완료)
+        self._exact_results = {}  # 원문 값 -> 번역 값 (템플릿으로 만들지 못한 번역 포함)
+        self._inflight = {}       # 템플릿 키 -> 번역 중인 Future
+        self.shared_values = set()  # 여러 번 나오는 템플릿 키
+        self.duplicate_files = {}  # 대표 파일 -> [내용이 같은 파일들]
+        self.total_values = 0
+        self.unique_values = 0
+        self.unique_templates = 0
+        self.reused_count = 0
+
+    def scan_files(self, file_paths, extract_value):
+        """배치 전 모든 파일을 훑어 동일 파일(내용 해시)과 반복되는 값을 수집, 실제 번역할 파일 목록 반환"""
+        primary_by_hash = {}
+        primary_files = []
+        value_counts = Counter()
+
+        for file_path in file_paths:
+            try:
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                # 읽기 실패 파일은 그대로 처리 단계로 넘겨 오류를 기록하게 함
+                primary_files.append(file_path)
+                continue
+
+            content_hash = hashlib.sha256(data).hexdigest()
+            if content_hash in primary_by_hash:
+                self.duplicate_files.setdefault(primary_by_hash[content_hash], []).append(file_path)
+                continue
+            primary_by_hash[content_hash] = file_path
+            primary_files.append(file_path)
+
+            for line in data.decode('utf-8-sig', errors='replace').splitlines():
+                value = extract_value(line)
+                if value and value.strip():
+                    value_counts[value] += 1
+
+        template_counts = Counter()
+        for value, count in value_counts.items():
+            template_counts[_dedup_key(value)[0]] += count
+
+        self.total_values = sum(value_counts.values())
+        self.unique_values = len(value_counts)
+        self.unique_templates = len(template_counts)
+        self.shared_values = {key for key, count in template_counts.items() if count > 1}
+        return primary_files
+
+    def is_shared(self, value):
+        """다른 값과 같은 템플릿을 쓰는(또는 반복되는) 값인지"""
+        return _dedup_key(value)[0] in self.shared_values
+
+    def acquire(self, value):
+        """값의 상태 반환: ('done', 번역) / ('wait', Future) / ('owner', None)
+
+        'owner'를 받은 호출자는 번역 후 반드시 resolve()를 호출해야 함.
+        'wait'의 Future 결과는 instantiate()로 이 값의 번역으로 바꿔서 사용.
+        """
+        key = _dedup_key(value)[0]
+        with self._lock:
+            if value in self._exact_results:
+                self.reused_count += 1
+                return 'done', self._exact_results[value]
+            translated_value = self.instantiate(value, self._results.get(key))
+            if translated_value is not None:
+                self.reused_count += 1
+                return 'done', translated_value
+            future = self._inflight.get(key)
+            if future is not None:
+                self.reused_count += 1
+                return 'wait', future
+            self._inflight[key] = concurrent.futures.Future()
+            return 'owner', None
+
+    def resolve(self, value, translated_value):
+        """번역 결과를 대기 중인 호출자들에게 전달 (None이면 실패 - 다음 호출자가 다시 번역)
+
+        번역 템플릿을 만들지 못하면 같은 값에만 재사용하고, 같은 템플릿의 다른 값은 따로 번역합니다.
+        """
+        key, slots = _dedup_key(value)
+        shared = None
+        if translated_value is not None:
+            shared = (value, translated_value, extract_template(translated_value, slots))
+        with self._lock:
+            future = self._inflight.pop(key, None)
+            if shared is not None:
+                self._exact_results[value] = translated_value
+                if shared[2] is not None:
+                    self._results[key] = shared
+        if future is not None and not future.done():
+            future.set_result(shared)
+
+    @staticmethod
+    def instantiate(value, shared):
+        """공유된 번역 결과를 이 값의 번역으로 변환 - 코드/숫자를 채우지 못하면 None"""
+        if shared is None:
+            return None
+        owner_value, translated_value, translated_template = shared
+        if value == owner_value:
+            return translated_value
+        if translated_template is None:
+            return None
+        return fill_tokens(translated_template, make_template(value)[1] or [])
+
+    def release_all(self):
+        """중지 시 대기 중인 Future를 모두 실패로 정리"""
+        with self._lock:
+            pending = list(self._inflight.values())
+            self._inflight.clear()
+        for future in pending:
+            if not future.done():
+                future.set_result(None)
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'total_values': self.total_values,
+                'unique_values': self.unique_values,
+                'unique_templates': self.unique_templates,
+                'shared_values': len(self.shared_values),
+                'reused': self.reused_count,
+                'duplicate_files': sum(len(dups) for dups in self.duplicate_files.values())
+            }
@@ -40,6 +40,16 @@ class SettingsManager:
                 app_vars["skip_already_translated_var"].set(config.get("skip_already_translated", False))
                 app_vars["max_retries_var"].set(config.get("max_retries", 3))
                 app_vars["selected_game_var"].set(config.get("selected_game", "None"))
+                app_vars["use_translation_memory_var"].set(config.get("use_translation_memory", True))
+                app_vars["requests_per_minute_var"].set(config.get("requests_per_minute", 1000))
+                app_vars["tokens_per_minute_var"].set(config.get("tokens_per_minute", 1000000))
+                app_vars["batch_token_budget_var"].set(config.get("batch_token_budget", 8000))
+                app_vars["use_async_engine_var"].set(config.get("use_async_engine", False))
+                app_vars["use_values_only_payload_var"].set(config.get("use_values_only_payload", True))
+                app_vars["use_json_response_var"].set(config.get("use_json_response", False))
+                app_vars["enforce_glossary_var"].set(config.get("enforce_glossary", True))
+                app_vars["incremental_translation_var"].set(config.get("incremental_translation", True))
+                app_vars["gap_fill_mode_var"].set(config.get("gap_fill_mode", False))
 
                 prompt_str = config.get("custom_prompt", self.default_prompt_template)
                 if prompt_str != self.default_prompt_template:
@@ -78,6 +88,16 @@ class SettingsManager:
             "skip_already_translated": app_vars["skip_already_translated_var"].get(),
             "max_retries": app_vars["max_retries_var"].get(),
             "selected_game": app_vars["selected_game_var"].get(),
+            "use_translation_memory": app_vars["use_translation_memory_var"].get(),
+            "requests_per_minute": app_vars["requests_per_minute_var"].get(),
+            "tokens_per_minute": app_vars["tokens_per_minute_var"].get(),
+            "batch_token_budget": app_vars["batch_token_budget_var"].get(),
+            "use_async_engine": app_vars["use_async_engine_var"].get(),
+            "use_values_only_payload": app_vars["use_values_only_payload_var"].get(),
+            "use_json_response": app_vars["use_json_response_var"].get(),
+            "enforce_glossary": app_vars["enforce_glossary_var"].get(),
+            "incremental_translation": app_vars["incremental_translation_var"].get(),
+            "gap_fill_mode": app_vars["gap_fill_mode_var"].get(),
             "custom_prompt": current_prompt,
             "glossaries": glossary_file_paths
         }
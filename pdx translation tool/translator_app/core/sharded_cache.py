@@ -0,0 +1,97 @@
+# translator_project/translator_app/core/sharded_cache.py
+import sys
+import threading
+from collections import OrderedDict
+
+
+def estimate_size(key, value):
+    """항목 하나가 차지하는 대략적인 바이트 수 (키 + 값)"""
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class _Shard:
+    __slots__ = ('lock', 'entries', 'bytes', 'hits', 'misses', 'evictions')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # 키 -> (값, 크기), 오래 안 쓴 순
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class ShardedLRUCache:
+    """여러 조각(shard)으로 나눈 스레드 안전 LRU 캐시
+
+    키의 해시로 조각을 고르고 조각마다 잠금이 따로 있으므로, 많은 작업 스레드가 동시에 조회해도
+    하나의 잠금에서 줄을 서지 않습니다. 조회/저장은 O(1)이며 항목 수와 바이트 한도를 조각별로
+    나눠 적용하고, 넘치면 가장 오래 쓰지 않은 항목부터 내보냅니다.
+    """
+
+    def __init__(self, max_entries=1000, max_bytes=None, shard_count=16, size_of=estimate_size):
+        self.shard_count = max(1, min(shard_count, max_entries))
+        self._max_entries = max(1, max_entries // self.shard_count)
+        self._max_bytes = max(1, max_bytes // self.shard_count) if max_bytes else None
+        self._size_of = size_of
+        self._shards = [_Shard() for _ in range(self.shard_count)]
+
+    def _shard(self, key):
+        return self._shards[hash(key) % self.shard_count]
+
+    def get(self, key, default=None):
+        shard = self._shard(key)
+        with shard.lock:
+            item = shard.entries.get(key)
+            if item is None:
+                shard.misses += 1
+                return default
+            shard.entries.move_to_end(key)
+            shard.hits += 1
+            return item[0]
+
+    def put(self, key, value):
+        size = self._size_of(key, value) if self._max_bytes else 0
+        shard = self._shard(key)
+        with shard.lock:
+            previous = shard.entries.pop(key, None)
+            if previous is not None:
+                shard.bytes -= previous[1]
+            # 한 조각의 바이트 한도보다 큰 항목은 저장하지 않음
+            if self._max_bytes and size > self._max_bytes:
+                return
+            shard.entries[key] = (value, size)
+            shard.bytes += size
+            while len(shard.entries) > self._max_entries or (self._max_bytes and shard.bytes > self._max_bytes):
+                _, (_, evicted_size) = shard.entries.popitem(last=False)
+                shard.bytes -= evicted_size
+                shard.evictions += 1
+
+    def clear(self):
+        """항목만 비우고 통계는 유지"""
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.bytes = 0
+
+    def reset_stats(self):
+        for shard in self._shards:
+            with shard.lock:
+                shard.hits = 0
+                shard.misses = 0
+                shard.evictions = 0
+
+    def __len__(self):
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def stats(self):
+        """{'entries', 'bytes', 'hits', 'misses', 'evictions'} 합계"""
+        totals = {'entries': 0, 'bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+        for shard in self._shards:
+            with shard.lock:
+                totals['entries'] += len(shard.entries)
+                totals['bytes'] += shard.bytes
+                totals['hits'] += shard.hits
+                totals['misses'] += shard.misses
+                totals['evictions'] += shard.evictions
+        return totals
@@ -0,0 +1,83 @@
+# translator_project/translator_app/core/translation_journal.py
+import hashlib
+import json
+import os
+import threading
+
+
+def hash_source_lines(lines):
+    """원본 파일 내용의 해시 (기록을 이어 쓸 수 있는지 확인용)"""
+    return hashlib.sha1("".join(lines).encode('utf-8')).hexdigest()
+
+
+class TranslationJournal:
+    """입력 파일별 추가 전용 번역 기록 - 배치가 끝날 때마다 번역된 줄을 기록해 중단 후 이어서 번역
+
+    기록 파일은 입력 폴더 기준 상대 경로로 구분하므로 폴더가 달라도 이름이 같은 파일끼리 덮어쓰지
+    않습니다. 원본 내용(해시)이나 번역 설정(지문)이 바뀌면 이전 기록은 버립니다.
+    마지막 줄이 중간에 끊긴 기록(강제 종료)은 무시합니다.
+    """
+
+    def __init__(self, journal_dir="checkpoints"):
+        self.journal_dir = journal_dir
+        self._lock = threading.Lock()
+
+    def _journal_path(self, relative_path):
+        key = hashlib.sha1(relative_path.replace('\\', '/').encode('utf-8')).hexdigest()
+        return os.path.join(self.journal_dir, key + ".journal")
+
+    def open(self, relative_path, source_hash, fingerprint):
+        """이전 기록을 읽어 {시작 줄: (원본 줄 수, 번역된 줄 목록)} 반환 - 이어 쓸 수 없으면 새 기록 시작
+
+        반환값의 두 번째 항목은 이전 기록을 버렸는지 여부입니다.
+        """
+        path = self._journal_path(relative_path)
+        header = {'type': 'header', 'path': relative_path, 'source_hash': source_hash, 'fingerprint': fingerprint}
+        records = {}
+        discarded = False
+        with self._lock:
+            if os.path.exists(path):
+                records, matched = self._replay(path, header)
+                if matched:
+                    return records, False
+                discarded = True
+            os.makedirs(self.journal_dir, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(header, ensure_ascii=False) + "\n")
+        return {}, discarded
+
+    @staticmethod
+    def _replay(path, expected_header):
+        records = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            first_line = f.readline()
+            try:
+                header = json.loads(first_line)
+            except ValueError:
+                return {}, False
+            if any(header.get(key) != expected_header[key] for key in ('path', 'source_hash', 'fingerprint')):
+                return {}, False
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if record.get('type') == 'batch':
+                    records[record['start']] = (record['count'], record['lines'])
+        return records, True
+
+    def append(self, relative_path, start, source_count, translated_lines):
+        """완료된 배치 하나를 기록 (디스크에 바로 반영)"""
+        record = {'type': 'batch', 'start': start, 'count': source_count, 'lines': translated_lines}
+        data = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self._journal_path(relative_path), 'a', encoding='utf-8') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def remove(self, relative_path):
+        path = self._journal_path(relative_path)
+        with self._lock:
+            if os.path.exists(path):
+                os.remove(path)
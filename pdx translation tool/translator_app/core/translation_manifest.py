@@ -0,0 +1,149 @@
+# translator_project/translator_app/core/translation_manifest.py
+import hashlib
+import json
+import os
+
+from .passthrough_filter import is_never_translated
+from .yml_lexer import lex_lines, read_yml_lines
+
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+
+def hash_source_value(value):
+    return hashlib.sha1(value.encode('utf-8')).hexdigest()
+
+
+def iter_yml_entries(lines):
+    """(라인 인덱스, 키 id, 앞부분, 값, 뒷부분) - 같은 키가 여러 번 나오면 'key#n'으로 구분"""
+    seen_keys = {}
+    for record in lex_lines(lines):
+        if not record.is_entry:
+            continue
+        occurrence = seen_keys.get(record.key, 0)
+        seen_keys[record.key] = occurrence + 1
+        key_id = record.key if occurrence == 0 else f"{record.key}#{occurrence}"
+        yield record.index, key_id, record.prefix, record.value, record.suffix
+
+
+class TranslationManifest:
+    """출력 파일 옆에 두는 매니페스트 - 키별 원문 값 해시와 번역 설정 지문
+
+    다음 실행에서 원문 해시가 같은 키는 기존 출력의 번역을 그대로 쓰고, 새로 생겼거나 바뀐
+    키만 번역합니다. 원문에서 사라진 키는 출력에서도 빠집니다.
+    """
+
+    @staticmethod
+    def manifest_path(output_file):
+        return output_file + MANIFEST_SUFFIX
+
+    def plan(self, content_lines, output_file, fingerprint):
+        """원문 라인별 재사용할 번역 라인(다시 번역할 라인은 None) 목록과 통계 반환 - 재사용할 수 없으면 (None, None)"""
+        manifest = self._load(output_file)
+        if manifest is None or manifest.get('fingerprint') != fingerprint or not os.path.exists(output_file):
+            return None, None
+        try:
+            output_values = {key_id: value for _, key_id, _, value, _ in iter_yml_entries(read_yml_lines(output_file))}
+        except (OSError, UnicodeDecodeError):
+            return None, None
+
+        source_hashes = manifest.get('entries', {})
+        layout = [None] * len(content_lines)
+        source_keys = set()
+        entry_indices = set()
+        reused_count = 0
+        changed_count = 0
+        for index, key_id, prefix, value, suffix in iter_yml_entries(content_lines):
+            source_keys.add(key_id)
+            entry_indices.add(index)
+            if not value.strip():
+                layout[index] = content_lines[index]
+                continue
+            translated_value = output_values.get(key_id)
+            if translated_value is None or source_hashes.get(key_id) != hash_source_value(value):
+                changed_count += 1
+                continue
+            # 버전 번호/주석이 바뀌어도 번역은 재사용하고 앞뒤 부분은 새 원문을 따름
+            layout[index] = f'{prefix}"{translated_value}"{suffix}'
+            reused_count += 1
+        # 주석/빈 줄은 번역할 라인이 없으면 원문 그대로 사용
+        for index, line in enumerate(content_lines):
+            if layout[index] is None and index not in entry_indices:
+                layout[index] = line
+        stats = {
+            'reused': reused_count,
+            'changed': changed_count,
+            'removed': sum(1 for key_id in source_hashes if key_id not in source_keys)
+        }
+        return layout, stats
+
+    def plan_gap_fill(self, content_lines, output_file):
+        """기존 대상 파일에 없는 키만 번역하는 배치 계획 (plan과 같은 형식) - 대상 파일이 없으면 (None, None)
+
+        대상 파일에 있는 키의 라인은 손으로 고친 내용일 수 있으므로 바이트 그대로 재사용합니다.
+        """
+        if not os.path.exists(output_file):
+            return None, None
+        try:
+            target_lines = read_yml_lines(output_file)
+        except (OSError, UnicodeDecodeError):
+            return None, None
+        target_by_key = {key_id: target_lines[index] for index, key_id, _, _, _ in iter_yml_entries(target_lines)}
+
+        layout = list(content_lines)
+        source_keys = set()
+        kept_count = 0
+        missing_count = 0
+        for index, key_id, _, value, _ in iter_yml_entries(content_lines):
+            source_keys.add(key_id)
+            target_line = target_by_key.get(key_id)
+            if target_line is not None:
+                # 대상 파일의 마지막 줄은 줄바꿈이 없을 수 있음
+                layout[index] = target_line if target_line.endswith('\n') else target_line + '\n'
+                kept_count += 1
+            elif value.strip():
+                layout[index] = None
+                missing_count += 1
+        stats = {
+            'kept': kept_count,
+            'missing': missing_count,
+            'dropped': sum(1 for key_id in target_by_key if key_id not in source_keys)
+        }
+        return layout, stats
+
+    def write(self, source_lines, output_lines, output_file, fingerprint, accepted_unchanged=None):
+        """완료된 출력 라인 기준으로 매니페스트 저장 - 번역되지 않은 키(원문 값 그대로)는 기록하지 않음
+
+        번역할 필요가 없어 원문 그대로 둔 값(코드/숫자/경로 등)과 검증을 통과한 번역이 원문과 같은
+        값(accepted_unchanged)은 완료된 것으로 기록합니다.
+        """
+        output_values = {key_id: value for _, key_id, _, value, _ in iter_yml_entries(output_lines)}
+        previous_manifest = self._load(output_file) or {}
+        previous_entries = previous_manifest.get('entries', {}) if previous_manifest.get('fingerprint') == fingerprint else {}
+
+        accepted_unchanged = accepted_unchanged or ()
+        entries = {}
+        for _, key_id, _, value, _ in iter_yml_entries(source_lines):
+            translated_value = output_values.get(key_id)
+            if translated_value is None:
+                continue
+            source_hash = hash_source_value(value)
+            if translated_value != value or value in accepted_unchanged or \
+                    previous_entries.get(key_id) == source_hash or is_never_translated(key_id.partition('#')[0], value):
+                entries[key_id] = source_hash
+
+        manifest_path = self.manifest_path(output_file)
+        temp_path = manifest_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'fingerprint': fingerprint, 'entries': entries}, f)
+        os.replace(temp_path, manifest_path)
+
+    def _load(self, output_file):
+        try:
+            with open(self.manifest_path(output_file), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+            return None
+        return manifest
@@ -0,0 +1,186 @@
+# translator_project/translator_app/core/translation_memory.py
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from .config import TRANSLATION_MEMORY_FILE
+
+
+class TranslationMemory:
+    """디스크 기반 번역 메모리 - 동일한 원문 값은 API 호출 없이 재사용"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tm_entries (
+            key TEXT PRIMARY KEY,
+            source TEXT NOT NULL,
+            translation TEXT NOT NULL,
+            created REAL NOT NULL,
+            last_used REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tm_last_used ON tm_entries(last_used);
+    """
+    # SQLite 변수 개수 제한(기본 999)을 넘지 않도록 조회 단위를 나눔
+    QUERY_CHUNK = 500
+
+    def __init__(self, db_path=TRANSLATION_MEMORY_FILE, max_entries=200000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._conn = None
+        self._entry_count = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def normalize_value(value):
+        """캐시 키용 원문 정규화 (유니코드 NFC + 앞뒤 공백 제거)"""
+        return unicodedata.normalize('NFC', value).strip()
+
+    @staticmethod
+    def make_fingerprint(source_lang, target_lang, model_name, prompt_template, glossary_content, game=None):
+        """언어쌍/모델/프롬프트/용어집 조합의 지문 생성"""
+        hasher = hashlib.sha256()
+        for part in (source_lang, target_lang, model_name, game, prompt_template, glossary_content):
+            hasher.update((part or "").encode('utf-8'))
+            hasher.update(b'\x1f')
+        return hasher.hexdigest()
+
+    def make_key(self, value, fingerprint):
+        normalized = self.normalize_value(value)
+        return hashlib.sha256(f"{fingerprint}\x1f{normalized}".encode('utf-8')).hexdigest()
+
+    def _connect(self):
+        if self._conn is None:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+            self._entry_count = self._conn.execute("SELECT COUNT(*) FROM tm_entries").fetchone()[0]
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.commit()
+                    self._conn.close()
+                finally:
+                    self._conn = None
+
+    def lookup_many(self, values, fingerprint):
+        """원문 값 목록을 조회하여 {원문 값: 번역 값} 반환 (적중한 값만 포함)"""
+        if not values:
+            return {}
+        values = list(dict.fromkeys(values))
+        key_to_values = {}
+        for value in values:
+            key_to_values.setdefault(self.make_key(value, fingerprint), []).append(value)
+
+        found = {}
+        with self._lock:
+            conn = self._connect()
+            keys = list(key_to_values.keys())
+            for start in range(0, len(keys), self.QUERY_CHUNK):
+                chunk = keys[start:start + self.QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, translation FROM tm_entries WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, translation in rows:
+                    found[key] = translation
+
+            if found:
+                now = time.time()
+                conn.executemany("UPDATE tm_entries SET last_used = ? WHERE key = ?",
+                                 [(now, key) for key in found])
+                conn.commit()
+
+            hits = {}
+            for key, original_values in key_to_values.items():
+                if key in found:
+                    for value in original_values:
+                        hits[value] = self._rewrap_whitespace(value, found[key])
+            self.hits += len(hits)
+            self.misses += len(values) - len(hits)
+        return hits
+
+    def store_many(self, pairs, fingerprint):
+        """(원문 값, 번역 값) 쌍을 저장하고 최대 크기를 넘으면 오래된 항목부터 제거"""
+        if not pairs:
+            return
+        now = time.time()
+        rows = []
+        for source_value, translated_value in pairs:
+            normalized_source = self.normalize_value(source_value)
+            if not normalized_source:
+                continue
+            rows.append((self.make_key(source_value, fingerprint), normalized_source,
+                         translated_value.strip(), now, now))
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO tm_entries (key, source, translation, created, last_used) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._entry_count += conn.total_changes - before
+            conn.executemany("UPDATE tm_entries SET translation = ?, last_used = ? WHERE key = ?",
+                             [(row[2], now, row[0]) for row in rows])
+            self._evict_if_needed(conn)
+            conn.commit()
+
+    def _evict_if_needed(self, conn):
+        if self.max_entries <= 0 or self._entry_count <= self.max_entries:
+            return
+        # 경계에서 매번 삭제하지 않도록 최대 크기의 90%까지 줄임
+        target = int(self.max_entries * 0.9)
+        to_remove = self._entry_count - target
+        conn.execute(
+            "DELETE FROM tm_entries WHERE key IN (SELECT key FROM tm_entries ORDER BY last_used ASC LIMIT ?)",
+            (to_remove,)
+        )
+        self.evictions += to_remove
+        self._entry_count = target
+
+    @staticmethod
+    def _rewrap_whitespace(original_value, translation):
+        """정규화로 제거된 원문의 앞뒤 공백을 번역 값에 복원"""
+        stripped = original_value.strip()
+        if not stripped:
+            return original_value
+        leading = original_value[:len(original_value) - len(original_value.lstrip())]
+        trailing = original_value[len(original_value.rstrip()):]
+        return f"{leading}{translation}{trailing}"
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': self._entry_count,
+                'hit_rate': (self.hits / total) if total else 0.0
+            }
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM tm_entries")
+            conn.commit()
+            self._entry_count = 0
@@ -6,45 +6,41 @@ import codecs
 import concurrent.futures
 import google.generativeai as genai
 import re
-import tempfile
 import json
 import shutil
-from datetime import datetime
-from functools import lru_cache
+from datetime import datetime, timedelta
 from collections import deque
 from ..utils.localization import get_language_code
 from .game_prompts import get_enhanced_prompt
-
-class TranslationRecovery:
-    """번역 중단 시 복구를 위한 체크포인트 관리"""
-    def __init__(self, checkpoint_dir="checkpoints"):
-        self.checkpoint_dir = checkpoint_dir
-        os.makedirs(self.checkpoint_dir, exist_ok=True)
-    
-    def save_checkpoint(self, file_path, completed_lines, total_lines):
-        checkpoint_file = os.path.join(self.checkpoint_dir, f"{os.path.basename(file_path)}.checkpoint")
-        checkpoint_data = {
-            'file_path': file_path,
-            'completed_lines': completed_lines,
-            'total_lines': total_lines,
-            'timestamp': time.time()
-        }
-        with open(checkpoint_file, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint_data, f)
-    
-    def load_checkpoint(self, file_path):
-        checkpoint_file = os.path.join(self.checkpoint_dir, f"{os.path.basename(file_path)}.checkpoint")
-        if os.path.exists(checkpoint_file):
-            with open(checkpoint_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return None
-    
-    def remove_checkpoint(self, file_path):
-        checkpoint_file = os.path.join(self.checkpoint_dir, f"{os.path.basename(file_path)}.checkpoint")
-        if os.path.exists(checkpoint_file):
-            os.remove(checkpoint_file)
+from .translation_memory import TranslationMemory
+from .run_deduplicator import RunDeduplicator
+from .rate_limiter import get_rate_limiter
+from .batch_scheduler import BatchScheduler, FileJob
+from .batch_builder import BatchBuilder, TokenEstimator
+from .prompt_builder import PromptBuilder
+from .glossary_index import GlossaryIndex, format_glossary_section
+from .glossary_enforcer import GlossaryEnforcer
+from .placeholder_masker import PlaceholderMasker
+from .batch_payload import ValuesPayload, RawLinesPayload, JSON_RESPONSE_INSTRUCTION, build_response_schema, split_yml_entry
+from .translation_journal import TranslationJournal, hash_source_lines
+from .translation_manifest import TranslationManifest
+from .ordered_writer import OrderedFileWriter
+from .yml_lexer import lex_line_cached, read_yml_file, read_yml_lines, BROKEN, OTHER
+from .sharded_cache import ShardedLRUCache
+from .language_profiles import classify_translated
+from .batch_quality import BatchQualityChecker
+from .passthrough_filter import plan_passthrough
 
 class TranslatorEngine:
+    # 고정 프롬프트가 이보다 길면 캐시된 콘텐츠로 등록 (모델별 최소 캐시 크기 이상)
+    PROMPT_CACHE_MIN_TOKENS = 4096
+    PROMPT_CACHE_TTL_SECONDS = 3600
+    # 용어집을 따르지 않은 라인을 다시 요청하는 최대 횟수
+    GLOSSARY_RETRY_LIMIT = 1
+    # 검사 결과 캐시 한도 (캐시별)
+    CHECK_CACHE_MAX_ENTRIES = 10000
+    CHECK_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
     def __init__(self, log_callback, progress_callback, status_callback, stop_event, get_input_folder_callback):
         self.log_callback = log_callback
         self.main_progress_callback = progress_callback
@@ -62,9 +58,35 @@ class TranslatorEngine:
         self._callback_lock = threading.RLock()
         
         self.model = None
+        self.prompt_builder = None
+        self.prompt_cache = None
+        self._prompt_cache_refreshed_at = 0
         self.translation_thread = None
         self.validation_thread = None
-        self.recovery = TranslationRecovery()
+        self.journal = TranslationJournal()
+        # 증분 번역 - 출력 파일 옆의 매니페스트로 바뀐 키만 번역
+        self.incremental_translation = True
+        self.manifest = TranslationManifest()
+        # 빈칸 채우기 - 기존 대상 파일(부분 번역/수동 번역)에 없는 키만 번역
+        self.gap_fill_mode = False
+
+        # 번역 메모리 (실행 간 재사용되는 디스크 캐시)
+        self.use_translation_memory = True
+        self.translation_memory = TranslationMemory()
+        self.translation_memory_fingerprint = None
+
+        # 실행 단위 중복 제거 (번역 시작 시 생성)
+        self.enable_run_deduplication = True
+        self.run_deduplicator = None
+
+        # 게임 코드($VAR$, [..], £..£, §X, \n)를 토큰으로 바꿔 전송
+        self.mask_placeholders = True
+        self.placeholder_masker = PlaceholderMasker()
+
+        # 값만 전송 (키/버전/주석은 보내지 않고 로컬에서 재구성)
+        self.use_values_only_payload = True
+        # 응답을 id별 JSON 객체로 받기 (값만 전송 형식 사용)
+        self.use_json_response = False
 
         # 설정 변수들
         self.enable_backup = False  
@@ -74,9 +96,15 @@ class TranslatorEngine:
         self.target_lang_for_api = None
         self.prompt_template_str = None
         self.glossary_str_for_prompt = None
+        # 용어집 색인 - 있으면 배치에 나오는 용어만 요청마다 넣음 (번역 스레드에서 생성)
+        self.glossary_entries = []
+        self.glossary_index = None
+        self._glossary_injection_stats = {'requests': 0, 'entries': 0}
+        # 용어집 준수 검사 - 원문 용어가 남은 값은 로컬에서 치환하고, 나머지 위반 라인만 다시 요청
+        self.enforce_glossary = True
+        self.glossary_enforcer = None
         self.batch_size = 50
         self.max_tokens = 65536
-        self.delay_between_batches = 0.8
         self.temperature = 0.5
         
         # 성능 최적화를 위한 설정
@@ -87,8 +115,13 @@ class TranslatorEngine:
         self.request_queue = deque()  # 요청 큐
         self.adaptive_delay = 0.2  # 기본 지연 시간 단축
         
-        # 동적 배치 크기 조정
+        # 동적 배치 크기 조정 (배치는 토큰 예산으로 나누고, 라인 수는 상한으로만 사용)
         self.dynamic_batch_size = None
+        self.max_batch_lines = 500
+        self.batch_token_budget = 8000
+        self.batch_builder = None
+        # 배치 단위 품질 검사 (실행마다 언어쌍으로 생성)
+        self.quality_checker = None
         self.performance_history = deque(maxlen=10)
         self.success_rate_threshold = 0.85 
         self.max_workers = 100
@@ -99,6 +132,11 @@ class TranslatorEngine:
         self.selected_game = None
         self.max_retries = 3
 
+        # 전역 속도 제한 (모델/API 키별로 모든 워커 스레드가 공유)
+        self.requests_per_minute = 1000
+        self.tokens_per_minute = 1000000
+        self.rate_limiter = None
+
         self.translated_files_info_for_review = []
         
         # UI 콜백 및 통계 콜백
@@ -107,7 +145,6 @@ class TranslatorEngine:
 
         # 미리 컴파일된 정규식 패턴들 (성능 최적화)
         self.compiled_patterns = {
-            'yml_value': re.compile(r':\s*"(.*)"\s*$'),
             'yml_key': re.compile(r'^(\s*[^:]+:\s*)"'),
             'lang_identifier': re.compile(r"^\s*l_([a-zA-Z_]+)\s*:", re.IGNORECASE),
             'valid_yml_value': re.compile(r'^[^"]*"([^"\\]|\\.)*$'),
@@ -121,55 +158,36 @@ class TranslatorEngine:
             'code_blocks': re.compile(r'```(yaml|yml)?\n?', re.IGNORECASE)
         }
         
-        # 언어별 패턴들 - 개선된 버전
-        self.language_patterns = {
-            'English': re.compile(r'\b[a-zA-Z]{3,}\b', re.IGNORECASE),
-            'Korean': re.compile(r'[\uAC00-\uD7AF]+'),
-            'Japanese': re.compile(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+'),
-            'Simplified Chinese': re.compile(r'[\u4E00-\u9FFF]+'),
-            'Traditional Chinese': re.compile(r'[\u4E00-\u9FFF]+'),
-            'Russian': re.compile(r'[\u0400-\u04FF]+'),
-            'French': re.compile(r'\b[a-zA-Z\u00C0-\u017FàâäçèéêëîïôùûüÿœæÀÂÄÇÈÉÊËÎÏÔÙÛÜŸŒÆ]{3,}\b', re.IGNORECASE),
-            'German': re.compile(r'\b[a-zA-Z\u00C0-\u017FäöüßÄÖÜ]{3,}\b', re.IGNORECASE),
-            'Spanish': re.compile(r'\b[a-zA-Z\u00C0-\u017FáéíóúñÁÉÍÓÚÑüÜ]{3,}\b', re.IGNORECASE),
-            'Italian': re.compile(r'\b[a-zA-Z\u00C0-\u017FàèéìíîòóùúÀÈÉÌÍÎÒÓÙÚ]{3,}\b', re.IGNORECASE),
-            'Portuguese': re.compile(r'\b[a-zA-Z\u00C0-\u017FàáâãçéêíóôõúüÀÁÂÃÇÉÊÍÓÔÕÚÜ]{3,}\b', re.IGNORECASE),
-            'Polish': re.compile(r'\b[a-zA-Z\u0100-\u017FąćęłńóśźżĄĆĘŁŃÓŚŹŻ]{3,}\b', re.IGNORECASE),
-            'Turkish': re.compile(r'\b[a-zA-ZçğıöşüÇĞIİÖŞÜ]{3,}\b', re.IGNORECASE),
-            'Arabic': re.compile(r'[\u0600-\u06FF]+'),
-            'Hebrew': re.compile(r'[\u0590-\u05FF]+'),
-            'Thai': re.compile(r'[\u0E00-\u0E7F]+'),
-            'Vietnamese': re.compile(r'\b[a-zA-ZàáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđÀÁẠẢÃÂẦẤẬẨẪĂẰẮẶẲẴÈÉẸẺẼÊỀẾỆỂỄÌÍỊỈĨÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠÙÚỤỦŨƯỪỨỰỬỮỲÝỴỶỸĐ]{3,}\b', re.IGNORECASE)
-        }
-        
-        # 구문 패턴들
-        self.phrase_patterns = {
-            'english_phrase': re.compile(r'\b[a-zA-Z]+(?:\s+[a-zA-Z]+){2,}\b', re.IGNORECASE),
-            'european_phrase': re.compile(r'\b[a-zA-Z]+(?:\s+[a-zA-Z]+){2,}\b', re.IGNORECASE)
-        }
-        
         # 편의를 위한 직접 참조
         self.lang_identifier_pattern = self.compiled_patterns['lang_identifier']
         
-        # 캐시 초기화
-        self._cache_size = 1000
-        self._source_remnant_cache = deque(maxlen=self._cache_size)
-        self._regex_error_cache = deque(maxlen=self._cache_size)
+        # 검사 결과 캐시 초기화 (조각별 잠금 LRU - 여러 스레드가 하나의 잠금에서 기다리지 않음)
+        self._regex_error_cache = ShardedLRUCache(self.CHECK_CACHE_MAX_ENTRIES, self.CHECK_CACHE_MAX_BYTES)
+        self._value_error_cache = ShardedLRUCache(self.CHECK_CACHE_MAX_ENTRIES, self.CHECK_CACHE_MAX_BYTES)
+        self._translation_check_cache = ShardedLRUCache(self.CHECK_CACHE_MAX_ENTRIES, self.CHECK_CACHE_MAX_BYTES)
+
+        # 리소스 정리를 위한 추적
+        self._temp_directories = set()
+        self._active_threads = set()
+
+        # 현재 파일 통계 (배치별 통계는 스레드 로컬 file_stats 사용)
+        self.current_file_stats = {}
+        self.current_file_start_time = None
     
     def _calculate_optimal_batch_size(self):
-        """성능 히스토리를 바탕으로 최적 배치 크기 계산 (최대 80라인 제한)"""
+        """성능 히스토리를 바탕으로 최적 배치 크기(라인 상한) 계산"""
         if not self.performance_history:
-            return min(self.batch_size + 15, 80)  # 점진적 증가, 최대 80
+            return min(self.batch_size + 15, self.max_batch_lines)  # 점진적 증가
             
         # 최근 성공률 계산
         recent_success_rate = sum(1 for p in self.performance_history if p['success']) / len(self.performance_history)
         
         if recent_success_rate >= 0.9:
             # 매우 높은 성공률: 배치 크기 증가
-            return min(self.batch_size + 20, 80)
+            return min(self.batch_size + 20, self.max_batch_lines)
         elif recent_success_rate >= 0.8:
             # 좋은 성공률: 배치 크기 유지 또는 약간 증가
-            return min(self.batch_size + 10, 80)
+            return min(self.batch_size + 10, self.max_batch_lines)
         else:
             # 낮은 성공률: 배치 크기 감소
             return max(self.batch_size - 10, 20)
@@ -183,18 +201,10 @@ class TranslatorEngine:
             'timestamp': time.time()
         })
         
-        # 동적 배치 크기 업데이트 (최대 80라인 제한)
+        # 동적 배치 크기(라인 상한) 갱신 - 실제 배치는 BatchBuilder가 출력 토큰 예산에 맞춰 이 상한 안에서 구성
         if self.adaptive_batch_sizing:
             self.dynamic_batch_size = self._calculate_optimal_batch_size()
         
-        # 리소스 정리를 위한 추적
-        self._temp_directories = set()
-        self._active_threads = set()
-        
-        # 현재 파일 통계
-        self.current_file_stats = {}
-        self.current_file_start_time = None
-
     def __del__(self):
         """리소스 정리"""
         try:
@@ -227,6 +237,10 @@ class TranslatorEngine:
             
             # 캐시 정리
             self._cleanup_caches()
+
+            # 번역 메모리 연결 종료
+            if hasattr(self, 'translation_memory'):
+                self.translation_memory.close()
             
             # 콜백 정리
             self.clear_callbacks()
@@ -238,10 +252,23 @@ class TranslatorEngine:
     def _cleanup_caches(self):
         """캐시 메모리 정리"""
         try:
-            self._source_remnant_cache.clear()
-            self._regex_error_cache.clear()
+            for cache in self._check_caches():
+                cache.clear()
         except:
             pass
+
+    def _check_caches(self):
+        return (self._regex_error_cache, self._value_error_cache, self._translation_check_cache)
+
+    def _log_check_cache_summary(self):
+        """검사 결과 캐시 적중/미스/제거 통계 기록"""
+        totals = {'hits': 0, 'misses': 0, 'evictions': 0}
+        for cache in self._check_caches():
+            cache_stats = cache.stats()
+            for name in totals:
+                totals[name] += cache_stats[name]
+        if totals['hits'] or totals['misses']:
+            self.log_callback("log_check_cache_summary", totals['hits'], totals['misses'], totals['evictions'])
     
     def clear_callbacks(self):
         """모든 콜백 참조 제거"""
@@ -264,14 +291,25 @@ class TranslatorEngine:
         """스레드 안전한 현재 파일명 설정"""
         self.thread_local.current_file = filename
 
+    def _get_current_file_stats(self):
+        """현재 스레드가 처리 중인 파일의 통계 딕셔너리 (없으면 None)"""
+        return getattr(self.thread_local, 'file_stats', None)
+
+    def _set_current_file_stats(self, file_stats):
+        self.thread_local.file_stats = file_stats
+
     def _initialize_model(self):
         """모델 초기화 with 강화된 에러 처리"""
         try:
             # API 키 설정 (타임아웃 추가)
             genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel(self.selected_model_name)
+            self.prompt_builder = self._create_prompt_builder()
+            self.model = self._create_model()
+            self.rate_limiter = get_rate_limiter(self.selected_model_name, self.api_key,
+                                                 self.requests_per_minute, self.tokens_per_minute)
             
             # API 연결 테스트
+            self.rate_limiter.acquire(1, self.stop_event)
             test_response = self.model.generate_content(
                 "test", 
                 generation_config=genai.types.GenerationConfig(
@@ -302,47 +340,123 @@ class TranslatorEngine:
             
             return False
 
+    def _get_prompt_template(self):
+        """게임별 설명이 추가된 프롬프트 템플릿"""
+        if hasattr(self, 'selected_game') and self.selected_game and self.selected_game != "None":
+            try:
+                return get_enhanced_prompt(self.selected_game, self.prompt_template_str)
+            except Exception as e:
+                self.log_callback("log_game_prompt_error", str(e))
+        return self.prompt_template_str
+
+    def _create_prompt_builder(self):
+        """고정 프롬프트(시스템 지시) 구성 - 템플릿 형식 오류면 None (배치마다 전체 프롬프트 사용)"""
+        try:
+            builder = PromptBuilder(
+                self._get_prompt_template(),
+                self.source_lang_for_api,
+                self.target_lang_for_api,
+                "" if self.glossary_index is not None else self.glossary_str_for_prompt,
+                TokenEstimator.estimate_tokens,
+                JSON_RESPONSE_INSTRUCTION if self.use_json_response else ""
+            )
+        except (KeyError, IndexError, ValueError):
+            return None
+        self.log_callback("log_prompt_static_tokens", builder.static_tokens)
+        return builder
+
+    def _create_model(self):
+        """고정 프롬프트를 시스템 지시로 가진 모델 생성 (충분히 길면 캐시된 콘텐츠 사용)"""
+        self.prompt_cache = None
+        if self.prompt_builder is None:
+            return genai.GenerativeModel(self.selected_model_name)
+
+        system_instruction = self.prompt_builder.system_instruction
+        caching = getattr(genai, 'caching', None)
+        if caching is not None and self.prompt_builder.static_tokens >= self.PROMPT_CACHE_MIN_TOKENS:
+            try:
+                self.prompt_cache = caching.CachedContent.create(
+                    model=self.selected_model_name,
+                    system_instruction=system_instruction,
+                    ttl=timedelta(seconds=self.PROMPT_CACHE_TTL_SECONDS)
+                )
+                self._prompt_cache_refreshed_at = time.time()
+                self.prompt_builder.cached = True
+                self.log_callback("log_prompt_cache_created", self.prompt_builder.static_tokens)
+                return genai.GenerativeModel.from_cached_content(cached_content=self.prompt_cache)
+            except Exception as e:
+                # 캐시를 지원하지 않는 모델/요금제면 시스템 지시로 대체
+                self.prompt_cache = None
+                self.log_callback("log_prompt_cache_unavailable", str(e))
+        return genai.GenerativeModel(self.selected_model_name, system_instruction=system_instruction)
+
+    def _refresh_prompt_cache(self):
+        """긴 실행 중 캐시가 만료되지 않도록 TTL 연장"""
+        cache = self.prompt_cache
+        refresh_interval = self.PROMPT_CACHE_TTL_SECONDS / 2
+        if cache is None or time.time() - self._prompt_cache_refreshed_at < refresh_interval:
+            return
+        with self._cache_lock:
+            if time.time() - self._prompt_cache_refreshed_at < refresh_interval:
+                return
+            self._prompt_cache_refreshed_at = time.time()
+        try:
+            cache.update(ttl=timedelta(seconds=self.PROMPT_CACHE_TTL_SECONDS))
+        except Exception as e:
+            self.log_callback("log_prompt_cache_unavailable", str(e))
+
+    def _finish_prompt_builder(self):
+        """프롬프트 토큰/용어집 주입 통계 기록 및 캐시 삭제"""
+        injection_stats = self._glossary_injection_stats
+        if self.glossary_index is not None and injection_stats['requests']:
+            self.log_callback("log_glossary_injection_summary",
+                              f"{injection_stats['entries'] / injection_stats['requests']:.1f}",
+                              len(self.glossary_index.entries))
+        if self.prompt_builder is not None:
+            stats = self.prompt_builder.get_stats()
+            if stats['requests']:
+                self.log_callback("log_prompt_token_summary", stats['static_tokens'], stats['requests'],
+                                  stats['dynamic_tokens'], stats['cached_tokens'])
+        if self.prompt_cache is not None:
+            try:
+                self.prompt_cache.delete()
+            except Exception:
+                pass
+            self.prompt_cache = None
+
     def _extract_yml_value(self, line_content):
-        """YML 라인에서 값 부분만 추출 (최적화된 정규식 사용)"""
-        line_no_comment = line_content.split('#', 1)[0]
-        match = self.compiled_patterns['yml_value'].search(line_no_comment.rstrip())
-        if match:
-            return match.group(1)
-        return None
+        """YML 라인에서 값 부분만 추출 (값 안의 '#'/따옴표 포함, 라인별 분석 결과 캐시)"""
+        return lex_line_cached(line_content).value
 
     def _extract_yml_key(self, line_content):
-        """YML 라인에서 키(id) 부분 추출"""
-        line_no_comment = line_content.split('#', 1)[0]
-        if ':' in line_no_comment:
-            return line_no_comment.split(':', 1)[0].strip()
-        return None
+        """YML 라인에서 키(id) 부분 추출 (버전 번호 제외)"""
+        return lex_line_cached(line_content).key
+
+    def _replace_yml_value(self, line_content, new_value):
+        """YML 라인의 값 부분만 교체 (키, 주석, 줄바꿈은 그대로 유지)"""
+        return lex_line_cached(line_content).with_value(new_value)
 
     def validate_yml_file(self, file_path):
         """YML 파일의 구문 검증"""
         errors = []
         
         try:
-            with codecs.open(file_path, 'r', encoding='utf-8-sig') as f:
-                for line_num, line in enumerate(f, 1):
-                    # YML 구문 검증
-                    if ':' in line and not line.strip().startswith('#'):
-                        if line.count('"') % 2 != 0:
-                            errors.append(f"Line {line_num}: 따옴표 불일치")
-                        
-                        # 키 검증
-                        key = line.split(':', 1)[0].strip()
-                        if key and not re.match(r'^[a-zA-Z_][a-zA-Z0-9_\.]*$', key):
-                            errors.append(f"Line {line_num}: 잘못된 키 형식 '{key}'")
+            for record in read_yml_file(file_path):
+                line_num = record.index + 1
+                if record.kind == BROKEN:
+                    errors.append(f"Line {line_num}: 따옴표 불일치")
+
+                # 키 검증 (키 형식이 아니지만 ':'가 있는 라인 포함)
+                key = record.key
+                if record.kind == OTHER and ':' in record.text:
+                    key = record.text.split(':', 1)[0].strip()
+                if key and not self.compiled_patterns['valid_key'].match(key):
+                    errors.append(f"Line {line_num}: 잘못된 키 형식 '{key}'")
         except Exception as e:
             errors.append(f"파일 읽기 오류: {str(e)}")
         
         return errors
 
-    @lru_cache(maxsize=1000)
-    def _check_line_for_yml_errors_cached(self, line_hash):
-        """캐시된 YML 오류 검사"""
-        return None
-
     def _check_line_for_yml_errors_engine(self, full_line):
         """YML 라인의 정규식 오류 검사 - 개선된 버전"""
         if not full_line or not full_line.strip():
@@ -356,12 +470,11 @@ class TranslatorEngine:
         if ':' not in full_line:
             return False
         
-        # 캐시 확인 (스레드 안전)
-        line_hash = hash(full_line)
-        with self._cache_lock:
-            for cached_hash, result in self._regex_error_cache:
-                if cached_hash == line_hash:
-                    return result
+        # 캐시 확인 (라인 자체를 키로 사용)
+        cached_result = self._regex_error_cache.get(full_line)
+        if cached_result is not None:
+            return cached_result
+        line_key = full_line
         
         try:
             # 주석 제거 (따옴표 뒤의 주석 처리)
@@ -401,9 +514,8 @@ class TranslatorEngine:
                 if re.search(r':\s*"[^"]*$', full_line) and not re.search(r':\s*"[^"]*"\s*(?:#.*)?$', full_line):
                     has_error = True
             
-            # 캐시에 저장 (스레드 안전)
-            with self._cache_lock:
-                self._regex_error_cache.append((line_hash, has_error))
+            # 캐시에 저장
+            self._regex_error_cache.put(line_key, has_error)
             
             return has_error
         except Exception as e:
@@ -416,10 +528,9 @@ class TranslatorEngine:
             return False
         
         # 캐시 확인
-        cache_key = hash(value_text)
-        for cached_key, result in self._regex_error_cache:
-            if cached_key == cache_key:
-                return result
+        cached_result = self._value_error_cache.get(value_text)
+        if cached_result is not None:
+            return cached_result
         
         has_error = False
         
@@ -452,7 +563,7 @@ class TranslatorEngine:
             has_error = False
         
         # 캐시에 저장
-        self._regex_error_cache.append((cache_key, has_error))
+        self._value_error_cache.put(value_text, has_error)
         
         return has_error
 
@@ -461,203 +572,66 @@ class TranslatorEngine:
         result = self._check_line_for_yml_errors_engine(full_line)
         return result
 
-    def _check_source_remnants_optimized(self, value_text, original_lines, line_index):
-        """원본과 동일한 값이 번역 결과에 남아있는지 확인."""
-        if value_text is None or line_index >= len(original_lines):
-            return False
-
-        orig_value = self._extract_yml_value(original_lines[line_index])
-        if orig_value is None:
-            return False
-
-        return orig_value.strip() == value_text.strip()
-
     def _is_already_translated(self, text, target_lang):
         """텍스트가 이미 대상 언어로 번역되었는지 확인 - 개선된 로직"""
         if not text or not text.strip():
             return False
         
-        # 특수 코드 제거
-        cleaned_text = self._clean_text_for_language_detection(text)
-        if not cleaned_text.strip():
-            return False
-        
         # 캐시 확인
         source_lang = getattr(self, 'source_lang_for_api', 'English')
-        cache_key = (hash(text), target_lang, source_lang)
-        if hasattr(self, '_translation_check_cache'):
-            if cache_key in self._translation_check_cache:
-                return self._translation_check_cache[cache_key]
-        else:
-            self._translation_check_cache = {}
-        
-        # 원본 언어 감지
-        is_source_lang = self._detect_language(cleaned_text, source_lang)
-        # 대상 언어 감지
-        is_target_lang = self._detect_language(cleaned_text, target_lang)
+        cache_key = (text, target_lang, source_lang)
+        cached_result = self._translation_check_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
         
-        # 스킵 조건: 대상 언어이면서 원본 언어가 아닌 경우만
-        result = is_target_lang and not is_source_lang
+        # 스킵 조건: 특수 코드를 뺀 텍스트가 대상 언어이면서 원본 언어가 아닌 경우만
+        result = bool(classify_translated([text], source_lang, target_lang)[0])
         
-        # 캐시에 저장 (최대 10000개)
-        if len(self._translation_check_cache) < 10000:
-            self._translation_check_cache[cache_key] = result
+        # 캐시에 저장 (오래 쓰지 않은 항목부터 내보냄)
+        self._translation_check_cache.put(cache_key, result)
         
         return result
     
-    def _detect_language(self, text, lang):
-        """특정 언어가 텍스트에 포함되어 있는지 감지"""
-        if not text or not lang:
-            return False
-            
-        if lang == 'Korean':
-            return bool(re.search(r'[\uAC00-\uD7AF]', text))
-        elif lang == 'Japanese':
-            return bool(re.search(r'[\u3040-\u309F\u30A0-\u30FF]', text))
-        elif lang in ['Simplified Chinese', 'Traditional Chinese']:
-            return bool(re.search(r'[\u4E00-\u9FFF]', text))
-        elif lang == 'Russian':
-            return bool(re.search(r'[\u0400-\u04FF]', text))
-        elif lang == 'English':
-            # 영어는 다른 언어 문자가 없고 영어 단어가 있는 경우
-            has_other_lang = any([
-                re.search(r'[\uAC00-\uD7AF]', text),  # 한글
-                re.search(r'[\u3040-\u309F\u30A0-\u30FF]', text),  # 일본어
-                re.search(r'[\u4E00-\u9FFF]', text),  # 중국어
-                re.search(r'[\u0400-\u04FF]', text),  # 러시아어
-            ])
-            if has_other_lang:
-                return False
-            return bool(re.search(r'\b[a-zA-Z]{2,}\b', text))
-        else:
-            # 기타 언어는 간단한 패턴 체크
-            language_patterns = {
-                'French': r'[àâäçèéêëîïôùûüÿœæ]',
-                'German': r'[äöüßÄÖÜ]', 
-                'Spanish': r'[áéíóúñ¿¡]',
-                'Italian': r'[àèéìíîòóùú]',
-                'Portuguese': r'[àáâãçéêíóôõúü]',
-                'Polish': r'[ąćęłńóśźż]',
-                'Turkish': r'[çğıöşü]',
-                'Arabic': r'[\u0600-\u06FF]',
-                'Thai': r'[\u0E00-\u0E7F]',
-                'Vietnamese': r'[àáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]'
-            }
-            pattern = language_patterns.get(lang)
-            if pattern:
-                return bool(re.search(pattern, text, re.IGNORECASE))
-        
-        return False
-
-    def _calculate_batch_translation_ratio(self, text_batch):
-        """배치 내 대상 언어로 번역된 라인의 비율 계산"""
+    def _already_translated_flags(self, text_batch):
+        """배치 라인별로 이미 대상 언어로 번역됐는지 한 번에 분류 (값이 없는 라인은 None)"""
+        source_lang = getattr(self, 'source_lang_for_api', 'English')
+        target_lang = self.target_lang_for_api
+        values = [self._extract_yml_value(line) for line in text_batch]
+        flags = [None] * len(values)
+
+        # 캐시에 없는 값만 모아 한 번에 분류
+        pending_indices = []
+        for idx, value in enumerate(values):
+            if not value or not value.strip():
+                continue
+            cached_result = self._translation_check_cache.get((value, target_lang, source_lang))
+            if cached_result is None:
+                pending_indices.append(idx)
+            else:
+                flags[idx] = cached_result
+        if pending_indices:
+            results = classify_translated([values[idx] for idx in pending_indices], source_lang, target_lang)
+            for idx, result in zip(pending_indices, results):
+                flags[idx] = result
+                self._translation_check_cache.put((values[idx], target_lang, source_lang), result)
+        return flags
+
+    def _calculate_batch_translation_ratio(self, text_batch, flags=None):
+        """배치 내 대상 언어로 번역된 라인의 비율 계산 (값이 있는 라인만 셈)"""
         if not text_batch:
             return 0.0
-        
-        translated_count = 0
-        total_valuable_lines = 0
-        
-        for line in text_batch:
-            value = self._extract_yml_value(line)
-            if value and value.strip():  # 값이 있는 라인만 카운트
-                total_valuable_lines += 1
-                if self._is_already_translated(value, self.target_lang_for_api):
-                    translated_count += 1
-        
-        if total_valuable_lines == 0:
+        if flags is None:
+            flags = self._already_translated_flags(text_batch)
+        valuable_flags = [flag for flag in flags if flag is not None]
+        if not valuable_flags:
             return 0.0
-        
-        return translated_count / total_valuable_lines
-    
-    def _clean_text_for_language_detection(self, text):
-        """언어 감지를 위한 텍스트 정리"""
-        # 게임 특수 코드 제거
-        special_patterns = [
-            r'\$[^$]*\$',  # $variable$
-            r'\[[^\]]*\]',  # [variable]
-            r'§[A-Za-z0-9]',  # §Y 색상 코드
-            r'£[^£]*£',  # £gold£ 아이콘 코드
-            r'<[^>]*>',  # <tag>
-            r'\{[^}]*\}',  # {variable}
-            r'%[^%]*%',  # %variable%
-            r'#[A-Fa-f0-9]{6}',  # 색상 코드
-        ]
-        
-        cleaned = text
-        for pattern in special_patterns:
-            cleaned = re.sub(pattern, '', cleaned)
-        
-        # 연속된 공백 정리
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        
-        return cleaned
-    
-    def _is_english_translation(self, cleaned_text, language_patterns):
-        """영어 번역 여부 판단 - 개선된 로직"""
-        # 다른 언어 문자가 있으면 이미 번역된 것
-        for lang, pattern in language_patterns.items():
-            if lang != 'English' and re.search(pattern, cleaned_text):
-                return True
-        
-        # 순수 영어인지 확인
-        english_words = re.findall(r'\b[a-zA-Z]{2,}\b', cleaned_text)
-        if not english_words:
-            return False
-        
-        # 숫자나 기호만 있는 경우 번역 안된 것으로 판단
-        if re.match(r'^[\d\s\-+*/=<>().,!?:;%$€£¥]+$', cleaned_text):
-            return False
-        
-        # 영어 단어가 있고 다른 언어가 없으면, 소스 언어가 영어가 아닐 때만 번역된 것으로 판단
-        if hasattr(self, 'source_lang_for_api') and self.source_lang_for_api != 'English':
-            # 일반적인 영어 단어들이 있으면 번역된 것으로 판단
-            common_english_indicators = [
-                r'\b(the|and|or|in|on|at|to|for|of|with|by)\b',  # 전치사, 접속사
-                r'\b(is|are|was|were|have|has|will|would|can|could)\b',  # 동사
-                r'\b(this|that|these|those|what|when|where|why|how)\b',  # 의문사, 지시어
-            ]
-            
-            for indicator in common_english_indicators:
-                if re.search(indicator, cleaned_text, re.IGNORECASE):
-                    return True
-        
-        return False
+        return sum(valuable_flags) / len(valuable_flags)
 
-    def calculate_translation_quality(self, original, translated):
-        """번역 품질 점수 계산 - 다국어 지원 개선"""
-        score = 100
-        
-        # 길이 비율 체크
-        if original and len(original) > 0:
-            length_ratio = len(translated) / len(original)
-            if length_ratio < 0.3 or length_ratio > 3.0:
-                score -= 25
-            elif length_ratio < 0.5 or length_ratio > 2.0:
-                score -= 15
-        
-        # 특수 코드 보존 체크
-        original_codes = re.findall(r'[\$\[\]§£][^$\[\]§£]+[\$\[\]§£]', original)
-        translated_codes = re.findall(r'[\$\[\]§£][^$\[\]§£]+[\$\[\]§£]', translated)
-        if len(original_codes) != len(translated_codes):
-            score -= 30
-        
-        # 원본 언어 잔존 체크 (개선된 다국어 지원)
-        if hasattr(self, 'source_lang_for_api') and hasattr(self, 'target_lang_for_api'):
-            if self.source_lang_for_api != self.target_lang_for_api:
-                if self._check_source_language_remnants(translated, original, self.source_lang_for_api):
-                    score -= 40  # 원본 언어 잔존은 심각한 문제로 간주
-        
-        # 번역 완전성 체크 - 빈 번역이나 너무 짧은 번역
-        if not translated.strip():
-            score = 0
-        elif len(translated.strip()) < 2 and len(original.strip()) > 5:
-            score -= 30
-        
-        # 동일한 텍스트인 경우 (번역되지 않음)
-        if original.strip() == translated.strip() and len(original.strip()) > 3:
-            score -= 20
-        
-        return max(0, score)
+    def _assess_translation_quality(self, originals, translations):
+        """(원문 값, 번역 값) 쌍 목록을 한 번에 검사한 LineQuality 목록"""
+        if self.quality_checker is None:
+            self.quality_checker = BatchQualityChecker(self.source_lang_for_api, self.target_lang_for_api)
+        return self.quality_checker.assess(originals, translations)
 
     def create_auto_backup(self, output_file):
         """자동 백업 생성 (설정에 따라)"""
@@ -693,269 +667,336 @@ class TranslatorEngine:
                     pass
 
     def _is_valid_content_line(self, line):
-        """번역 대상이 되는 유효한 컨텐츠 라인인지 확인"""
-        if not line or not line.strip():
+        """번역 대상이 되는 유효한 컨텐츠 라인인지 확인 (언어 식별자, 주석, 빈 줄 제외)"""
+        if not line:
             return False
-        
-        stripped = line.strip()
-        
-        # 주석 라인 제외
-        if stripped.startswith('#'):
-            return False
-        
-        # 언어 식별자 라인 제외
-        if self.lang_identifier_pattern.match(line):
-            return False
-        
-        # 키-값 쌍이 있는 라인만 포함
-        if ':' in line:
-            # 값 부분에 따옴표가 있는지 확인
-            key_value_split = line.split(':', 1)
-            if len(key_value_split) > 1:
-                value_part = key_value_split[1]
-                if '"' in value_part:
-                    return True
-        
-        return False
+        return lex_line_cached(line).is_content
 
-    def _verify_translation_completeness(self, original_file_path, translated_file_path):
-        """번역 완료 후 검증 단계 - 언어 식별자, 주석, 빈 줄 무시"""
+    def _verify_translation_completeness(self, original_lines, translated_lines):
+        """번역 완료 후 검증 단계 - 메모리에 있는 원본/출력 라인의 키 비교 (언어 식별자, 주석, 빈 줄 무시)
+
+        누락된 키의 {키: 원본 라인 번호}를 반환합니다.
+        """
         try:
-            # 원본 파일의 유효 key-value 라인 파싱
-            with codecs.open(original_file_path, 'r', encoding='utf-8-sig') as f:
-                original_lines = f.readlines()
-            
-            original_keys = {}
-            original_line_nums = {}
-            valid_line_count = 0
-            
-            for idx, line in enumerate(original_lines):
+            translated_keys = set()
+            for line in translated_lines:
                 if self._is_valid_content_line(line):
                     key = self._extract_yml_key(line)
                     if key:
-                        original_keys[key] = (valid_line_count, line)
-                        original_line_nums[key] = idx
-                        valid_line_count += 1
-            
-            # 번역 파일의 유효 key-value 라인 파싱
-            with codecs.open(translated_file_path, 'r', encoding='utf-8-sig') as f:
-                translated_lines = f.readlines()
-            
-            translated_keys = {}
-            valid_line_count = 0
-            
-            for idx, line in enumerate(translated_lines):
+                        translated_keys.add(key)
+
+            original_keys = set()
+            missing_keys_info = {}
+            for idx, line in enumerate(original_lines):
                 if self._is_valid_content_line(line):
                     key = self._extract_yml_key(line)
                     if key:
-                        translated_keys[key] = (valid_line_count, line)
-                        valid_line_count += 1
-            
-            # 누락된 키 식별
-            missing_keys = set(original_keys.keys()) - set(translated_keys.keys())
-            
-            if missing_keys:
-                self.log_callback("log_missing_lines_detected", len(missing_keys), len(original_keys))
-                # 누락된 키들의 원본 라인 번호 추가
-                missing_keys_with_info = {}
-                for key in missing_keys:
-                    if key in original_line_nums:
-                        missing_keys_with_info[key] = original_line_nums[key]
-                return list(missing_keys), original_keys, original_lines, missing_keys_with_info
-            
-            return [], original_keys, original_lines, {}
-            
+                        original_keys.add(key)
+                        if key not in translated_keys:
+                            missing_keys_info[key] = idx
+
+            if missing_keys_info:
+                self.log_callback("log_missing_lines_detected", len(missing_keys_info), len(original_keys))
+            return missing_keys_info
+
         except Exception as e:
             self.log_callback("log_verification_error", str(e))
-            return [], {}, [], {}
+            return {}
 
-    def _retry_missing_translations(self, missing_keys, original_keys, original_lines, missing_keys_info, 
-                                   translated_file_path, max_retries=3):
-        """누락된 라인이 포함된 배치 전체를 재번역"""
+    def _retry_missing_translations(self, missing_keys_info, original_lines, translated_lines, header_count,
+                                    max_retries=3):
+        """누락된 라인만 배치로 묶어 재번역하고, 출력 라인에 한 번에 합친 목록 반환 (복구한 라인이 없으면 그대로)
+
+        파일을 마무리하는 워커 안에서 배치를 차례로 번역하므로 스케줄러의 동시 작업 수 제한을 넘지 않습니다.
+        """
+        missing_keys_info = dict(missing_keys_info)
+        recovered_lines = {}
         retry_count = 0
-        
-        while missing_keys and retry_count < max_retries:
+
+        while missing_keys_info and retry_count < max_retries and not self.stop_event.is_set():
             retry_count += 1
-            self.log_callback("log_retrying_missing_lines", len(missing_keys), retry_count)
-            
-            # 누락된 키를 포함하는 원본 라인 인덱스 수집
-            missing_line_indices = set()
-            for key in missing_keys:
-                if key in missing_keys_info:
-                    missing_line_indices.add(missing_keys_info[key])
-            
-            # 배치 단위로 재번역
-            batches_to_retry = {}
-            for idx in sorted(missing_line_indices):
-                batch_num = idx // self.batch_size
-                if batch_num not in batches_to_retry:
-                    batches_to_retry[batch_num] = []
-                batches_to_retry[batch_num].append(idx)
-            
-            # 번역 파일 읽기
-            with codecs.open(translated_file_path, 'r', encoding='utf-8-sig') as f:
-                all_translated_lines = f.readlines()
-            
-            # 각 배치 재번역
-            for batch_num, indices in batches_to_retry.items():
-                batch_start = batch_num * self.batch_size
-                batch_end = min(batch_start + self.batch_size, len(original_lines))
-                
-                # 배치에서 유효한 컨텐츠 라인만 추출
-                batch_lines = []
-                batch_indices = []
-                for i in range(batch_start, batch_end):
-                    if i < len(original_lines) and self._is_valid_content_line(original_lines[i]):
-                        batch_lines.append(original_lines[i])
-                        batch_indices.append(i)
-                
-                if not batch_lines:
-                    continue
-                
-                # 배치 전체 재번역 (온도 약간 상승)
-                new_temperature = min(self.temperature + (0.1 * retry_count), 1.0)
-                translated_batch = self._translate_batch_core(
-                    batch_lines, 
-                    temperature=new_temperature,
-                    retry=True
-                )
-                
-                # 번역 결과를 원본 파일 구조에 맞게 매핑
-                translated_dict = {}
-                for i, translated_line in enumerate(translated_batch):
-                    if i < len(batch_indices):
-                        original_idx = batch_indices[i]
-                        key = self._extract_yml_key(original_lines[original_idx])
-                        if key:
-                            translated_dict[key] = translated_line
-                
-                # 번역 파일 업데이트
-                updated_lines = []
-                for line in all_translated_lines:
-                    key = self._extract_yml_key(line)
-                    if key and key in translated_dict:
-                        updated_lines.append(translated_dict[key])
-                    else:
-                        updated_lines.append(line)
-                
-                # 파일 다시 저장
-                with codecs.open(translated_file_path, 'w', encoding='utf-8-sig') as f:
-                    f.writelines(updated_lines)
-                
-                all_translated_lines = updated_lines
-            
-            # 다시 검증
-            missing_keys, _, _, missing_keys_info = self._verify_translation_completeness(
-                original_file_path, translated_file_path
-            )
-            
-            if missing_keys:
+            self.log_callback("log_retrying_missing_lines", len(missing_keys_info), retry_count)
+
+            missing_indices = sorted(missing_keys_info.values())
+            batches_to_retry = [missing_indices[i:i + self.batch_size]
+                                for i in range(0, len(missing_indices), self.batch_size)]
+            # 재시도할수록 온도 약간 상승
+            new_temperature = min(self.temperature + (0.1 * retry_count), 1.0)
+
+            for batch_indices in batches_to_retry:
+                if self.stop_event.is_set():
+                    break
+                translated_batch = self._translate_batch_core([original_lines[idx] for idx in batch_indices],
+                                                              temperature=new_temperature, retry=True)
+                for original_idx, translated_line in zip(batch_indices, translated_batch):
+                    key = self._extract_yml_key(original_lines[original_idx])
+                    if self._is_valid_content_line(translated_line) and self._extract_yml_key(translated_line) == key:
+                        recovered_lines[original_idx] = translated_line
+                        missing_keys_info.pop(key, None)
+
+            if missing_keys_info:
                 time.sleep(min(self.adaptive_delay * 2, 0.5))  # 재시도 전 대기 시간 단축
-        
-        if missing_keys:
-            self.log_callback("log_failed_to_translate_all", len(missing_keys))
+
+        if missing_keys_info:
+            self.log_callback("log_failed_to_translate_all", len(missing_keys_info))
+        if not recovered_lines:
+            return translated_lines
+        return self._merge_recovered_lines(original_lines, translated_lines, recovered_lines, header_count)
+
+    def _merge_recovered_lines(self, original_lines, translated_lines, recovered_lines, header_count):
+        """재번역한 라인을 원본 순서상 바로 앞 키의 출력 라인 뒤에 끼워 넣음 (기존 출력 라인은 그대로 유지)"""
+        output_positions = {}
+        for idx, line in enumerate(translated_lines):
+            if self._is_valid_content_line(line):
+                key = self._extract_yml_key(line)
+                if key:
+                    output_positions[key] = idx
+
+        # 출력 라인 번호 -> 그 뒤에 넣을 라인 (-1은 파일 맨 앞)
+        insertions = {}
+        anchor = header_count - 1
+        for idx, line in enumerate(original_lines):
+            if idx in recovered_lines:
+                recovered = recovered_lines[idx]
+                insertions.setdefault(anchor, []).append(recovered if recovered.endswith('\n') else recovered + '\n')
+            elif self._is_valid_content_line(line):
+                anchor = output_positions.get(self._extract_yml_key(line), anchor)
+
+        merged_lines = list(insertions.get(-1, []))
+        for idx, line in enumerate(translated_lines):
+            if idx in insertions and not line.endswith('\n'):
+                line += '\n'
+            merged_lines.append(line)
+            merged_lines.extend(insertions.get(idx, []))
+        return merged_lines
+
+    def _write_output_lines(self, output_file, lines):
+        """출력 파일 전체를 임시 파일에 쓰고 한 번에 교체"""
+        temp_file = output_file + ".part"
+        with codecs.open(temp_file, 'w', encoding='utf-8-sig') as f:
+            f.writelines(lines)
+        os.replace(temp_file, output_file)
 
     def _translate_batch_core(self, text_batch, temperature=None, retry=False):
-        """배치 번역 핵심 로직 - 98% 임계값 기반 스킵 로직"""
+        """배치 번역 핵심 로직 - 98% 임계값 기반 스킵 로직 및 번역 메모리 조회"""
+        plan = self._plan_batch_translation(text_batch)
+        if plan is None:
+            return text_batch
+
+        try:
+            if plan['indices']:
+                lines_to_translate = [text_batch[idx] for idx in plan['indices']]
+                translated_lines = self._translate_batch_core_original(lines_to_translate, temperature, retry)
+                self._merge_planned_translation(plan, lines_to_translate, translated_lines)
+        finally:
+            # 대기 중인 다른 배치가 멈추지 않도록 예외가 나도 반드시 결과 전달
+            if plan['owned_values']:
+                self._resolve_owned_values(plan['owned_values'], text_batch, plan['final_result'])
+
+        if plan['waiting_lines']:
+            self._collect_shared_translations(plan['waiting_lines'], text_batch, plan['final_result'], temperature, retry)
+
+        return plan['final_result']
+
+    def _plan_batch_translation(self, text_batch):
+        """스킵/번역 메모리/중복 제거를 적용하고 API로 보낼 라인 계획 반환 (배치 전체 스킵이면 None)"""
+        # 라인별 API 번역 필요 여부
+        needs_translation = [True] * len(text_batch)
+
         # 기번역 라인 필터링
         if hasattr(self, 'skip_already_translated') and self.skip_already_translated:
-            # 배치의 번역 비율 계산
-            translation_ratio = self._calculate_batch_translation_ratio(text_batch)
+            # 배치의 번역 비율 계산 (라인별 분류는 한 번만 하고 아래에서 재사용)
+            translated_flags = self._already_translated_flags(text_batch)
+            translation_ratio = self._calculate_batch_translation_ratio(text_batch, translated_flags)
             
             # 98% 이상이 이미 번역되어 있으면 배치 전체 건너뛰기
             if translation_ratio >= 0.98:
                 self.log_callback("log_batch_skip_high_ratio", 
                                 self._get_current_file_for_log(), 
                                 f"{translation_ratio*100:.1f}%")
-                return text_batch
+                return None
             
             # 98% 미만이면 라인별 검사
             elif translation_ratio > 0:
-                lines_to_translate = []
-                line_mapping = []  # 원본 인덱스 매핑
-                
-                for idx, line in enumerate(text_batch):
-                    value = self._extract_yml_value(line)
-                    
-                    if not value:
-                        # 값이 없는 라인은 그대로 포함
-                        lines_to_translate.append(line)
-                        line_mapping.append((idx, True))  # True = 번역 필요
-                    elif self._is_already_translated(value, self.target_lang_for_api):
-                        # 이미 번역된 라인은 매핑만 저장
-                        line_mapping.append((idx, False))  # False = 번역 불필요
-                    else:
-                        # 번역 필요한 라인만 추가
-                        lines_to_translate.append(line)
-                        line_mapping.append((idx, True))
+                for idx, already_translated in enumerate(translated_flags):
+                    # 값이 없는 라인은 그대로 포함, 이미 번역된 라인만 제외
+                    if already_translated:
+                        needs_translation[idx] = False
                 
                 # 번역할 라인이 없으면 원본 반환
-                if not any(need_translate for _, need_translate in line_mapping if need_translate):
-                    return text_batch
+                if not any(needs_translation):
+                    return None
                 
                 # 선별된 라인만 번역
                 self.log_callback("log_batch_selective_translation", 
-                                len(lines_to_translate), 
+                                sum(needs_translation), 
                                 len(text_batch))
-                
-                translated_lines = self._translate_batch_core_original(lines_to_translate, temperature, retry)
-                
-                # 결과 병합
-                final_result = []
-                translated_idx = 0
-                
-                for idx, (original_idx, need_translate) in enumerate(line_mapping):
-                    if need_translate:
-                        # 번역된 라인 사용
-                        if translated_idx < len(translated_lines):
-                            final_result.append(translated_lines[translated_idx])
-                            translated_idx += 1
-                        else:
-                            # 번역 실패 시 원본 사용
-                            final_result.append(text_batch[original_idx])
-                    else:
-                        # 이미 번역된 라인은 원본 그대로
-                        final_result.append(text_batch[original_idx])
-                
-                return final_result
-        
-        # 기번역 건너뛰기 비활성화 시 기존 로직 사용
-        return self._translate_batch_core_original(text_batch, temperature, retry)
+
+        final_result = list(text_batch)
+
+        # 번역 메모리 조회 - 적중한 라인은 API 호출 없이 채움
+        if self.use_translation_memory and self.translation_memory_fingerprint:
+            self._apply_translation_memory(text_batch, needs_translation, final_result)
+
+        # 실행 단위 중복 제거 - 다른 배치가 이미 번역했거나 번역 중인 값은 결과를 공유
+        owned_values, waiting_lines = {}, {}
+        if self.run_deduplicator is not None:
+            owned_values, waiting_lines = self._apply_run_deduplication(text_batch, needs_translation, final_result)
+
+        indices_to_translate = [idx for idx, need in enumerate(needs_translation) if need]
+        if len(indices_to_translate) < len(text_batch) and \
+                not any(self._extract_yml_value(text_batch[idx]) for idx in indices_to_translate):
+            # 남은 라인이 주석/빈 줄뿐이면 API 호출 생략
+            indices_to_translate = []
+
+        return {
+            'final_result': final_result,
+            'indices': indices_to_translate,
+            'owned_values': owned_values,
+            'waiting_lines': waiting_lines
+        }
+
+    def _merge_planned_translation(self, plan, lines_to_translate, translated_lines):
+        """API 번역 결과를 계획된 위치에 병합 (번역 메모리 저장은 검증을 통과한 값만 _accept_translated_values에서)"""
+        self._merge_translated_lines(plan['indices'], translated_lines, plan['final_result'])
+
+    def _merge_translated_lines(self, indices, translated_lines, final_result):
+        """결과 병합 (번역 실패로 결과가 부족하면 원본 유지)"""
+        for position, original_idx in enumerate(indices):
+            if position < len(translated_lines):
+                final_result[original_idx] = translated_lines[position]
+
+    def _is_reusable_translation(self, original_value, translated_value):
+        """다른 라인/실행에서 재사용해도 되는 번역 결과인지 확인"""
+        if not original_value or not translated_value or original_value == translated_value:
+            return False
+        return not self._check_regex_errors_optimized(translated_value)
+
+    def _apply_run_deduplication(self, text_batch, needs_translation, final_result):
+        """반복 값의 번역 상태를 확인하여 (직접 번역할 값, 대기할 라인) 반환"""
+        owned_values = {}    # 원문 값 -> 이 배치에서의 라인 인덱스
+        waiting_lines = {}   # 라인 인덱스 -> (원문 값, Future)
+
+        for idx, line in enumerate(text_batch):
+            if not needs_translation[idx]:
+                continue
+            value = self._extract_yml_value(line)
+            if not value or not self.run_deduplicator.is_shared(value):
+                continue
+
+            state, payload = self.run_deduplicator.acquire(value)
+            if state == 'owner':
+                owned_values[value] = idx
+                continue
+
+            needs_translation[idx] = False
+            if state == 'done':
+                new_line = self._replace_yml_value(line, payload)
+                if new_line is not None:
+                    final_result[idx] = new_line
+            else:
+                waiting_lines[idx] = (value, payload)
+
+        return owned_values, waiting_lines
+
+    def _resolve_owned_values(self, owned_values, text_batch, final_result):
+        """이 배치가 맡은 반복 값의 번역 결과를 공유 (실패 시 None)"""
+        for value, idx in owned_values.items():
+            translated_value = self._extract_yml_value(final_result[idx])
+            if final_result[idx] == text_batch[idx] or not self._is_reusable_translation(value, translated_value):
+                translated_value = None
+            self.run_deduplicator.resolve(value, translated_value)
+
+    def _collect_shared_translations(self, waiting_lines, text_batch, final_result, temperature, retry):
+        """다른 배치의 번역 결과를 받아 채우고, 실패한 값은 이 배치에서 다시 번역"""
+        shared_results = {idx: self._wait_for_shared_translation(future)
+                          for idx, (value, future) in waiting_lines.items()}
+        fallback_indices = self._apply_shared_translations(shared_results, text_batch, final_result)
+
+        if fallback_indices and not self.stop_event.is_set():
+            fallback_lines = [text_batch[idx] for idx in fallback_indices]
+            translated_lines = self._translate_batch_core_original(fallback_lines, temperature, retry)
+            self._merge_translated_lines(fallback_indices, translated_lines, final_result)
+
+    def _apply_shared_translations(self, shared_results, text_batch, final_result):
+        """공유받은 번역을 이 라인의 코드/숫자로 채우고, 채우지 못해 다시 번역해야 할 라인 인덱스 반환"""
+        fallback_indices = []
+        for idx, shared in shared_results.items():
+            new_line = None
+            translated_value = RunDeduplicator.instantiate(self._extract_yml_value(text_batch[idx]), shared)
+            if translated_value is not None:
+                new_line = self._replace_yml_value(text_batch[idx], translated_value)
+            if new_line is None:
+                fallback_indices.append(idx)
+            else:
+                final_result[idx] = new_line
+        return fallback_indices
+
+    def _wait_for_shared_translation(self, future):
+        """공유 번역 결과 대기 (중지 요청 시 None)"""
+        while True:
+            try:
+                return future.result(timeout=0.5)
+            except concurrent.futures.TimeoutError:
+                if self.stop_event.is_set():
+                    return None
+
+    def _apply_translation_memory(self, text_batch, needs_translation, final_result):
+        """번역 메모리 적중 라인을 final_result에 채우고 적중 수 반환"""
+        candidates = {}
+        for idx, line in enumerate(text_batch):
+            if not needs_translation[idx]:
+                continue
+            value = self._extract_yml_value(line)
+            if value and value.strip():
+                candidates[idx] = value
+        if not candidates:
+            return 0
+
+        try:
+            hits = self.translation_memory.lookup_many(list(candidates.values()),
+                                                       self.translation_memory_fingerprint)
+        except Exception as e:
+            self.log_callback("log_tm_error", str(e))
+            return 0
+
+        hit_count = 0
+        for idx, value in candidates.items():
+            if value not in hits:
+                continue
+            new_line = self._replace_yml_value(text_batch[idx], hits[value])
+            if new_line is not None:
+                final_result[idx] = new_line
+                needs_translation[idx] = False
+                hit_count += 1
+
+        if hit_count:
+            self.log_callback("log_tm_batch_hits", self._get_current_file_for_log(), hit_count, len(text_batch))
+        return hit_count
+
+    def _store_translation_memory(self, pairs):
+        """검증을 모두 통과한 (원문 값, 번역 값) 쌍을 번역 메모리에 저장"""
+        if not pairs or not (self.use_translation_memory and self.translation_memory_fingerprint):
+            return
+        try:
+            self.translation_memory.store_many(pairs, self.translation_memory_fingerprint)
+        except Exception as e:
+            self.log_callback("log_tm_error", str(e))
     
     def _translate_batch_core_original(self, text_batch, temperature=None, retry=False):
-        """실제 번역 수행 - 디버그 로그 제거 버전"""
-        retry_count = 0
-        max_retries = getattr(self, 'max_retries', 3)
-        
-        batch_start_time = time.time()
-        
-        while retry_count <= max_retries:
-            # 번역할 텍스트만 추출
-            batch_text_content = "\n".join([line.rstrip('\n') for line in text_batch])
-            
-            if temperature is None:
-                temperature = self.temperature
-            
-            # 프롬프트 준비
+        """실제 번역 수행 - 응답/오류 해석 결과에 따라 재시도 또는 분할"""
+        state = self._new_translation_state(temperature)
+        request_batch = self._mask_translation_batch(text_batch, state)
+        if not self._encode_request_payload(request_batch, state):
+            return text_batch
+
+        while state['retry_count'] <= state['max_retries']:
+            # 재시도 시에는 아직 결과를 받지 못한 id만 다시 요청
+            payload_lines = self._pending_payload_lines(state)
             try:
-                if hasattr(self, 'selected_game') and self.selected_game and self.selected_game != "None":
-                    try:
-                        enhanced_prompt = get_enhanced_prompt(self.selected_game, self.prompt_template_str)
-                    except Exception as e:
-                        self.log_callback("log_game_prompt_error", str(e))
-                        enhanced_prompt = self.prompt_template_str
-                else:
-                    enhanced_prompt = self.prompt_template_str
-                
-                final_prompt = enhanced_prompt.format(
-                    source_lang_for_prompt=self.source_lang_for_api,
-                    target_lang_for_prompt=self.target_lang_for_api,
-                    glossary_section=self.glossary_str_for_prompt if self.glossary_str_for_prompt else "",
-                    batch_text=batch_text_content
-                )
-                
+                final_prompt = self._build_translation_prompt(payload_lines, state['json_response'])
             except KeyError as e:
-                self.log_callback("log_batch_unknown_error", self._get_current_file_for_log(), 
+                self.log_callback("log_batch_unknown_error", self._get_current_file_for_log(),
                             f"Prompt formatting error (KeyError: {e}).")
                 return text_batch
 
@@ -963,320 +1004,467 @@ class TranslatorEngine:
                 if self.stop_event.is_set():
                     return text_batch
 
+                # 전역 속도 제한 - 예산이 생길 때까지 대기
+                reserved_tokens = self._estimate_request_tokens(final_prompt, payload_lines)
+                if not self._acquire_rate_limit(reserved_tokens):
+                    return text_batch
+
                 # API 호출
+                self._refresh_prompt_cache()
                 response = self.model.generate_content(
                     final_prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=temperature,
-                        max_output_tokens=self.max_tokens,
-                        top_k=40,
-                        top_p=0.95
-                    )
+                    generation_config=self._build_generation_config(state['temperature'], payload_lines, state)
                 )
-                
-                translated_text = ""
-                finish_reason_val = 0
-                candidate = None
-
-                if response.candidates:
-                    candidate = response.candidates[0]
-                    if candidate.content and candidate.content.parts:
-                        translated_text = "".join(part.text for part in candidate.content.parts if hasattr(part, 'text'))
-                    if hasattr(candidate, 'finish_reason'):
-                        finish_reason_val = candidate.finish_reason
-                elif hasattr(response, 'text') and response.text: 
-                    translated_text = response.text
-
-                if response.prompt_feedback and response.prompt_feedback.block_reason:
-                    self.log_callback("log_batch_prompt_blocked", self._get_current_file_for_log(), 
-                                response.prompt_feedback.block_reason)
-                    return text_batch
-
-                # 응답 처리
-                if finish_reason_val not in [0, 1]:
-                    if finish_reason_val == 2:  # 토큰 한계
-                        self.log_callback("log_batch_token_limit", self._get_current_file_for_log(), 
-                                    finish_reason_val)
-                        if len(text_batch) > 1:
-                            mid = len(text_batch) // 2
-                            first_half = self._translate_batch_core(text_batch[:mid], temperature)
-                            if self.stop_event.is_set(): 
-                                return text_batch
-                            second_half = self._translate_batch_core(text_batch[mid:], temperature)
-                            return first_half + second_half
-                        else:
-                            return text_batch
-                    else:
-                        return text_batch
-
-                if not translated_text.strip():
-                    self.log_callback("log_batch_empty_response", self._get_current_file_for_log())
-                    return text_batch
-
-                # 코드 블록 제거
-                translated_text = re.sub(r'```(yaml|yml)?\n?', '', translated_text, flags=re.IGNORECASE)
-                translated_text = re.sub(r'\n?```', '', translated_text)
-
-                translated_lines_raw = translated_text.split('\n')
-                
-                # 라인 수 차이 처리
-                line_diff = abs(len(translated_lines_raw) - len(text_batch))
-                
-                # 공백 라인만 제거한 후 비교
-                non_empty_original = [line for line in text_batch if line.strip()]
-                non_empty_translated = [line for line in translated_lines_raw if line.strip()]
-                
-                # 공백 라인을 제외한 실제 컨텐츠 라인 수가 같거나 1줄 차이면 OK
-                content_line_diff = abs(len(non_empty_translated) - len(non_empty_original))
-                
-                if content_line_diff <= 1 or line_diff <= 1:
-                    # 라인 매칭 로직
-                    final_result = []
-                    translated_idx = 0
-                    
-                    for i in range(len(text_batch)):
-                        original_line = text_batch[i]
-                        
-                        # 번역된 라인이 있으면 사용
-                        if translated_idx < len(translated_lines_raw):
-                            translated_line = translated_lines_raw[translated_idx]
-                            translated_idx += 1
-                        else:
-                            # 번역된 라인이 부족하면 원본 사용
-                            translated_line = original_line
-                        
-                        # 원본이 빈 라인이고 번역도 빈 라인이면 OK
-                        if not original_line.strip() and not translated_line.strip():
-                            final_result.append(original_line)
-                            continue
-                        
-                        # 원본 라인에서 키와 따옴표까지 추출
-                        original_match = re.match(r'^(\s*[^:]+:\s*)"', original_line)
-                        translated_match = re.match(r'^(\s*[^:]+:\s*)"', translated_line)
-                        
-                        # 만약 번역된 라인에 키가 없다면, 원본 키를 사용
-                        if original_match and not translated_match:
-                            key_part = original_match.group(1)
-                            # 번역된 라인이 따옴표로 시작하지 않으면 추가
-                            if translated_line.strip() and not translated_line.strip().startswith('"'):
-                                translated_line = f'{key_part}"{translated_line.strip()}"'
-                            else:
-                                translated_line = key_part + translated_line.strip()
-                        
-                        # 줄바꿈 처리
-                        if original_line.endswith('\n') and not translated_line.endswith('\n'):
-                            translated_line += '\n'
-                        elif not original_line.endswith('\n') and translated_line.endswith('\n'):
-                            translated_line = translated_line.rstrip('\n')
-                        
-                        final_result.append(translated_line)
-                    
-                    # 번역 품질 검증 및 원본 언어 잔존 검사
-                    translated_count = 0
-                    source_remnant_count = 0
-                    
-                    for i in range(len(final_result)):
-                        if i >= len(text_batch):
-                            continue
-                            
-                        original_line = text_batch[i]
-                        translated_line = final_result[i]
-                        
-                        # 실제로 번역되었는지 확인
-                        original_value = self._extract_yml_value(original_line)
-                        translated_value = self._extract_yml_value(translated_line)
-                        
-                        if original_value and translated_value:
-                            if original_value != translated_value:
-                                translated_count += 1
-                                
-                                # 원본 언어 잔존 검사
-                                if self.source_lang_for_api != self.target_lang_for_api:
-                                    if self._check_source_language_remnants(translated_value, original_value, self.source_lang_for_api):
-                                        source_remnant_count += 1
-                                
-                                # Live Preview 콜백
-                                if self.preview_callback:
-                                    try:
-                                        score = self.calculate_translation_quality(original_value, translated_value)
-                                        has_error = self._check_regex_errors_optimized(translated_value)
-                                        self.preview_callback(original_value, translated_value, score, has_error)
-                                    except Exception as e:
-                                        pass
-                                
-                                # 통계 수집
-                                if hasattr(self, 'current_file_stats'):
-                                    score = self.calculate_translation_quality(original_value, translated_value)
-                                    self.current_file_stats.setdefault('batch_qualities', []).append(score)
-                    
-                    # 원본 언어가 너무 많이 남아있으면 재시도
-                    source_remnant_threshold = 0.1 if retry_count == 0 else 0.05
-                    if source_remnant_count > len(text_batch) * source_remnant_threshold:
-                        retry_count += 1
-                        if retry_count <= max_retries:
-                            self.log_callback("log_batch_retry_source_remnants", 
-                                        source_remnant_count, 
-                                        len(text_batch),
-                                        retry_count, 
-                                        max_retries)
-                            
-                            temperature = min(temperature + (0.2 * retry_count), 1.0)
-                            time.sleep(min(self.adaptive_delay * 3, 1.0))
-                            continue
-                    
-                    # 배치 시간 기록
-                    batch_time = time.time() - batch_start_time
-                    if hasattr(self, 'current_file_stats'):
-                        self.current_file_stats.setdefault('batch_times', []).append(batch_time)
-                    
-                    return final_result
-                
-                # 라인 수 차이가 크면 재시도
-                retry_count += 1
-                if retry_count <= max_retries:
-                    self.log_callback("log_batch_retry_due_to_mismatch", 
-                                self._get_current_file_for_log(), 
-                                len(text_batch), 
-                                len(translated_lines_raw), 
-                                retry_count, 
-                                max_retries)
-                    temperature = min(temperature + 0.1, 1.0)
-                    time.sleep(min(self.adaptive_delay * 2, 0.5))
-                    continue
+                self._settle_rate_limit(response, reserved_tokens)
+                action, payload = self._interpret_translation_response(text_batch, response, state)
 
             except Exception as e:
                 if self.stop_event.is_set():
                     return text_batch
-                
-                error_str = str(e).lower()
-                # API 한계 에러 처리
-                if ("token" in error_str and ("limit" in error_str or "exceeded" in error_str)) or \
-                ("429" in error_str) or ("resource has been exhausted" in error_str):
-                    self.log_callback("log_batch_api_limit_error_split", self._get_current_file_for_log(), str(e))
-                    if len(text_batch) > 1:
-                        mid = len(text_batch) // 2
-                        first_half = self._translate_batch_core(text_batch[:mid], temperature)
-                        if self.stop_event.is_set(): 
-                            return text_batch
-                        second_half = self._translate_batch_core(text_batch[mid:], temperature)
-                        return first_half + second_half
-                    else:
-                        return text_batch
-                
-                # 일반 오류 재시도
-                retry_count += 1
-                if retry_count <= max_retries:
-                    self.log_callback("log_batch_retrying", self._get_current_file_for_log(), str(e))
-                    time.sleep(min(self.adaptive_delay * 2, 0.5))
-                    temperature = min(temperature + 0.1, 1.0)
-                    continue
-                else:
-                    self.log_callback("log_batch_unknown_error", self._get_current_file_for_log(), str(e))
+                action, payload = self._interpret_translation_error(text_batch, e, state)
+
+            if action == 'done':
+                return payload
+            if action == 'split':
+                mid = len(text_batch) // 2
+                first_half = self._translate_batch_core_original(text_batch[:mid], state['temperature'])
+                if self.stop_event.is_set():
                     return text_batch
-        
-        # 최대 재시도 횟수 초과
-        self.log_callback("log_batch_max_retries_exceeded", self._get_current_file_for_log(), max_retries)
-        return text_batch
-
-    def _check_source_language_remnants(self, translated_value, original_value, source_lang):
-        """번역된 텍스트에 원본 언어가 남아있는지 검사"""
-        # 특수 코드 패턴 (이들은 번역하면 안됨)
-        special_patterns = [
-            r'\$[^$]+\$',  # $variable$
-            r'\[[^\]]+\]',  # [variable]
-            r'§[A-Z]',      # §Y 같은 색상 코드
-            r'£[^£]+£',     # £gold£ 같은 아이콘 코드
-            r'<[^>]+>',     # <tag>
-            r'\{[^}]+\}',   # {variable}
-        ]
-        
-        # 특수 패턴을 모두 제거한 텍스트
-        cleaned_translated = translated_value
-        cleaned_original = original_value
-        
-        for pattern in special_patterns:
-            cleaned_translated = re.sub(pattern, '', cleaned_translated)
-            cleaned_original = re.sub(pattern, '', cleaned_original)
-        
-        # 언어별 단어 패턴 정의 - 개선된 버전
-        language_patterns = {
-            'English': r'\b[a-zA-Z]{3,}\b',
-            'Korean': r'[\uAC00-\uD7AF]+',
-            'Japanese': r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+',
-            'Simplified Chinese': r'[\u4E00-\u9FFF]+',
-            'Traditional Chinese': r'[\u4E00-\u9FFF]+',
-            'Russian': r'[\u0400-\u04FF]+',
-            'French': r'\b[a-zA-Z\u00C0-\u017FàâäçèéêëîïôùûüÿœæÀÂÄÇÈÉÊËÎÏÔÙÛÜŸŒÆ]{3,}\b',
-            'German': r'\b[a-zA-Z\u00C0-\u017FäöüßÄÖÜ]{3,}\b',
-            'Spanish': r'\b[a-zA-Z\u00C0-\u017FáéíóúñÁÉÍÓÚÑüÜ]{3,}\b',
-            'Italian': r'\b[a-zA-Z\u00C0-\u017FàèéìíîòóùúÀÈÉÌÍÎÒÓÙÚ]{3,}\b',
-            'Portuguese': r'\b[a-zA-Z\u00C0-\u017FàáâãçéêíóôõúüÀÁÂÃÇÉÊÍÓÔÕÚÜ]{3,}\b',
-            'Polish': r'\b[a-zA-Z\u0100-\u017FąćęłńóśźżĄĆĘŁŃÓŚŹŻ]{3,}\b',
-            'Turkish': r'\b[a-zA-ZçğıöşüÇĞIİÖŞÜ]{3,}\b',
-            'Arabic': r'[\u0600-\u06FF]+',
-            'Hebrew': r'[\u0590-\u05FF]+',
-            'Thai': r'[\u0E00-\u0E7F]+',
-            'Vietnamese': r'\b[a-zA-ZàáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđÀÁẠẢÃÂẦẤẬẨẪĂẰẮẶẲẴÈÉẸẺẼÊỀẾỆỂỄÌÍỊỈĨÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠÙÚỤỦŨƯỪỨỰỬỮỲÝỴỶỸĐ]{2,}\b'
+                second_half = self._translate_batch_core_original(text_batch[mid:], state['temperature'])
+                return first_half + second_half
+            if action == 'retry':
+                if payload:
+                    time.sleep(payload)
+                continue
+            if action == 'exhausted':
+                break
+            return self._salvaged_translation_result(text_batch, state)
+
+        # 최대 재시도 횟수 초과 - 이미 받은 id의 결과는 유지
+        self.log_callback("log_batch_max_retries_exceeded", self._get_current_file_for_log(), state['max_retries'])
+        return self._salvaged_translation_result(text_batch, state)
+
+    def _new_translation_state(self, temperature=None):
+        """배치 하나의 재시도 상태 (동기/비동기 엔진 공용)"""
+        return {
+            'retry_count': 0,
+            'max_retries': getattr(self, 'max_retries', 3),
+            'temperature': self.temperature if temperature is None else temperature,
+            'start_time': time.time()
         }
-        
-        # 원본 언어의 패턴 가져오기
-        source_pattern = language_patterns.get(source_lang, r'\b[a-zA-Z]{3,}\b')
-        
-        # 번역된 텍스트에서 원본 언어 단어 찾기
-        translated_source_words = set(re.findall(source_pattern, cleaned_translated, re.IGNORECASE))
-        original_source_words = set(re.findall(source_pattern, cleaned_original, re.IGNORECASE))
-        
-        # 대소문자 무시하고 비교
-        translated_source_words_lower = {word.lower() for word in translated_source_words}
-        original_source_words_lower = {word.lower() for word in original_source_words}
-        
-        # 원본에 있던 단어가 번역 후에도 남아있는지 확인
-        common_words = translated_source_words_lower.intersection(original_source_words_lower)
-        
-        # 언어별 허용 단어들 정의 - 게임에서 공통으로 사용되는 용어들
-        common_allowed_words = {
-            'English': {'ok', 'yes', 'no', 'id', 'hp', 'mp', 'exp', 'lv', 'level', 'max', 'min', 'fps', 'ui', 'ai', 'cpu', 'gpu', 'ram', 'dps', 'aoe', 'rpg', 'mmo', 'pvp', 'pve', 'dlc', 'mod', 'beta', 'alpha'},
-            'Korean': set(),  # 한국어는 일반적으로 허용할 단어가 적음
-            'Japanese': set(),
-            'Simplified Chinese': set(),
-            'Traditional Chinese': set(),
-            'Russian': {'ok', 'id', 'max', 'min'},
-            'French': {'ok', 'id', 'max', 'min', 'fps', 'dps', 'pvp', 'pve', 'dlc', 'mod'},
-            'German': {'ok', 'id', 'max', 'min', 'fps', 'dps', 'pvp', 'pve', 'dlc', 'mod'},
-            'Spanish': {'ok', 'id', 'max', 'min', 'fps', 'dps', 'pvp', 'pve', 'dlc', 'mod'},
-            'Italian': {'ok', 'id', 'max', 'min', 'fps', 'dps', 'pvp', 'pve', 'dlc', 'mod'},
-            'Portuguese': {'ok', 'id', 'max', 'min', 'fps', 'dps', 'pvp', 'pve', 'dlc', 'mod'},
-            'Polish': {'ok', 'id', 'max', 'min', 'fps', 'dps', 'pvp', 'pve', 'dlc', 'mod'},
-            'Turkish': {'ok', 'id', 'max', 'min'},
-            'Arabic': set(),
-            'Hebrew': set(),
-            'Thai': set(),
-            'Vietnamese': {'ok', 'id', 'max', 'min'}
-        }
-        
-        allowed_words = common_allowed_words.get(source_lang, set())
-        common_words = common_words - allowed_words
-        
-        # 원본 단어의 30% 이상이 남아있으면 번역 실패로 간주
-        if original_source_words_lower and len(common_words) > len(original_source_words_lower) * 0.3:
-            return True
-        
-        # 연속된 원본 언어 구문이 그대로 남아있는지 확인
-        if source_lang == 'English':
-            phrase_pattern = r'\b[a-zA-Z]+(?:\s+[a-zA-Z]+){2,}\b'  # 3개 이상의 연속된 영어 단어
-        elif source_lang in ['Korean', 'Japanese', 'Simplified Chinese']:
-            # 아시아 언어는 공백 없이 연결되므로 다른 패턴 사용
-            phrase_pattern = language_patterns[source_lang]
+
+    def _mask_translation_batch(self, text_batch, state):
+        """게임 코드를 토큰으로 바꾼 요청용 배치 반환 (라인별 코드 목록은 state에 보관)"""
+        state['placeholder_codes'] = [None] * len(text_batch)
+        if not self.mask_placeholders:
+            return text_batch
+
+        request_batch = []
+        for i, line in enumerate(text_batch):
+            parts = split_yml_entry(line)
+            masked_value, codes = self.placeholder_masker.mask(parts[1]) if parts else (None, None)
+            if not codes:
+                request_batch.append(line)
+                continue
+            state['placeholder_codes'][i] = codes
+            request_batch.append(f'{parts[0]}"{masked_value}"{parts[2]}')
+        return request_batch
+
+    def _encode_request_payload(self, request_batch, state):
+        """API로 보낼 라인 반환 - 값만 전송/JSON 응답 모드면 '<id>: "값"' 라인, 아니면 키를 포함한 원본 라인"""
+        state['json_response'] = bool(self.use_json_response)
+        state['accepted_values'] = {}
+        state['candidate_values'] = {}
+        state['glossary_fixed'] = {}
+        state['line_quality'] = {}  # 라인 인덱스 -> (검사한 번역 값, LineQuality)
+        state['memory_pairs'] = {}  # id -> (원문 값, 번역 값) - 잔존/용어집/품질 검사를 모두 통과한 값만
+        state['pending_ids'] = []
+        if self.use_values_only_payload or self.use_json_response:
+            state['payload'] = ValuesPayload(request_batch)
         else:
-            # 기타 유럽 언어
-            phrase_pattern = r'\b[a-zA-Z]+(?:\s+[a-zA-Z]+){2,}\b'
-        
-        original_phrases = re.findall(phrase_pattern, cleaned_original, re.IGNORECASE)
-        for phrase in original_phrases:
-            if len(phrase) > 10 and phrase.lower() in cleaned_translated.lower():  # 10글자 이상의 긴 구문만 체크
-                return True
-        
-        return False
+            state['payload'] = RawLinesPayload(request_batch)
+        return state['payload'].lines
+
+    def _pending_payload_lines(self, state):
+        """이번 요청에 보낼 라인 (아직 검증을 통과하지 못한 id만)"""
+        payload = state['payload']
+        state['pending_ids'] = [line_id for line_id in payload.entries if line_id not in state['accepted_values']]
+        return payload.pending_lines(state['accepted_values'])
+
+    def _salvaged_translation_result(self, text_batch, state):
+        """검증을 통과한 값(재시도를 모두 실패한 라인은 마지막 번역 후보)만 반영한 라인 반환"""
+        payload = state.get('payload')
+        if payload is None:
+            return text_batch
+        values = dict(state.get('candidate_values') or {})
+        values.update(state.get('accepted_values') or {})
+        if not values:
+            return text_batch
+        fixed_count = sum(state['glossary_fixed'].get(line_id, 0) for line_id in values)
+        if fixed_count:
+            self._add_file_stat('glossary_fixed', fixed_count)
+        result = list(text_batch)
+        for line_id, value in values.items():
+            result[payload.entries[line_id][0]] = payload.rebuild_line(line_id, value)
+        # 검증을 통과했지만 원문과 같은 값(고유명사 등)은 매니페스트에 완료로 기록하도록 파일 통계에 모음
+        unchanged_values = [value for line_id, value in state['accepted_values'].items()
+                            if value == self._extract_yml_value(text_batch[payload.entries[line_id][0]])]
+        file_stats = self._get_current_file_stats()
+        if unchanged_values and file_stats is not None:
+            with self._stats_lock:
+                file_stats.setdefault('accepted_unchanged', set()).update(unchanged_values)
+        return result
+
+    def _build_translation_prompt(self, text_batch, json_response=False):
+        """배치 프롬프트 생성 - 고정 부분은 시스템 지시로 보내므로 배치 부분만 반환 (형식 오류 시 KeyError)"""
+        batch_text_content = "\n".join([line.rstrip('\n') for line in text_batch])
+        if self.glossary_index is not None:
+            glossary_entries = self.glossary_index.find_entries(batch_text_content)
+            with self._stats_lock:
+                self._glossary_injection_stats['requests'] += 1
+                self._glossary_injection_stats['entries'] += len(glossary_entries)
+            glossary_section = format_glossary_section(glossary_entries)
+        else:
+            glossary_section = self.glossary_str_for_prompt if self.glossary_str_for_prompt else ""
+        if self.prompt_builder is not None:
+            return self.prompt_builder.build_request(batch_text_content,
+                                                     glossary_section if self.glossary_index is not None else "")
+
+        final_prompt = self._get_prompt_template().format(
+            source_lang_for_prompt=self.source_lang_for_api,
+            target_lang_for_prompt=self.target_lang_for_api,
+            glossary_section=glossary_section,
+            batch_text=batch_text_content
+        )
+        if json_response:
+            final_prompt += JSON_RESPONSE_INSTRUCTION
+        return final_prompt
+
+    def _build_generation_config(self, temperature, text_batch=None, state=None):
+        """생성 설정 - max_output_tokens는 배치의 예상 출력 토큰에 맞춤 (설정값이 상한)
+
+        JSON 응답 모드면 이번 요청의 id를 모두 요구하는 응답 스키마를 지정합니다.
+        """
+        max_output_tokens = self.max_tokens
+        if self.batch_builder is not None and text_batch:
+            max_output_tokens = self.batch_builder.output_token_limit(
+                text_batch, self.selected_model_name, self.max_tokens)
+        if state is not None and state.get('json_response') and state.get('pending_ids'):
+            return genai.types.GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_output_tokens,
+                top_k=40,
+                top_p=0.95,
+                response_mime_type="application/json",
+                response_schema=build_response_schema(state['pending_ids'])
+            )
+        return genai.types.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            top_k=40,
+            top_p=0.95
+        )
+
+    def _interpret_translation_response(self, text_batch, response, state):
+        """API 응답 해석 후 다음 동작 반환
+
+        ('done', 결과 라인) / ('retry', 대기 초) / ('split', None) / ('fail', None) / ('exhausted', None)
+        """
+        translated_text = ""
+        finish_reason_val = 0
+        candidate = None
+
+        if response.candidates:
+            candidate = response.candidates[0]
+            if candidate.content and candidate.content.parts:
+                translated_text = "".join(part.text for part in candidate.content.parts if hasattr(part, 'text'))
+            if hasattr(candidate, 'finish_reason'):
+                finish_reason_val = candidate.finish_reason
+        elif hasattr(response, 'text') and response.text:
+            translated_text = response.text
+
+        if response.prompt_feedback and response.prompt_feedback.block_reason:
+            self.log_callback("log_batch_prompt_blocked", self._get_current_file_for_log(),
+                        response.prompt_feedback.block_reason)
+            return 'fail', None
+
+        # 응답 처리
+        if finish_reason_val not in [0, 1]:
+            if finish_reason_val == 2:  # 토큰 한계
+                self.log_callback("log_batch_token_limit", self._get_current_file_for_log(),
+                            finish_reason_val)
+                # 잘린 응답에서 온전한 라인은 살리고 나머지만 다시 요청 (마지막 라인은 잘렸을 수 있음)
+                translated_values = self._decode_translated_values(translated_text.rsplit('\n', 1)[0], state)
+                if translated_values:
+                    return self._accept_translated_values(text_batch, translated_values, state)
+                return ('split', None) if len(text_batch) > 1 else ('fail', None)
+            return 'fail', None
+
+        if not translated_text.strip():
+            self.log_callback("log_batch_empty_response", self._get_current_file_for_log())
+            return 'fail', None
+
+        translated_values = self._decode_translated_values(translated_text, state)
+        return self._accept_translated_values(text_batch, translated_values, state)
+
+    def _decode_translated_values(self, translated_text, state):
+        """응답 텍스트에서 {id: 번역 값} 추출"""
+        if state['json_response']:
+            return state['payload'].decode_json(translated_text)
+
+        # 코드 블록 제거
+        translated_text = re.sub(r'```(yaml|yml)?\n?', '', translated_text, flags=re.IGNORECASE)
+        translated_text = re.sub(r'\n?```', '', translated_text)
+        return state['payload'].decode(translated_text)
+
+    def _accept_translated_values(self, text_batch, translated_values, state):
+        """검증을 통과한 라인은 확정하고, 빠졌거나 실패한 라인만 다시 요청
+
+        토큰이 깨졌거나 응답에 없는 라인은 항상 다시 요청하고, 원본 언어가 남은 라인은
+        요청한 라인의 10%(재시도부터는 5%)를 넘을 때만 다시 요청합니다.
+        """
+        max_retries = state['max_retries']
+        payload = state['payload']
+        codes_by_line = state['placeholder_codes']
+        pending_ids = state['pending_ids']
+        remnant_ids = []
+        glossary_ids = []
+
+        received = []
+        for line_id in pending_ids:
+            value = translated_values.get(line_id)
+            if value is None:
+                continue
+            index = payload.entries[line_id][0]
+            if codes_by_line[index]:
+                value = self.placeholder_masker.unmask(value, codes_by_line[index])
+                if value is None:
+                    continue
+            value, glossary_compliant = self._enforce_glossary_value(text_batch[index], value, line_id, state)
+            received.append((line_id, index, value, glossary_compliant))
+
+        # 받은 라인을 한 번에 품질 검사 - 같은 결과를 재요청 판단과 통계/미리보기에 사용
+        original_values = [self._extract_yml_value(text_batch[index]) or "" for _, index, _, _ in received]
+        qualities = self._assess_translation_quality(original_values, [value for _, _, value, _ in received])
+        for (line_id, index, value, glossary_compliant), original_value, quality in \
+                zip(received, original_values, qualities):
+            state['line_quality'][index] = (value, quality)
+            # 원문과 같은 값은 원본 언어 잔존으로 보지 않음
+            if quality.has_remnants and value != original_value:
+                state['candidate_values'][line_id] = value
+                remnant_ids.append(line_id)
+                continue
+            if not glossary_compliant:
+                state['candidate_values'][line_id] = value
+                glossary_ids.append(line_id)
+                continue
+            state['accepted_values'][line_id] = value
+            if not quality.has_remnants and quality.codes_preserved and \
+                    self._is_reusable_translation(original_value, value):
+                state['memory_pairs'][line_id] = (original_value, value)
+
+        # 원본 언어가 남은 라인이 적으면 그대로 받아들임
+        source_remnant_threshold = 0.1 if state['retry_count'] == 0 else 0.05
+        if remnant_ids and len(remnant_ids) <= len(pending_ids) * source_remnant_threshold:
+            for line_id in remnant_ids:
+                state['accepted_values'][line_id] = state['candidate_values'].pop(line_id)
+            remnant_ids = []
+
+        # 용어집을 따르지 않은 라인은 한 번만 다시 요청하고, 그 뒤에는 마지막 번역을 받아들임
+        if glossary_ids:
+            if state['retry_count'] >= self.GLOSSARY_RETRY_LIMIT:
+                for line_id in glossary_ids:
+                    state['accepted_values'][line_id] = state['candidate_values'].pop(line_id)
+            else:
+                self.log_callback("log_glossary_rerequest", self._get_current_file_for_log(), len(glossary_ids))
+
+        failed_count = sum(1 for line_id in pending_ids if line_id not in state['accepted_values'])
+        if failed_count:
+            state['retry_count'] += 1
+            if state['retry_count'] <= max_retries:
+                self.log_callback("log_batch_retry_failed_lines", self._get_current_file_for_log(),
+                                  failed_count, len(pending_ids), len(remnant_ids),
+                                  state['retry_count'], max_retries)
+                if remnant_ids:
+                    state['temperature'] = min(state['temperature'] + (0.2 * state['retry_count']), 1.0)
+                    return 'retry', min(self.adaptive_delay * 3, 1.0)
+                state['temperature'] = min(state['temperature'] + 0.1, 1.0)
+                return 'retry', min(self.adaptive_delay * 2, 0.5)
+            return 'exhausted', None
+
+        final_result = self._salvaged_translation_result(text_batch, state)
+        self._review_translated_lines(text_batch, final_result, state['line_quality'])
+        # 재시도를 모두 실패한 배치(마지막 후보를 쓰는 경우)는 저장하지 않음
+        self._store_translation_memory(list(state['memory_pairs'].values()))
+
+        # 배치 시간 기록
+        batch_time = time.time() - state['start_time']
+        file_stats = self._get_current_file_stats()
+        if file_stats is not None:
+            file_stats.setdefault('batch_times', []).append(batch_time)
+
+        return 'done', final_result
+
+    def _enforce_glossary_value(self, original_line, translated_value, line_id, state):
+        """용어집 검사 - (원문 용어를 치환한 값, 준수 여부) 반환 (치환 수는 결과 확정 시 집계)"""
+        if self.glossary_enforcer is None:
+            return translated_value, True
+        parts = split_yml_entry(original_line)
+        if parts is None:
+            return translated_value, True
+        value, fixed_count, missing = self.glossary_enforcer.enforce(parts[1], translated_value)
+        state['glossary_fixed'][line_id] = fixed_count
+        return value, not missing
+
+    def _check_glossary_compliance(self, text_batch, translated_lines):
+        """최종 배치의 용어집 준수 집계 (번역 메모리/중복 재사용 라인에도 로컬 치환 적용)
+
+        번역되지 않은 라인은 세지 않습니다. 치환한 라인은 translated_lines에서 바로 바꿉니다.
+        """
+        if self.glossary_enforcer is None:
+            return
+        checked = 0
+        compliant = 0
+        for i, translated_line in enumerate(translated_lines):
+            if i >= len(text_batch) or translated_line == text_batch[i]:
+                continue
+            original_parts = split_yml_entry(text_batch[i])
+            translated_parts = split_yml_entry(translated_line)
+            if original_parts is None or translated_parts is None:
+                continue
+            required = self.glossary_enforcer.required_entries(original_parts[1])
+            if not required:
+                continue
+            value, fixed_count, missing = self.glossary_enforcer.enforce(original_parts[1], translated_parts[1], required)
+            checked += 1
+            if not missing:
+                compliant += 1
+            if fixed_count:
+                translated_lines[i] = f'{translated_parts[0]}"{value}"{translated_parts[2]}'
+                self._add_file_stat('glossary_fixed', fixed_count)
+        if checked:
+            self._add_file_stat('glossary_checked', checked)
+            self._add_file_stat('glossary_compliant', compliant)
+
+    def _add_file_stat(self, name, amount):
+        file_stats = self._get_current_file_stats()
+        if file_stats is not None:
+            with self._stats_lock:
+                file_stats[name] = file_stats.get(name, 0) + amount
+
+    def _interpret_translation_error(self, text_batch, error, state):
+        """API 호출 오류 해석 후 다음 동작 반환 (_interpret_translation_response와 같은 형식)"""
+        max_retries = state['max_retries']
+        error_str = str(error).lower()
+
+        # 요청 빈도 제한(429) - 배치를 나누지 않고 전역 리미터를 잠시 멈춘 뒤 재시도
+        if ("429" in error_str) or ("resource has been exhausted" in error_str):
+            state['retry_count'] += 1
+            if state['retry_count'] <= max_retries:
+                backoff = self._get_rate_limit_backoff(error_str, state['retry_count'])
+                if self.rate_limiter is not None:
+                    self.rate_limiter.penalize(backoff)
+                self.log_callback("log_rate_limited_backoff", self._get_current_file_for_log(),
+                                  f"{backoff:.0f}", state['retry_count'], max_retries)
+                return 'retry', 0
+            self.log_callback("log_batch_unknown_error", self._get_current_file_for_log(), str(error))
+            return 'fail', None
+
+        # 토큰 한계 에러 처리
+        if "token" in error_str and ("limit" in error_str or "exceeded" in error_str):
+            self.log_callback("log_batch_api_limit_error_split", self._get_current_file_for_log(), str(error))
+            return ('split', None) if len(text_batch) > 1 else ('fail', None)
+
+        # 일반 오류 재시도
+        state['retry_count'] += 1
+        if state['retry_count'] <= max_retries:
+            self.log_callback("log_batch_retrying", self._get_current_file_for_log(), str(error))
+            state['temperature'] = min(state['temperature'] + 0.1, 1.0)
+            return 'retry', min(self.adaptive_delay * 2, 0.5)
+        self.log_callback("log_batch_unknown_error", self._get_current_file_for_log(), str(error))
+        return 'fail', None
+
+    def _review_translated_lines(self, text_batch, final_result, line_quality=None):
+        """번역 품질 통계/미리보기 갱신 후 원본 언어가 남은 라인 수 반환
+
+        재요청 판단 때 검사한 라인(line_quality)은 결과를 재사용하고, 나머지만 한 번에 검사합니다.
+        """
+        line_quality = line_quality or {}
+        reviewed = []  # (원문 값, 번역 값, LineQuality 또는 None)
+        for i in range(min(len(text_batch), len(final_result))):
+            # 실제로 번역되었는지 확인
+            original_value = self._extract_yml_value(text_batch[i])
+            translated_value = self._extract_yml_value(final_result[i])
+            if not original_value or not translated_value or original_value == translated_value:
+                continue
+            assessed = line_quality.get(i)
+            reviewed.append((original_value, translated_value,
+                             assessed[1] if assessed and assessed[0] == translated_value else None))
+
+        unassessed = [position for position, item in enumerate(reviewed) if item[2] is None]
+        if unassessed:
+            qualities = self._assess_translation_quality([reviewed[position][0] for position in unassessed],
+                                                         [reviewed[position][1] for position in unassessed])
+            for position, quality in zip(unassessed, qualities):
+                reviewed[position] = (reviewed[position][0], reviewed[position][1], quality)
+
+        source_remnant_count = 0
+        file_stats = self._get_current_file_stats()
+        for original_value, translated_value, quality in reviewed:
+            # 원본 언어 잔존 검사
+            if quality.has_remnants:
+                source_remnant_count += 1
+
+            # Live Preview 콜백
+            if self.preview_callback:
+                try:
+                    has_error = self._check_regex_errors_optimized(translated_value)
+                    self.preview_callback(original_value, translated_value, quality.score, has_error)
+                except Exception as e:
+                    pass
+
+            # 통계 수집
+            if file_stats is not None:
+                file_stats.setdefault('batch_qualities', []).append(quality.score)
+        return source_remnant_count
+
+    def _estimate_request_tokens(self, prompt, text_batch):
+        """요청 토큰 예약량 추정 (시스템 지시 + 입력 프롬프트 + 예상 출력)"""
+        static_tokens = self.prompt_builder.static_tokens if self.prompt_builder is not None else 0
+        if self.batch_builder is None:
+            return static_tokens + len(prompt) // 3 + sum(len(line) for line in text_batch) // 2
+        estimator = self.batch_builder.estimator
+        return static_tokens + estimator.estimate_tokens(prompt) + estimator.estimate_batch_output(text_batch)
+
+    def _acquire_rate_limit(self, reserved_tokens):
+        """전역 리미터에서 요청 예산 확보 (중지 요청 시 False)"""
+        if self.rate_limiter is None:
+            return not self.stop_event.is_set()
+        return self.rate_limiter.acquire(reserved_tokens, self.stop_event)
+
+    def _settle_rate_limit(self, response, reserved_tokens):
+        """응답의 실제 토큰 사용량으로 리미터 보정 (캐시 적중 토큰도 기록)"""
+        usage = getattr(response, 'usage_metadata', None)
+        if self.prompt_builder is not None:
+            self.prompt_builder.record_usage(usage)
+        if self.rate_limiter is None:
+            return
+        actual_tokens = getattr(usage, 'total_token_count', None) if usage else None
+        if actual_tokens:
+            self.rate_limiter.settle(reserved_tokens, actual_tokens)
+
+    def _get_rate_limit_backoff(self, error_str, retry_count):
+        """429 응답의 retry_delay를 우선 사용하고, 없으면 지수 백오프"""
+        match = re.search(r'retry_delay\s*\{\s*seconds:\s*(\d+)', error_str)
+        if match:
+            return float(match.group(1))
+        return float(min(60, 5 * (2 ** (retry_count - 1))))
+
+    def get_rate_limiter_status(self):
+        """현재 리미터 상태 (남은 토큰 수, 대기 중인 호출자 수 등)"""
+        if self.rate_limiter is None:
+            return None
+        return self.rate_limiter.get_stats()
 
     def get_language_code(self, lang_name_en_from_ui):
         return get_language_code(lang_name_en_from_ui)
@@ -1284,128 +1472,224 @@ class TranslatorEngine:
     def get_translated_files_info(self):
         return self.translated_files_info_for_review
 
-    def _process_single_file_core(self, input_file, output_file):
-        """단일 파일 처리 - 통계 콜백 수정"""
+    def _prepare_file_job(self, input_file, output_file, relative_path=None):
+        """파일을 읽어 배치 작업으로 분할 (번역할 파일이 아니면 None 반환)
+
+        번역 기록에 남은 배치는 결과를 미리 채워 두고, 나머지 구간만 새 배치로 나눕니다.
+        """
         self._set_current_file_for_log(os.path.basename(input_file))
-        
-        # 파일 처리 시작 시 통계 초기화
-        self.current_file_start_time = time.time()
-        self.current_file_stats = {
-            'file_path': output_file,
-            'start_time': self.current_file_start_time,
-            'lines': 0,
-            'errors': 0,
-            'error_types': {},
-            'batch_times': [],
-            'batch_qualities': [],
-            'original_file': input_file
-        }
-        
         try:
-            # 체크포인트 확인
-            checkpoint = self.recovery.load_checkpoint(input_file)
-            start_from_line = 0
-            if checkpoint and checkpoint.get('file_path') == input_file:
-                start_from_line = checkpoint.get('completed_lines', 0)
-                if start_from_line > 0:
-                    self.log_callback("log_checkpoint_found", self._get_current_file_for_log(), start_from_line)
-            
-            # 파일 읽기
-            with codecs.open(input_file, 'r', encoding='utf-8-sig') as f:
-                lines = f.readlines()
-            
+            # 파일 읽기 (바이트로 한 번에 읽어 디코딩)
+            lines = read_yml_lines(input_file)
+
             if not lines:
                 self.log_callback("log_file_empty", self._get_current_file_for_log())
-                return
-                
-            total_lines = len(lines)
-            
-            # 대용량 파일 처리
-            if self.split_large_files_threshold > 0 and total_lines > self.split_large_files_threshold:
-                self.log_callback("log_file_split_start", self._get_current_file_for_log(), 
-                            total_lines, self.split_large_files_threshold)
-                self._process_large_file_in_chunks(input_file, output_file, lines)
-                return
+                return None
+
+            header_lines = []
 
-            translated_lines_final = []
-            self.log_callback("log_file_process_start", self._get_current_file_for_log(), total_lines)
-            
             # 언어 식별자 처리
             start_index = 0
-            first_line_match = self.lang_identifier_pattern.match(lines[0]) if lines else None
+            first_line_match = self.lang_identifier_pattern.match(lines[0])
             if first_line_match:
                 original_first_line_content = lines[0]
                 if self.keep_identifier:
-                    translated_lines_final.append(original_first_line_content)
+                    header_lines.append(original_first_line_content)
                 else:
                     target_lang_code_str = self.get_language_code(self.target_lang_for_api)
-                    new_first_line_content = self.lang_identifier_pattern.sub(
-                        f"l_{target_lang_code_str}:", original_first_line_content, count=1)
-                    translated_lines_final.append(new_first_line_content)
+                    header_lines.append(self.lang_identifier_pattern.sub(
+                        f"l_{target_lang_code_str}:", original_first_line_content, count=1))
                 start_index = 1
 
-            # 콘텐츠 라인 번역
-            content_lines_to_translate = lines[start_index:]
-            
-            # 체크포인트에서 재개
-            if start_from_line > len(translated_lines_final):
-                num_to_skip = start_from_line - len(translated_lines_final)
-                translated_lines_final.extend(content_lines_to_translate[:num_to_skip])
-                content_lines_to_translate = content_lines_to_translate[num_to_skip:]
-            
-            # 배치 단위로 번역
-            for i in range(0, len(content_lines_to_translate), self.batch_size):
-                if self.stop_event.is_set():
-                    self.log_callback("log_file_process_stopped", self._get_current_file_for_log())
-                    return
-                
-                batch_to_translate = content_lines_to_translate[i:i + self.batch_size]
-                current_line_in_file = start_index + len(translated_lines_final) - len(translated_lines_final[:start_index])
-                
-                self.log_callback("log_batch_translate", current_line_in_file + 1, 
-                            current_line_in_file + len(batch_to_translate), total_lines)
-                
-                # 번역 수행
-                translated_batch_lines = self._translate_batch_core(batch_to_translate)
-                
-                # 번역 결과 확인 로그
-                translated_count = sum(1 for j, line in enumerate(translated_batch_lines) 
-                                    if line != batch_to_translate[j])
-                if translated_count > 0:
-                    self.log_callback("log_batch_translated_count", 
-                                self._get_current_file_for_log(), 
-                                translated_count, 
-                                len(batch_to_translate))
-                
-                translated_lines_final.extend(translated_batch_lines)
-                
-                # 체크포인트 저장
-                completed_so_far = len(translated_lines_final)
-                if i % (self.batch_size * 10) == 0:
-                    self.recovery.save_checkpoint(input_file, completed_so_far, total_lines)
-                
-                # 딜레이
-                if i + self.batch_size < len(content_lines_to_translate) and not self.stop_event.is_set() and self.delay_between_batches > 0:
-                    time.sleep(self.adaptive_delay)
+            # 증분 번역 - 매니페스트와 원문 해시가 같은 키는 기존 출력의 번역을 재사용
+            content_lines = lines[start_index:]
+            line_layout = None
+            if self.incremental_translation:
+                line_layout, manifest_stats = self.manifest.plan(content_lines, output_file,
+                                                                 self.translation_memory_fingerprint)
+                if line_layout is not None:
+                    self.log_callback("log_incremental_plan", self._get_current_file_for_log(),
+                                      manifest_stats['reused'], manifest_stats['changed'], manifest_stats['removed'])
+            # 빈칸 채우기 - 매니페스트가 없으면 기존 대상 파일에 없는 키만 번역 (있는 라인은 그대로 유지)
+            if line_layout is None and self.gap_fill_mode:
+                line_layout, gap_stats = self.manifest.plan_gap_fill(content_lines, output_file)
+                if line_layout is not None:
+                    self.log_callback("log_gap_fill_plan", self._get_current_file_for_log(),
+                                      gap_stats['kept'], gap_stats['missing'], gap_stats['dropped'])
+            reused_existing_output = line_layout is not None
+            # 주석/빈 줄과 번역할 필요가 없는 값(코드/숫자/경로/GFX_/키 그대로)은 API로 보내지 않고 원문 그대로 사용
+            line_layout, passthrough_count = plan_passthrough(content_lines, line_layout)
+            if passthrough_count:
+                self.log_callback("log_passthrough_values", self._get_current_file_for_log(), passthrough_count)
+            work_lines = [line for line, reused in zip(content_lines, line_layout) if reused is None]
+            total_lines = start_index + len(work_lines)
+
+            # 이전 실행의 번역 기록 확인 (번역할 라인/설정이 바뀌었으면 새로 시작)
+            journal_key = relative_path or os.path.basename(input_file)
+            journaled_batches, discarded = self.journal.open(
+                journal_key, hash_source_lines(work_lines), self.translation_memory_fingerprint)
+            if discarded:
+                self.log_callback("log_journal_discarded", self._get_current_file_for_log())
+
+            # 대용량 파일은 동적 배치 크기를 라인 상한으로 사용
+            if not work_lines:
+                # 다시 번역할 라인이 없으면 배치 없이 바로 저장 (기존 번역 재사용 또는 원문 그대로)
+                effective_batch_size = self.batch_size
+                if reused_existing_output:
+                    self.log_callback("log_file_all_reused", self._get_current_file_for_log())
+                else:
+                    self.log_callback("log_file_no_translatable_values", self._get_current_file_for_log())
+            elif self.split_large_files_threshold > 0 and total_lines > self.split_large_files_threshold:
+                effective_batch_size = self.dynamic_batch_size or self.batch_size
+                self.log_callback("log_file_split_start", self._get_current_file_for_log(),
+                                  total_lines, effective_batch_size)
+            else:
+                effective_batch_size = self.batch_size
+                self.log_callback("log_file_process_start", self._get_current_file_for_log(), total_lines)
+
+            batches = []
+            batch_offsets = []
+            restored_results = {}
+            # 위치는 언어 식별자 다음부터 번역할 라인에 붙인 번호 (원문 그대로 쓰는 라인은 세지 않음)
+            position = 0
+            for record_start in sorted(journaled_batches) + [total_lines]:
+                record_count, record_lines = journaled_batches.get(record_start, (0, None))
+                work_start = record_start - start_index
+                # 앞 기록과 겹치거나 범위를 벗어난 기록, 원문 그대로인 라인이 있는 기록은 무시 (다시 번역)
+                if work_start < position or work_start + record_count > len(work_lines) or \
+                        (record_lines is not None and
+                         self._has_untranslated_lines(work_lines[work_start:work_start + record_count], record_lines)):
+                    continue
+                # 기록 사이의 남은 구간은 예상 출력 토큰 예산에 맞춰 배치 구성 (짧은 라인은 많이, 긴 라인은 적게)
+                for batch in self._split_into_batches(work_lines[position:work_start], effective_batch_size):
+                    batch_offsets.append(start_index + position)
+                    batches.append(batch)
+                    position += len(batch)
+                if record_lines is not None:
+                    restored_results[len(batches)] = record_lines
+                    batch_offsets.append(record_start)
+                    batches.append(work_lines[work_start:work_start + record_count])
+                    position = work_start + record_count
+
+            job = FileJob(input_file, output_file, header_lines, batches, batch_offsets, total_lines)
+            job.source_lines = lines
+            job.journal_key = journal_key
+            # 앞 배치가 끝난 부분부터 출력 임시 파일에 바로 기록
+            job.writer = OrderedFileWriter(output_file, header_lines, line_layout)
+            for index, translated_lines in restored_results.items():
+                job.set_result(index, translated_lines)
+                job.writer.add(index, translated_lines)
+            if restored_results:
+                self.log_callback("log_journal_resume", self._get_current_file_for_log(), len(restored_results),
+                                  sum(len(batches[index]) for index in restored_results))
+            job.stats = {
+                'file_path': output_file,
+                'start_time': time.time(),
+                'lines': 0,
+                'errors': 0,
+                'error_types': {},
+                'batch_times': [],
+                'batch_qualities': [],
+                'original_file': input_file
+            }
+            return job
 
-            if self.stop_event.is_set(): 
-                return
+        except Exception as e:
+            if not self.stop_event.is_set():
+                self.log_callback("log_file_process_error", self._get_current_file_for_log(), str(e))
+            return None
+        finally:
+            self._set_current_file_for_log("")
 
+    def _split_into_batches(self, content_lines, effective_batch_size):
+        if not content_lines:
+            return []
+        if self.batch_builder is not None:
+            return self.batch_builder.build(content_lines, effective_batch_size)
+        return [content_lines[i:i + effective_batch_size]
+                for i in range(0, len(content_lines), effective_batch_size)]
+
+    def _translate_file_job_batch(self, job, index):
+        """스케줄러 워커에서 파일 작업의 배치 하나를 번역"""
+        batch_to_translate = self._begin_file_job_batch(job, index)
+        try:
+            batch_start_time = time.time()
+            translated_batch_lines = self._translate_batch_core(batch_to_translate)
+            self._end_file_job_batch(batch_to_translate, translated_batch_lines, batch_start_time)
+            return translated_batch_lines
+        finally:
+            self._set_current_file_stats(None)
+            self._set_current_file_for_log("")
+
+    def _begin_file_job_batch(self, job, index):
+        """배치 처리 전 로그용 파일명/통계를 현재 작업에 연결하고 배치 라인 반환"""
+        self._set_current_file_for_log(job.display_name)
+        self._set_current_file_stats(job.stats)
+        self.current_file_stats = job.stats
+
+        batch_to_translate = job.batches[index]
+        current_line_in_file = job.batch_offsets[index]
+        self.log_callback("log_batch_translate", current_line_in_file + 1,
+                          current_line_in_file + len(batch_to_translate), job.total_lines)
+        return batch_to_translate
+
+    def _end_file_job_batch(self, batch_to_translate, translated_batch_lines, batch_start_time):
+        """배치 성능 기록 및 번역 결과 확인 로그"""
+        self._record_batch_performance(len(translated_batch_lines) == len(batch_to_translate),
+                                       len(batch_to_translate), time.time() - batch_start_time)
+        self._check_glossary_compliance(batch_to_translate, translated_batch_lines)
+
+        translated_count = sum(1 for j, line in enumerate(translated_batch_lines)
+                               if j < len(batch_to_translate) and line != batch_to_translate[j])
+        if translated_count > 0:
+            self.log_callback("log_batch_translated_count",
+                              self._get_current_file_for_log(),
+                              translated_count,
+                              len(batch_to_translate))
+
+    def _record_file_job_batch(self, job, index, translated_lines):
+        """완료된 배치를 번역 기록과 출력 임시 파일에 반영 (중지 중에 끝난 배치는 원문일 수 있으므로 제외)
+
+        배치를 완료로 표시하기 전에 호출하므로 파일 마무리(번역 기록 삭제)보다 항상 먼저 끝납니다.
+        """
+        if self.stop_event.is_set() or job.failed:
+            return
+        # API 호출이 실패해 원문이 그대로 돌아온 라인이 있으면 기록하지 않음 (이어서 번역할 때 다시 번역)
+        if not self._has_untranslated_lines(job.batches[index], translated_lines):
+            try:
+                self.journal.append(job.journal_key, job.batch_offsets[index], len(job.batches[index]),
+                                    translated_lines)
+            except Exception:
+                pass
+        try:
+            job.writer.add(index, translated_lines)
+        except Exception as e:
+            job.failed = True
+            self.log_callback("log_file_save_error", job.display_name, str(e))
+
+    def _has_untranslated_lines(self, source_lines, translated_lines):
+        """번역 결과에 값이 있는 원문 라인이 그대로 남았는지 (줄 수가 다르면 True)"""
+        if translated_lines is None or len(source_lines) != len(translated_lines):
+            return True
+        return any(source_line == translated_line and self._extract_yml_value(source_line)
+                   for source_line, translated_line in zip(source_lines, translated_lines))
+
+    def _finalize_file_job(self, job):
+        """모든 배치가 끝난 파일을 저장하고 통계/검증 처리"""
+        self._set_current_file_for_log(job.display_name)
+        self._set_current_file_stats(job.stats)
+        output_file = job.output_file
+        try:
             # 백업 생성
             if os.path.exists(output_file):
                 self.create_auto_backup(output_file)
 
-            self.current_file_stats['lines'] = len(translated_lines_final)
-            
-            # 출력 디렉토리 생성
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
-            
-            # 파일 저장
+            # 파일 저장 - 이미 기록된 앞부분 뒤에 남은 라인만 쓰고 출력 파일로 교체
             try:
-                with codecs.open(output_file, 'w', encoding='utf-8-sig') as f:
-                    f.writelines(translated_lines_final)
+                job.writer.finish(job.results)
+                job.stats['lines'] = job.writer.line_count
                 self.log_callback("log_translation_complete_save", os.path.basename(output_file))
-                
+
                 # 저장 확인
                 if os.path.exists(output_file):
                     saved_size = os.path.getsize(output_file)
@@ -1413,181 +1697,85 @@ class TranslatorEngine:
             except Exception as e:
                 self.log_callback("log_file_save_error", self._get_current_file_for_log(), str(e))
                 return
-            
+
             # 통계 처리
             if not self.stop_event.is_set():
                 try:
-                    self.current_file_stats['time'] = time.time() - (self.current_file_start_time or time.time())
-                    
-                    if self.current_file_stats.get('batch_qualities'):
-                        avg_quality = sum(self.current_file_stats['batch_qualities']) / len(self.current_file_stats['batch_qualities'])
-                        self.current_file_stats['quality'] = round(avg_quality, 1)
+                    job.stats['time'] = time.time() - job.stats['start_time']
+
+                    if job.stats.get('batch_qualities'):
+                        avg_quality = sum(job.stats['batch_qualities']) / len(job.stats['batch_qualities'])
+                        job.stats['quality'] = round(avg_quality, 1)
                     else:
-                        self.current_file_stats['quality'] = 100
-                    
+                        job.stats['quality'] = 100
+
+                    if job.stats.get('glossary_checked'):
+                        compliant = job.stats.get('glossary_compliant', 0)
+                        compliance = compliant / job.stats['glossary_checked'] * 100
+                        job.stats['glossary_compliance'] = round(compliance, 1)
+                        self.log_callback("log_glossary_compliance", job.display_name, f"{compliance:.1f}",
+                                          compliant, job.stats['glossary_checked'],
+                                          job.stats.get('glossary_fixed', 0))
+
                     # 통계 저장
-                    self.save_translation_result(output_file, self.current_file_stats)
-                    
+                    self.save_translation_result(output_file, job.stats)
+
                     # 콜백 호출
                     if self.stats_callback:
-                        self.stats_callback(output_file, self.current_file_stats)
-                        
+                        self.stats_callback(output_file, job.stats)
+
                 except Exception as e:
                     self.log_callback("log_stats_error", str(e))
 
             # 검증 수행
             if not self.stop_event.is_set():
-                missing_keys, original_keys, original_lines_for_retry, missing_keys_info = self._verify_translation_completeness(
-                    input_file, output_file
-                )
-                
-                if missing_keys:
-                    self._retry_missing_translations(
-                        missing_keys, original_keys, original_lines_for_retry, missing_keys_info, output_file
-                    )
-                
-                self.translated_files_info_for_review.append({"original": input_file, "translated": output_file})
-                self.recovery.remove_checkpoint(input_file)
-                
-        except Exception as e:
-            if not self.stop_event.is_set():
-                self.log_callback("log_file_process_error", self._get_current_file_for_log(), str(e))
-        finally:
-            self._set_current_file_for_log("")
-
-    def _process_large_file_in_chunks(self, original_input_file_path, final_output_file_path, all_lines):
-        chunk_start_time = time.time()
-        chunk_stats = {
-            'file_path': final_output_file_path,
-            'start_time': chunk_start_time,
-            'lines': len(all_lines),
-            'errors': 0,
-            'error_types': {},
-            'chunk_times': [],
-            'original_file': original_input_file_path
-        }
-        chunk_size = self.split_large_files_threshold
-        translated_chunk_content_files = []
-        temp_dir = ""
-        
-        try:
-            temp_dir = tempfile.mkdtemp(prefix="translator_chunk_")
-            self.log_callback("log_temp_dir_created", temp_dir)
+                # 출력 파일을 다시 읽지 않고 기록한 라인으로 검증
+                output_lines = job.writer.lines
+                missing_keys_info = self._verify_translation_completeness(job.source_lines, output_lines)
 
-            first_line_content_for_final_output = None 
-            original_first_line = all_lines[0] if all_lines else ""
-            first_line_match_in_original = self.lang_identifier_pattern.match(original_first_line)
-
-            if first_line_match_in_original:
-                if self.keep_identifier:
-                    first_line_content_for_final_output = original_first_line
-                else:
-                    target_lang_code_str = self.get_language_code(self.target_lang_for_api)
-                    first_line_content_for_final_output = self.lang_identifier_pattern.sub(
-                        f"l_{target_lang_code_str}:", original_first_line, count=1)
-            
-            content_start_index_in_original = 1 if first_line_match_in_original else 0
-            actual_content_lines = all_lines[content_start_index_in_original:]
-            num_chunks = (len(actual_content_lines) + chunk_size - 1) // chunk_size
-
-            def translate_chunk(index, chunk_lines):
-                chunk_process_start = time.time()
-                translated_current_chunk_content = []
-                original_log_filename = self._get_current_file_for_log()
-                self._set_current_file_for_log(f"{os.path.basename(original_input_file_path)} (chunk {index+1})")
-                
-                # 동적 배치 크기 사용 (최대 80라인 제한)
-                effective_batch_size = min(self.dynamic_batch_size or self.batch_size, 80)
-                for batch_start in range(0, len(chunk_lines), effective_batch_size):
-                    if self.stop_event.is_set(): 
-                        break
-                    batch_to_translate = chunk_lines[batch_start: batch_start + effective_batch_size]
-                    if not batch_to_translate: 
-                        continue
-                    
-                    batch_start_time = time.time()
-                    translated_batch = self._translate_batch_core(batch_to_translate)
-                    batch_processing_time = time.time() - batch_start_time
-                    
-                    # 성능 기록
-                    batch_success = len(translated_batch) == len(batch_to_translate)
-                    self._record_batch_performance(batch_success, effective_batch_size, batch_processing_time)
-                    
-                    translated_current_chunk_content.extend(translated_batch)
-                    
-                    if self.delay_between_batches > 0 and not self.stop_event.is_set():
-                        time.sleep(self.adaptive_delay)
-
-                self._set_current_file_for_log(original_log_filename)
-                if self.stop_event.is_set(): 
-                    return None, 0
-                
-                temp_chunk_output_content_file = os.path.join(temp_dir, f"chunk_{index}_translated_content.yml")
-                with codecs.open(temp_chunk_output_content_file, 'w', encoding='utf-8-sig') as f_out_content:
-                    f_out_content.writelines(translated_current_chunk_content)
-                chunk_time = time.time() - chunk_process_start
-                return temp_chunk_output_content_file, chunk_time
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_index = {
-                    executor.submit(translate_chunk, i, actual_content_lines[i*chunk_size:(i+1)*chunk_size]): i
-                    for i in range(num_chunks) if not self.stop_event.is_set()
-                }
-
-                completed_chunks = 0
-                translated_chunk_files = [None] * num_chunks
-                for fut in concurrent.futures.as_completed(future_to_index):
-                    if self.stop_event.is_set(): 
-                        break
-                    idx = future_to_index[fut]
-                    try:
-                        result_file, chunk_time = fut.result()
-                        if result_file:
-                            translated_chunk_files[idx] = result_file
-                            chunk_stats['chunk_times'].append(chunk_time)
-                            self.log_callback("log_chunk_completed", idx + 1, num_chunks)
-                            completed_chunks += 1
-                            self.main_status_callback("status_chunk_progress", completed_chunks, num_chunks, 
-                                                   task_type="translation")
-                    except Exception as exc:
-                        self.log_callback("log_chunk_processing_failed", f"Chunk {idx+1}: {exc}")
-
-            if not self.stop_event.is_set() and all(translated_chunk_files):
-                self.log_callback("log_merging_chunks", final_output_file_path)
-
-                if self.stats_callback:
+                if missing_keys_info:
+                    output_lines = self._retry_missing_translations(
+                        missing_keys_info, job.source_lines, output_lines, len(job.header_lines)
+                    )
+                    # 복구한 라인이 있을 때만 한 번에 다시 저장
+                    if output_lines is not job.writer.lines:
+                        try:
+                            self._write_output_lines(output_file, output_lines)
+                        except Exception as e:
+                            self.log_callback("log_file_save_error", job.display_name, str(e))
+
+                if self.incremental_translation:
                     try:
-                        chunk_stats['time'] = time.time() - chunk_start_time
-                        chunk_stats['quality'] = 85
-                        self.stats_callback(final_output_file_path, chunk_stats)
+                        self.manifest.write(job.source_lines, output_lines, output_file,
+                                            self.translation_memory_fingerprint,
+                                            job.stats.get('accepted_unchanged'))
                     except Exception as e:
-                        self.log_callback("log_stats_callback_error", str(e))
-                
-                if os.path.exists(final_output_file_path):
-                    self.create_auto_backup(final_output_file_path)
-                
-                os.makedirs(os.path.dirname(final_output_file_path), exist_ok=True)
-                with codecs.open(final_output_file_path, 'w', encoding='utf-8-sig') as f_final:
-                    if first_line_content_for_final_output:
-                        f_final.write(first_line_content_for_final_output)
-                    for chunk_file in translated_chunk_files:
-                        if chunk_file and os.path.exists(chunk_file):
-                            with codecs.open(chunk_file, 'r', encoding='utf-8-sig') as f_chunk_read:
-                                shutil.copyfileobj(f_chunk_read, f_final)
-
-                self.log_callback("log_translation_complete_save", os.path.basename(final_output_file_path))
-                if not self.stop_event.is_set():
-                    self.translated_files_info_for_review.append(
-                        {"original": original_input_file_path, "translated": final_output_file_path})
-
-            elif self.stop_event.is_set():
-                self.log_callback("log_chunk_processing_stopped", self._get_current_file_for_log())
-            else:
-                self.log_callback("log_chunk_processing_failed", self._get_current_file_for_log())
+                        self.log_callback("log_manifest_error", job.display_name, str(e))
+
+                self.translated_files_info_for_review.append({"original": job.input_file, "translated": output_file})
+                self.journal.remove(job.journal_key)
+
         finally:
-            if temp_dir and os.path.isdir(temp_dir):
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                self.log_callback("log_temp_dir_removed", temp_dir)
+            self._set_current_file_stats(None)
+            self._set_current_file_for_log("")
+
+    def _run_file_jobs(self, jobs, finalize_file, on_job_error):
+        """파일 수나 크기와 관계없이 고정된 워커 수로 모든 배치를 처리"""
+        total_batches = sum(max(1, len(job.batches)) for job in jobs)
+        actual_max_workers = max(1, min(self.max_workers, total_batches))
+        self.log_callback("log_concurrent_workers", actual_max_workers)
+
+        scheduler = BatchScheduler(
+            actual_max_workers, self.stop_event,
+            process_batch=self._translate_file_job_batch,
+            finalize_job=finalize_file,
+            on_batch_done=self._record_file_job_batch,
+            on_error=on_job_error
+        )
+        scheduler.start()
+        for job in jobs:
+            scheduler.submit(job)
+        scheduler.wait()
 
     def _translation_worker_thread_target(self, input_dir, output_dir):
         """번역 작업 스레드 - 동시 처리 복원 및 개선"""
@@ -1595,6 +1783,13 @@ class TranslatorEngine:
         completed_count = 0
         total_files_to_process = 0
 
+        self._glossary_injection_stats = {'requests': 0, 'entries': 0}
+        if self.glossary_entries:
+            self.glossary_index = GlossaryIndex(self.glossary_entries)
+            self.log_callback("log_glossary_index_built", len(self.glossary_index.entries))
+            if self.enforce_glossary:
+                self.glossary_enforcer = GlossaryEnforcer(self.glossary_index)
+
         if not self._initialize_model():
             self.main_status_callback("status_waiting", task_type="translation")
             return
@@ -1624,74 +1819,90 @@ class TranslatorEngine:
                 return
 
             self.log_callback("log_total_files_start", total_files_to_process)
+            if self.gap_fill_mode:
+                self.log_callback("log_gap_fill_mode")
             self.main_status_callback("status_translating_progress", 0, total_files_to_process, task_type="translation")
 
             target_lang_code_for_filename_output = self.get_language_code(self.target_lang_for_api).lower()
+
+            # 실행 단위 중복 제거 - 동일 파일은 한 번만, 반복 값은 한 번만 번역
+            files_to_translate = target_files
+            if self.enable_run_deduplication:
+                self.run_deduplicator = RunDeduplicator()
+                files_to_translate = self.run_deduplicator.scan_files(target_files, self._extract_yml_value)
+                dedup_stats = self.run_deduplicator.get_stats()
+                self.log_callback("log_dedup_scan_result", dedup_stats['total_values'],
+                                  dedup_stats['unique_values'], dedup_stats['shared_values'])
+                if dedup_stats['unique_templates'] < dedup_stats['unique_values']:
+                    # 게임 코드/숫자만 다른 값은 템플릿 하나로 묶어 한 번만 번역
+                    self.log_callback("log_dedup_template_result", dedup_stats['unique_values'],
+                                      dedup_stats['unique_templates'])
+                if dedup_stats['duplicate_files']:
+                    self.log_callback("log_duplicate_files_detected", dedup_stats['duplicate_files'],
+                                      len(self.run_deduplicator.duplicate_files))
             
             # 동시 처리를 위한 Lock
             completed_lock = threading.Lock()
+
+            def get_output_path(input_f):
+                relative_path = os.path.relpath(os.path.dirname(input_f), input_dir)
+                base_name = os.path.basename(input_f)
+                
+                if not self.keep_identifier:
+                    identifier_to_replace_in_filename = f"l_{source_lang_code_for_search}"
+                    new_target_identifier_for_filename = f"l_{target_lang_code_for_filename_output}"
+                    new_base_name, num_replacements = re.subn(
+                        re.escape(identifier_to_replace_in_filename),
+                        new_target_identifier_for_filename,
+                        base_name,
+                        count=1,
+                        flags=re.IGNORECASE
+                    )
+                    if num_replacements > 0:
+                        base_name = new_base_name
+                
+                return os.path.join(output_dir, relative_path, base_name)
             
-            # 파일 처리 함수
-            def process_file(input_f):
+            # 파일 마무리 함수 (저장/검증 후 내용이 같은 파일 복사, 진행률 갱신)
+            def finalize_file(job):
+                nonlocal completed_count
+                self._finalize_file_job(job)
                 if self.stop_event.is_set():
-                    return False
-                    
+                    return
+
+                processed = 1
+                duplicates = self.run_deduplicator.duplicate_files.get(job.input_file, []) if self.run_deduplicator else []
+                for duplicate_f in duplicates:
+                    if self._copy_duplicate_file_output(job.input_file, job.output_file, duplicate_f, get_output_path(duplicate_f)):
+                        processed += 1
+
+                with completed_lock:
+                    completed_count += processed
+                    progress_value = completed_count / total_files_to_process
+                    self.main_progress_callback(completed_count, total_files_to_process,
+                                                progress_value, "translation")
+
+            def on_job_error(job, error):
+                self.log_callback("log_file_thread_error", job.display_name, str(error))
+
+            # 모든 파일을 배치 작업으로 분할 (작은 파일이 먼저 처리되도록 스케줄러가 정렬)
+            jobs = []
+            for input_f in files_to_translate:
+                if self.stop_event.is_set():
+                    break
+                job = self._prepare_file_job(input_f, get_output_path(input_f), os.path.relpath(input_f, input_dir))
+                if job is not None:
+                    jobs.append(job)
+
+            if jobs and not self.stop_event.is_set():
+                self._run_file_jobs(jobs, finalize_file, on_job_error)
+            # 중지/실패로 마무리하지 못한 파일의 임시 출력 정리
+            for job in jobs:
                 try:
-                    relative_path = os.path.relpath(os.path.dirname(input_f), input_dir)
-                    base_name = os.path.basename(input_f)
-                    
-                    if not self.keep_identifier:
-                        identifier_to_replace_in_filename = f"l_{source_lang_code_for_search}"
-                        new_target_identifier_for_filename = f"l_{target_lang_code_for_filename_output}"
-                        new_base_name, num_replacements = re.subn(
-                            re.escape(identifier_to_replace_in_filename),
-                            new_target_identifier_for_filename,
-                            base_name,
-                            count=1,
-                            flags=re.IGNORECASE
-                        )
-                        if num_replacements > 0:
-                            base_name = new_base_name
-                    
-                    output_f_path = os.path.join(output_dir, relative_path, base_name)
-                    
-                    # 단일 파일 처리
-                    self._process_single_file_core(input_f, output_f_path)
-                    
-                    return not self.stop_event.is_set()
-                except Exception as e:
-                    self.log_callback("log_file_process_error", os.path.basename(input_f), str(e))
-                    return False
+                    job.writer.discard()
+                except OSError:
+                    pass
 
-            # 실제 동시 처리 워커 수 제한 (API 제한 고려하여 증가)
-            actual_max_workers = min(self.max_workers, 300, len(target_files))  # 250 API 호출 제한 고려 
-            self.log_callback("log_concurrent_workers", actual_max_workers)
-            
-            # ThreadPoolExecutor로 동시 처리
-            with concurrent.futures.ThreadPoolExecutor(max_workers=actual_max_workers) as executor:
-                # 모든 작업 제출
-                future_to_file = {executor.submit(process_file, f): f for f in target_files}
-                
-                # 완료된 작업 처리
-                for future in concurrent.futures.as_completed(future_to_file):
-                    if self.stop_event.is_set():
-                        # 중지 요청 시 모든 미완료 작업 취소
-                        for f in future_to_file:
-                            f.cancel()
-                        break
-                    
-                    file_path = future_to_file[future]
-                    try:
-                        success = future.result()
-                        if success:
-                            with completed_lock:
-                                completed_count += 1
-                                progress_value = completed_count / total_files_to_process
-                                self.main_progress_callback(completed_count, total_files_to_process, 
-                                                        progress_value, "translation")
-                    except Exception as e:
-                        self.log_callback("log_file_thread_error", os.path.basename(file_path), str(e))
-            
             final_log_msg_key = "log_all_translation_done" if not self.stop_event.is_set() else "log_translation_stopped_by_user"
             self.log_callback(final_log_msg_key)
 
@@ -1708,13 +1919,57 @@ class TranslatorEngine:
                 self.main_status_callback("status_completed_all", completed_count, total_files_to_process, task_type=task_type)
             else:
                 self.main_status_callback("status_completed_some", completed_count, total_files_to_process, task_type=task_type)
+            self._finish_translation_memory()
+            self._finish_prompt_builder()
+            if self.run_deduplicator is not None:
+                self.run_deduplicator.release_all()
+                reused_values = self.run_deduplicator.get_stats()['reused']
+                if reused_values:
+                    self.log_callback("log_dedup_summary", reused_values)
+                self.run_deduplicator = None
+            self._log_check_cache_summary()
             self._set_current_file_for_log("")
 
+    def _copy_duplicate_file_output(self, source_input, source_output, duplicate_input, duplicate_output):
+        """내용이 같은 파일은 번역하지 않고 대표 파일의 번역 결과를 복사"""
+        # 이번 실행에서 대표 파일이 정상 완료된 경우에만 복사 (이전 실행의 출력 재사용 방지)
+        source_completed = any(info["original"] == source_input for info in self.translated_files_info_for_review)
+        if not source_completed or not os.path.exists(source_output):
+            return False
+        try:
+            if os.path.exists(duplicate_output):
+                self.create_auto_backup(duplicate_output)
+            os.makedirs(os.path.dirname(duplicate_output), exist_ok=True)
+            shutil.copyfile(source_output, duplicate_output)
+            # 원문이 같으므로 매니페스트도 그대로 복사 (다음 증분 번역에서 처음부터 번역하지 않도록)
+            source_manifest = TranslationManifest.manifest_path(source_output)
+            if self.incremental_translation and os.path.exists(source_manifest):
+                shutil.copyfile(source_manifest, TranslationManifest.manifest_path(duplicate_output))
+            self.translated_files_info_for_review.append({"original": duplicate_input, "translated": duplicate_output})
+            self.log_callback("log_duplicate_file_copied", os.path.basename(duplicate_input), os.path.basename(source_input))
+            return True
+        except Exception as e:
+            self.log_callback("log_file_process_error", os.path.basename(duplicate_input), str(e))
+            return False
+
+    def _finish_translation_memory(self):
+        """번역 메모리 통계 기록 및 연결 종료"""
+        if not self.use_translation_memory:
+            return
+        try:
+            tm_stats = self.translation_memory.get_stats()
+            if tm_stats['hits'] or tm_stats['misses']:
+                self.log_callback("log_tm_summary", tm_stats['hits'], tm_stats['misses'],
+                                  f"{tm_stats['hit_rate']*100:.1f}%", tm_stats['entries'])
+            self.translation_memory.close()
+        except Exception as e:
+            self.log_callback("log_tm_error", str(e))
+
     def start_translation_process(self, api_key, selected_model_name,
                                 input_folder, output_folder,
                                 source_lang_api, target_lang_api,
                                 prompt_template, glossary_content,
-                                batch_size_val, max_tokens_val, delay_val, temperature_val, max_workers_val,
+                                batch_size_val, max_tokens_val, temperature_val, max_workers_val,
                                 keep_identifier_val, check_internal_lang_val,
                                 split_large_files_threshold,
                                 selected_game=None,
@@ -1722,7 +1977,18 @@ class TranslatorEngine:
                                 max_retries=3,
                                 preview_callback=None,
                                 stats_callback=None,
-                                enable_backup=False):
+                                enable_backup=False,
+                                use_translation_memory=True,
+                                requests_per_minute=1000,
+                                tokens_per_minute=1000000,
+                                batch_token_budget=8000,
+                                use_values_only_payload=True,
+                                use_json_response=False,
+                                glossary_entries=None,
+                                enforce_glossary=True,
+                                incremental_translation=True,
+                                gap_fill_mode=False,
+                                delay_val=None):  # 호환용 (사용하지 않음) - 요청 간격은 요청 빈도 제한이 조절
         if self.translation_thread and self.translation_thread.is_alive():
             self.log_callback("warn_already_translating")
             return False
@@ -1737,9 +2003,14 @@ class TranslatorEngine:
         self.target_lang_for_api = target_lang_api
         self.prompt_template_str = prompt_template
         self.glossary_str_for_prompt = glossary_content
+        self.glossary_entries = list(glossary_entries) if glossary_entries else []
+        self.glossary_index = None
+        self.enforce_glossary = enforce_glossary
+        self.incremental_translation = incremental_translation
+        self.gap_fill_mode = gap_fill_mode
+        self.glossary_enforcer = None
         self.batch_size = batch_size_val
         self.max_tokens = max_tokens_val
-        self.delay_between_batches = delay_val
         self.temperature = temperature_val
         self.max_workers = max_workers_val
         self.keep_identifier = keep_identifier_val
@@ -1749,6 +2020,21 @@ class TranslatorEngine:
         self.skip_already_translated = skip_already_translated
         self.max_retries = max_retries
         self.enable_backup = enable_backup
+        self.use_translation_memory = use_translation_memory
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.batch_token_budget = batch_token_budget
+        self.use_values_only_payload = use_values_only_payload
+        self.use_json_response = use_json_response
+        self.batch_builder = BatchBuilder(target_lang_api, batch_token_budget, self._extract_yml_value)
+        self.quality_checker = BatchQualityChecker(source_lang_api, target_lang_api)
+
+        # 번역 메모리 지문 (언어쌍/모델/프롬프트/용어집이 바뀌면 이전 번역을 재사용하지 않음)
+        self.translation_memory_fingerprint = TranslationMemory.make_fingerprint(
+            source_lang_api, target_lang_api, selected_model_name,
+            prompt_template, glossary_content, selected_game
+        )
+        self.translation_memory.reset_stats()
         
         # 콜백 설정 (안전하게)
         self.preview_callback = preview_callback if callable(preview_callback) else None
@@ -1756,7 +2042,9 @@ class TranslatorEngine:
 
         # 캐시 초기화
         self._regex_error_cache.clear()
-        self._source_remnant_cache.clear()
+        self._value_error_cache.clear()
+        for cache in self._check_caches():
+            cache.reset_stats()
         self.clear_statistics()
 
         self.main_status_callback("status_preparing", task_type="translation")
@@ -1798,6 +2086,7 @@ class TranslatorEngine:
                     'quality': stats_dict.get('quality', 100),
                     'lines': stats_dict.get('lines', 0),
                     'errors': stats_dict.get('errors', 0),
+                    'glossary_compliance': stats_dict.get('glossary_compliance'),
                     'original_file': stats_dict.get('original_file', '')
                 }
                 
@@ -1849,7 +2138,8 @@ class TranslatorEngine:
             return {
                 'current_file': self._get_current_file_for_log(),
                 'elapsed_time': time.time() - (self.current_file_stats.get('start_time') or time.time()),
-                'is_running': self.translation_thread and self.translation_thread.is_alive()
+                'is_running': self.translation_thread and self.translation_thread.is_alive(),
+                'rate_limiter': self.get_rate_limiter_status()
             }
         return None
 
@@ -0,0 +1,180 @@
+# translator_project/translator_app/core/yml_lexer.py
+import codecs
+import re
+from functools import lru_cache
+
+# 라인 종류
+ENTRY = "entry"          # key:0 "값" (# 주석)
+BROKEN = "broken"        # 키는 있지만 값 따옴표가 없거나 닫히지 않음
+LANGUAGE = "language"    # l_english:
+COMMENT = "comment"
+BLANK = "blank"
+OTHER = "other"          # 키 형식이 아닌 라인
+
+# 들여쓰기 / 키 / 버전 번호 / 값 앞 공백
+ENTRY_HEAD_PATTERN = re.compile(r'[ \t]*([^\s:#"]+):(\d*)[ \t]*')
+LANGUAGE_PATTERN = re.compile(r'\s*l_[a-zA-Z_]+\s*:', re.IGNORECASE)
+# 닫는 따옴표 뒤에 올 수 있는 것 (공백, 주석)
+TRAILER_PATTERN = re.compile(r'[ \t]*(?:#.*)?$')
+
+
+class YmlLine:
+    """Paradox 현지화 파일 라인 하나의 분석 결과
+
+    값 위치(value_start/value_end)와 주석 위치는 text 안의 인덱스이며 없으면 -1입니다.
+    index/offset은 파일 단위로 읽었을 때의 줄 번호(0부터)와 디코딩된 내용 안의 시작 위치입니다.
+    """
+
+    __slots__ = ('text', 'kind', 'key', 'version', 'value_start', 'value_end', 'comment_start',
+                 'line_ending', 'index', 'offset')
+
+    def __init__(self, text, kind, key=None, version="", value_start=-1, value_end=-1, comment_start=-1,
+                 line_ending="", index=0, offset=0):
+        self.text = text
+        self.kind = kind
+        self.key = key
+        self.version = version
+        self.value_start = value_start
+        self.value_end = value_end
+        self.comment_start = comment_start
+        self.line_ending = line_ending
+        self.index = index
+        self.offset = offset
+
+    @property
+    def is_entry(self):
+        return self.kind == ENTRY
+
+    @property
+    def is_content(self):
+        """번역 대상 키 라인 (따옴표가 깨진 라인 포함)"""
+        return self.kind == ENTRY or self.kind == BROKEN
+
+    @property
+    def value(self):
+        """따옴표 안의 값 (항목이 아니면 None)"""
+        if self.kind != ENTRY:
+            return None
+        return self.text[self.value_start:self.value_end]
+
+    @property
+    def prefix(self):
+        """값의 여는 따옴표 앞부분 (들여쓰기, 키, 버전)"""
+        return self.text[:self.value_start - 1] if self.kind == ENTRY else None
+
+    @property
+    def suffix(self):
+        """값의 닫는 따옴표 뒷부분 (공백, 주석, 줄바꿈)"""
+        return self.text[self.value_end + 1:] if self.kind == ENTRY else None
+
+    @property
+    def comment(self):
+        if self.comment_start < 0:
+            return None
+        return self.text[self.comment_start:len(self.text) - len(self.line_ending)]
+
+    def with_value(self, new_value):
+        """값만 바꾼 라인 (키, 주석, 줄바꿈 유지) - 항목이 아니면 None"""
+        if self.kind != ENTRY:
+            return None
+        return self.text[:self.value_start] + new_value + self.text[self.value_end:]
+
+
+def _is_escaped(body, position):
+    backslashes = 0
+    while position > 0 and body[position - 1] == '\\':
+        backslashes += 1
+        position -= 1
+    return backslashes % 2 == 1
+
+
+def _find_closing_quote(body, start):
+    """값을 닫는 따옴표 위치 - 뒤에 공백/주석만 오는 이스케이프되지 않은 마지막 따옴표 (없으면 -1)
+
+    값 안의 따옴표와 '#'은 값의 일부로 봅니다.
+    """
+    position = body.rfind('"', start)
+    while position >= start:
+        if not _is_escaped(body, position) and TRAILER_PATTERN.match(body, position + 1):
+            return position
+        position = body.rfind('"', start, position)
+    return -1
+
+
+def lex_line(text, index=0, offset=0):
+    """라인 하나를 YmlLine으로 분석"""
+    if text.endswith('\r\n'):
+        line_ending = '\r\n'
+    elif text.endswith('\n') or text.endswith('\r'):
+        line_ending = text[-1]
+    else:
+        line_ending = ""
+    body = text[:len(text) - len(line_ending)]
+    stripped = body.lstrip()
+
+    if not stripped.strip():
+        return YmlLine(text, BLANK, line_ending=line_ending, index=index, offset=offset)
+    if stripped.startswith('#'):
+        return YmlLine(text, COMMENT, comment_start=len(body) - len(stripped), line_ending=line_ending,
+                       index=index, offset=offset)
+
+    head = ENTRY_HEAD_PATTERN.match(body)
+    if head is None:
+        kind = LANGUAGE if LANGUAGE_PATTERN.match(body) else OTHER
+        return YmlLine(text, kind, line_ending=line_ending, index=index, offset=offset)
+
+    key, version = head.group(1), head.group(2)
+    quote_position = head.end()
+    if quote_position >= len(body) or body[quote_position] != '"':
+        if LANGUAGE_PATTERN.match(body) and TRAILER_PATTERN.match(body, quote_position):
+            return YmlLine(text, LANGUAGE, key, version, comment_start=body.find('#', quote_position),
+                           line_ending=line_ending, index=index, offset=offset)
+        return YmlLine(text, BROKEN, key, version, line_ending=line_ending, index=index, offset=offset)
+
+    closing_position = _find_closing_quote(body, quote_position + 1)
+    if closing_position < 0:
+        return YmlLine(text, BROKEN, key, version, line_ending=line_ending, index=index, offset=offset)
+    comment_start = body.find('#', closing_position + 1)
+    return YmlLine(text, ENTRY, key, version, quote_position + 1, closing_position, comment_start,
+                   line_ending, index, offset)
+
+
+# 같은 라인을 여러 곳(값 추출, 교체, 검증)에서 다시 분석하지 않도록 위치 정보 없는 결과를 캐시
+lex_line_cached = lru_cache(maxsize=65536)(lex_line)
+
+
+def split_lines(text):
+    """줄바꿈('\\n')을 유지한 채 라인으로 분리 - 값 안의 다른 유니코드 줄 구분 문자에서는 나누지 않음"""
+    parts = text.split('\n')
+    lines = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def decode_yml_bytes(raw):
+    """파일 내용 전체를 한 번에 디코딩 (UTF-8 BOM 제거)"""
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    return raw.decode('utf-8')
+
+
+def read_yml_lines(file_path):
+    """파일을 바이트로 한 번에 읽어 디코딩한 라인 목록"""
+    with open(file_path, 'rb') as f:
+        return split_lines(decode_yml_bytes(f.read()))
+
+
+def lex_lines(lines):
+    """라인 목록을 한 번씩만 분석한 YmlLine 목록"""
+    records = []
+    offset = 0
+    for index, line in enumerate(lines):
+        records.append(lex_line(line, index, offset))
+        offset += len(line)
+    return records
+
+
+def read_yml_file(file_path):
+    """파일 전체를 YmlLine 목록으로 읽음 (디코딩 실패 시 UnicodeDecodeError)"""
+    return lex_lines(read_yml_lines(file_path))
@@ -4,7 +4,7 @@ from tkinter import filedialog, messagebox
 import os
 import threading # stop_event용
 import time      # log_message용
-import codecs    # 프롬프트/용어집 파일 처리용
+import codecs    # 프롬프트 파일 처리용
 import tkinter as tk
 import locale    # 시스템 언어 감지용
 from datetime import datetime
@@ -12,7 +12,10 @@ from datetime import datetime
 # --- 내부 모듈 임포트 ---
 from ..utils.localization import LANGUAGES, set_language
 from ..core.translator_engine import TranslatorEngine
+from ..core.async_translator_engine import AsyncTranslatorEngine
 from ..core.settings_manager import SettingsManager
+from ..core.glossary_index import format_glossary_section
+from ..core.glossary_store import GlossaryStore
 
 from .panels.ui_config_panel import UIConfigPanel
 from .panels.api_model_panel import APIModelPanel
@@ -69,6 +72,16 @@ class TranslationGUI(ctk.CTk):
         self.check_internal_lang_var = tk.BooleanVar(value=False)
         self.split_threshold_var = tk.IntVar(value=1000)
         self.enable_backup_var = tk.BooleanVar(value=False)
+        self.use_translation_memory_var = tk.BooleanVar(value=True)
+        self.requests_per_minute_var = tk.IntVar(value=1000)
+        self.tokens_per_minute_var = tk.IntVar(value=1000000)
+        self.batch_token_budget_var = tk.IntVar(value=8000)
+        self.use_async_engine_var = tk.BooleanVar(value=False)
+        self.use_values_only_payload_var = tk.BooleanVar(value=True)
+        self.use_json_response_var = tk.BooleanVar(value=False)
+        self.enforce_glossary_var = tk.BooleanVar(value=True)
+        self.incremental_translation_var = tk.BooleanVar(value=True)
+        self.gap_fill_mode_var = tk.BooleanVar(value=False)
         
         # 새로운 변수들
         self.selected_game_var = tk.StringVar(value="None")
@@ -78,6 +91,7 @@ class TranslationGUI(ctk.CTk):
 
         self.progress_text_var = tk.StringVar()
         self.glossary_files = []
+        self.glossary_store = GlossaryStore()
         self.stop_event = threading.Event()
         self.loaded_prompt_from_config = None
 
@@ -133,13 +147,7 @@ Text to translate:
         self.setup_shortcuts()
 
         # --- 4. TranslatorEngine 초기화 (콜백으로 전달할 메서드들이 self에 바인딩 된 후) ---
-        self.translator_engine = TranslatorEngine(
-            log_callback=self.log_message,
-            progress_callback=self._update_progress_ui,
-            status_callback=self._update_status_ui,
-            stop_event=self.stop_event,
-            get_input_folder_callback=self.input_folder_var.get
-        )
+        self.translator_engine = self._create_translator_engine()
 
         # --- 5. UI 위젯 생성 및 최종 초기화 ---
         self.create_widgets()
@@ -186,6 +194,17 @@ Text to translate:
             self._update_glossary_list_ui_data()
 
     # --- 메서드 정의 시작 ---
+    def _create_translator_engine(self):
+        """설정에 따라 동기(스레드) 또는 asyncio 번역 엔진 생성"""
+        engine_class = AsyncTranslatorEngine if self.use_async_engine_var.get() else TranslatorEngine
+        return engine_class(
+            log_callback=self.log_message,
+            progress_callback=self._update_progress_ui,
+            status_callback=self._update_status_ui,
+            stop_event=self.stop_event,
+            get_input_folder_callback=self.input_folder_var.get
+        )
+
     def _on_closing(self):
         """향상된 애플리케이션 종료 처리"""
         try:
@@ -251,6 +270,16 @@ Text to translate:
             "max_retries_var": self.max_retries_var,
             "selected_game_var": self.selected_game_var,
             "enable_live_preview_var": self.enable_live_preview,
+            "use_translation_memory_var": self.use_translation_memory_var,
+            "requests_per_minute_var": self.requests_per_minute_var,
+            "tokens_per_minute_var": self.tokens_per_minute_var,
+            "batch_token_budget_var": self.batch_token_budget_var,
+            "use_async_engine_var": self.use_async_engine_var,
+            "use_values_only_payload_var": self.use_values_only_payload_var,
+            "use_json_response_var": self.use_json_response_var,
+            "enforce_glossary_var": self.enforce_glossary_var,
+            "incremental_translation_var": self.incremental_translation_var,
+            "gap_fill_mode_var": self.gap_fill_mode_var,
         }
         loaded_prompt, loaded_glossary_paths = self.settings_manager.load_settings(app_vars_for_settings)
         self.loaded_prompt_from_config = loaded_prompt
@@ -281,6 +310,16 @@ Text to translate:
             "max_retries_var": self.max_retries_var,
             "selected_game_var": self.selected_game_var,
             "enable_live_preview_var": self.enable_live_preview,
+            "use_translation_memory_var": self.use_translation_memory_var,
+            "requests_per_minute_var": self.requests_per_minute_var,
+            "tokens_per_minute_var": self.tokens_per_minute_var,
+            "batch_token_budget_var": self.batch_token_budget_var,
+            "use_async_engine_var": self.use_async_engine_var,
+            "use_values_only_payload_var": self.use_values_only_payload_var,
+            "use_json_response_var": self.use_json_response_var,
+            "enforce_glossary_var": self.enforce_glossary_var,
+            "incremental_translation_var": self.incremental_translation_var,
+            "gap_fill_mode_var": self.gap_fill_mode_var,
         }
         current_prompt_text = self.prompt_glossary_panel.get_prompt_text() if hasattr(self, 'prompt_glossary_panel') else self.default_prompt_template_str
         current_glossary_paths = [g["path"] for g in self.glossary_files]
@@ -543,55 +582,39 @@ Text to translate:
         if not hasattr(self, 'prompt_glossary_panel'): return
         for g_item in self.glossary_files:
             path = g_item["path"]
-            g_item["entry_count"] = 0
+            # 바뀌지 않은 파일은 저장소의 컴파일된 색인을 재사용
+            compiled = self.glossary_store.get(path)
+            g_item["entry_count"] = compiled.entry_count
             g_item["error"] = None
-            g_item["error_key"] = None
-            g_item["error_detail"] = None
-            if not os.path.exists(path):
-                g_item["error_key"] = "glossary_error_not_found"
-            else:
-                try:
-                    with codecs.open(path, 'r', encoding='utf-8-sig') as f:
-                        lines = [line.strip() for line in f if line.strip()]
-                    if not lines:
-                        g_item["error_key"] = "glossary_error_empty"
-                    else:
-                        count = 0
-                        for line in lines:
-                            if ':' in line:
-                                parts = line.split(':', 1)
-                                if len(parts) == 2 and parts[0].strip() and parts[1].strip():
-                                    count += 1
-                        g_item["entry_count"] = count
-                        if count == 0: g_item["error_key"] = "glossary_error_no_valid"
-                except Exception as e:
-                    g_item["error_key"] = "glossary_item_error"
-                    g_item["error_detail"] = str(e)
-                    self.log_message("log_glossary_error", os.path.basename(path), str(e))
+            g_item["error_key"] = compiled.error_key
+            g_item["error_detail"] = compiled.error_detail
+            if compiled.error_key == "glossary_item_error":
+                self.log_message("log_glossary_error", os.path.basename(path), compiled.error_detail)
         self.prompt_glossary_panel.update_glossary_list_display(self.glossary_files)
-
-    def _get_combined_glossary_content(self):
-        combined_glossary_for_prompt = []
-        total_valid_entries = 0
-        for glossary_item_info in self.glossary_files:
-            if glossary_item_info.get("entry_count", 0) > 0 and not glossary_item_info.get("error_key"):
-                filepath = glossary_item_info["path"]
-                try:
-                    with codecs.open(filepath, 'r', encoding='utf-8-sig') as f:
-                        lines = [line.strip() for line in f if line.strip()]
-                    current_file_entries = 0
-                    for line in lines:
-                        if ':' in line:
-                            parts = line.split(':', 1)
-                            if len(parts) == 2 and parts[0].strip() and parts[1].strip():
-                                combined_glossary_for_prompt.append(f"- \"{parts[0].strip()}\" should be translated as \"{parts[1].strip()}\"")
-                                current_file_entries +=1
-                    total_valid_entries += current_file_entries
-                except Exception: pass
-        if not combined_glossary_for_prompt: return ""
-        self.log_message("log_combined_glossary_info", total_valid_entries)
-        header = "Please refer to the following glossary for translation. Ensure these terms are translated as specified:\n"
-        return header + "\n".join(combined_glossary_for_prompt) + "\n\n"
+        self.prompt_glossary_panel.update_glossary_search_results()
+
+    def _load_glossary_entries(self):
+        """유효한 용어집 파일의 (용어, 번역) 목록"""
+        valid_paths = [g["path"] for g in self.glossary_files if g.get("entry_count", 0) > 0 and not g.get("error_key")]
+        glossary_entries, conflicts = self.glossary_store.combine(valid_paths)
+        if conflicts:
+            examples = ", ".join(f"{term} ({' / '.join(translations)})" for term, translations in conflicts[:5])
+            self.log_message("log_glossary_conflicts", len(conflicts), examples)
+        return glossary_entries
+
+    def _lookup_glossary_terms(self, prefix):
+        """유효한 용어집에서 prefix로 시작하는 용어의 (용어, 번역) 목록 (용어집 패널의 용어 찾기)"""
+        if not prefix.strip():
+            return []
+        valid_paths = [g["path"] for g in self.glossary_files if g.get("entry_count", 0) > 0 and not g.get("error_key")]
+        return self.glossary_store.lookup_prefix(valid_paths, prefix)
+
+    def _get_combined_glossary_content(self, glossary_entries=None):
+        if glossary_entries is None:
+            glossary_entries = self._load_glossary_entries()
+        if not glossary_entries: return ""
+        self.log_message("log_combined_glossary_info", len(glossary_entries))
+        return format_glossary_section(glossary_entries)
 
 
     def collect_translation_stats(self, file_path, stats_dict):
@@ -635,6 +658,14 @@ Text to translate:
             messagebox.showwarning(self.texts.get("warn_title"), self.texts.get("warn_already_processing"))
             return
 
+        # 엔진 종류 설정이 바뀌었으면 번역 시작 전에 교체
+        if isinstance(self.translator_engine, AsyncTranslatorEngine) != self.use_async_engine_var.get():
+            old_engine = self.translator_engine
+            # 정리 시 공유 중지 이벤트를 건드리지 않도록 별도 이벤트로 분리
+            old_engine.stop_event = threading.Event()
+            old_engine.cleanup_resources()
+            self.translator_engine = self._create_translator_engine()
+
         if hasattr(self, 'log_panel'): self.log_panel.clear_log()
 
         # 새 번역 시작 시 통계 초기화 (선택적)
@@ -653,7 +684,8 @@ Text to translate:
             self.translator_engine.preview_callback = None
 
         self._update_glossary_list_ui_data()
-        combined_glossary = self._get_combined_glossary_content()
+        glossary_entries = self._load_glossary_entries()
+        combined_glossary = self._get_combined_glossary_content(glossary_entries)
         output_dir = self.output_folder_var.get()
         if not output_dir:
             messagebox.showerror(self.texts.get("error_title"), self.texts.get("error_output_folder_needed"))
@@ -678,7 +710,6 @@ Text to translate:
             glossary_content=combined_glossary,
             batch_size_val=self.batch_size_var.get(),
             max_tokens_val=self.max_tokens_var.get(),
-            delay_val=self.delay_between_batches_var.get(),
             temperature_val=self.temperature_var.get(),
             max_workers_val=self.max_workers_var.get(),
             keep_identifier_val=self.keep_lang_def_unchanged_var.get(),
@@ -689,7 +720,17 @@ Text to translate:
             max_retries=self.max_retries_var.get(),
             preview_callback=self.add_preview_line if (hasattr(self, 'live_preview_panel') and self.enable_live_preview.get()) else None,
             stats_callback=self.collect_translation_stats,  # 항상 메인 윈도우의 메서드 사용
-            enable_backup=self.enable_backup_var.get()
+            enable_backup=self.enable_backup_var.get(),
+            use_translation_memory=self.use_translation_memory_var.get(),
+            requests_per_minute=self.requests_per_minute_var.get(),
+            tokens_per_minute=self.tokens_per_minute_var.get(),
+            batch_token_budget=self.batch_token_budget_var.get(),
+            use_values_only_payload=self.use_values_only_payload_var.get(),
+            use_json_response=self.use_json_response_var.get(),
+            glossary_entries=glossary_entries,
+            enforce_glossary=self.enforce_glossary_var.get(),
+            incremental_translation=self.incremental_translation_var.get(),
+            gap_fill_mode=self.gap_fill_mode_var.get()
         )
 
     def stop_translation(self):
@@ -725,14 +766,18 @@ Text to translate:
             messagebox.showerror(self.texts.get("error_title"), self.texts.get("error_numeric_setting_invalid") + f" ({self.texts.get('concurrent_files_label')[:-1]})"); return False
         if not is_valid_int(self.max_tokens_var, 100, 65536): # Gemini 모델 최대값 고려 (flash 모델은 더 높음)
             messagebox.showerror(self.texts.get("error_title"), self.texts.get("error_numeric_setting_invalid") + f" ({self.texts.get('max_output_tokens_label')[:-1]})"); return False
-        if not is_valid_float(self.delay_between_batches_var, 0.0, 60.0):
-            messagebox.showerror(self.texts.get("error_title"), self.texts.get("error_numeric_setting_invalid") + f" ({self.texts.get('batch_delay_label')[:-1]})"); return False
         if not is_valid_int(self.split_threshold_var, 0, 200000): # 0은 분할 안함
             messagebox.showerror(self.texts.get("error_title"), self.texts.get("error_numeric_setting_invalid") + f" ({self.texts.get('split_threshold_label')[:-1]})"); return False
         if not is_valid_float(self.temperature_var, 0.0, 2.0):
             messagebox.showerror(self.texts.get("error_title"), self.texts.get("error_numeric_setting_invalid") + f" ({self.texts.get('temperature_label')[:-1]})"); return False
         if not is_valid_int(self.max_retries_var, 1, 10):
             messagebox.showerror(self.texts.get("error_title"), self.texts.get("error_numeric_setting_invalid") + f" ({self.texts.get('max_retries_label')[:-1]})"); return False
+        if not is_valid_int(self.requests_per_minute_var, 0, 100000): # 0은 제한 안함
+            messagebox.showerror(self.texts.get("error_title"), self.texts.get("error_numeric_setting_invalid") + f" ({self.texts.get('requests_per_minute_label')[:-1]})"); return False
+        if not is_valid_int(self.tokens_per_minute_var, 0, 100000000): # 0은 제한 안함
+            messagebox.showerror(self.texts.get("error_title"), self.texts.get("error_numeric_setting_invalid") + f" ({self.texts.get('tokens_per_minute_label')[:-1]})"); return False
+        if not is_valid_int(self.batch_token_budget_var, 100, 65536):
+            messagebox.showerror(self.texts.get("error_title"), self.texts.get("error_numeric_setting_invalid") + f" ({self.texts.get('batch_token_budget_label')[:-1]})"); return False
 
         current_prompt = self.prompt_glossary_panel.get_prompt_text() if hasattr(self, 'prompt_glossary_panel') else ""
         required_placeholders = ["{source_lang_for_prompt}", "{target_lang_for_prompt}", "{glossary_section}", "{batch_text}"]
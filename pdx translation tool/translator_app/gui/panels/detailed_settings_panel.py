@@ -34,12 +34,6 @@ class DetailedSettingsPanel(ctk.CTkFrame):
         self.max_tokens_entry_widget.grid(row=2, column=1, sticky="w", padx=(5,10), pady=5)
         self.max_tokens_spinbox_tooltip = Tooltip(self.max_tokens_entry_widget, "")
 
-        self.batch_delay_label_widget = ctk.CTkLabel(self)
-        self.batch_delay_label_widget.grid(row=2, column=2, sticky="w", padx=(20,10), pady=5)
-        self.delay_entry_widget = ctk.CTkEntry(self, textvariable=self.main_app.delay_between_batches_var, width=80, justify='center')
-        self.delay_entry_widget.grid(row=2, column=3, sticky="w", padx=(5,10), pady=5)
-        self.delay_spinbox_tooltip = Tooltip(self.delay_entry_widget, "")
-
         # Row 3 - 파일 분할 임계값과 온도
         self.split_threshold_label = ctk.CTkLabel(self)
         self.split_threshold_label.grid(row=3, column=0, sticky="w", padx=10, pady=5)
@@ -65,23 +59,42 @@ class DetailedSettingsPanel(ctk.CTkFrame):
         self.max_retries_entry.grid(row=4, column=1, sticky="w", padx=(5,10), pady=5)
         self.max_retries_tooltip = Tooltip(self.max_retries_entry, "")
 
-        # Row 5 - 체크박스들
+        self.requests_per_minute_label = ctk.CTkLabel(self)
+        self.requests_per_minute_label.grid(row=4, column=2, sticky="w", padx=(20,10), pady=5)
+        self.requests_per_minute_entry = ctk.CTkEntry(self, textvariable=self.main_app.requests_per_minute_var, width=80, justify='center')
+        self.requests_per_minute_entry.grid(row=4, column=3, sticky="w", padx=(5,10), pady=5)
+        self.requests_per_minute_tooltip = Tooltip(self.requests_per_minute_entry, "")
+
+        # Row 5 - 분당 토큰 한도
+        self.tokens_per_minute_label = ctk.CTkLabel(self)
+        self.tokens_per_minute_label.grid(row=5, column=0, sticky="w", padx=10, pady=5)
+        self.tokens_per_minute_entry = ctk.CTkEntry(self, textvariable=self.main_app.tokens_per_minute_var, width=80, justify='center')
+        self.tokens_per_minute_entry.grid(row=5, column=1, sticky="w", padx=(5,10), pady=5)
+        self.tokens_per_minute_tooltip = Tooltip(self.tokens_per_minute_entry, "")
+
+        self.batch_token_budget_label = ctk.CTkLabel(self)
+        self.batch_token_budget_label.grid(row=5, column=2, sticky="w", padx=(20,10), pady=5)
+        self.batch_token_budget_entry = ctk.CTkEntry(self, textvariable=self.main_app.batch_token_budget_var, width=80, justify='center')
+        self.batch_token_budget_entry.grid(row=5, column=3, sticky="w", padx=(5,10), pady=5)
+        self.batch_token_budget_tooltip = Tooltip(self.batch_token_budget_entry, "")
+
+        # Row 6 - 체크박스들
         self.lang_def_option_check_widget = ctk.CTkCheckBox(self, variable=self.main_app.keep_lang_def_unchanged_var, onvalue=True, offvalue=False)
-        self.lang_def_option_check_widget.grid(row=5, column=0, columnspan=2, sticky="w", padx=10, pady=(10,5))
+        self.lang_def_option_check_widget.grid(row=6, column=0, columnspan=2, sticky="w", padx=10, pady=(10,5))
         self.lang_def_option_check_tooltip = Tooltip(self.lang_def_option_check_widget, "")
 
         self.internal_lang_check_widget = ctk.CTkCheckBox(self, variable=self.main_app.check_internal_lang_var, onvalue=True, offvalue=False)
-        self.internal_lang_check_widget.grid(row=5, column=2, columnspan=2, sticky="w", padx=10, pady=(10,5))
+        self.internal_lang_check_widget.grid(row=6, column=2, columnspan=2, sticky="w", padx=10, pady=(10,5))
         self.internal_lang_check_tooltip = Tooltip(self.internal_lang_check_widget, "")
 
-        # Row 6 - 기번역 건너뛰기
+        # Row 7 - 기번역 건너뛰기
         self.skip_translated_check = ctk.CTkCheckBox(
             self, 
             variable=self.main_app.skip_already_translated_var,
             onvalue=True, 
             offvalue=False
         )
-        self.skip_translated_check.grid(row=6, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
+        self.skip_translated_check.grid(row=7, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
         self.skip_translated_tooltip = Tooltip(self.skip_translated_check, "")
 
         self.backup_check = ctk.CTkCheckBox(
@@ -92,10 +105,87 @@ class DetailedSettingsPanel(ctk.CTkFrame):
             onvalue=True,
             offvalue=False
         )
-        self.backup_check.grid(row=7, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
+        self.backup_check.grid(row=8, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
         # Tooltip도 빈 텍스트로 초기화
         self.backup_tooltip = Tooltip(self.backup_check, "") 
 
+        # Row 9 - 번역 메모리
+        self.translation_memory_check = ctk.CTkCheckBox(
+            self,
+            text="",
+            variable=self.main_app.use_translation_memory_var,
+            onvalue=True,
+            offvalue=False
+        )
+        self.translation_memory_check.grid(row=9, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
+        self.translation_memory_tooltip = Tooltip(self.translation_memory_check, "")
+
+        # Row 10 - 비동기 엔진
+        self.async_engine_check = ctk.CTkCheckBox(
+            self,
+            text="",
+            variable=self.main_app.use_async_engine_var,
+            onvalue=True,
+            offvalue=False
+        )
+        self.async_engine_check.grid(row=10, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
+        self.async_engine_tooltip = Tooltip(self.async_engine_check, "")
+
+        # Row 11 - 값만 전송
+        self.values_only_payload_check = ctk.CTkCheckBox(
+            self,
+            text="",
+            variable=self.main_app.use_values_only_payload_var,
+            onvalue=True,
+            offvalue=False
+        )
+        self.values_only_payload_check.grid(row=11, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
+        self.values_only_payload_tooltip = Tooltip(self.values_only_payload_check, "")
+
+        # Row 12 - JSON 응답
+        self.json_response_check = ctk.CTkCheckBox(
+            self,
+            text="",
+            variable=self.main_app.use_json_response_var,
+            onvalue=True,
+            offvalue=False
+        )
+        self.json_response_check.grid(row=12, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
+        self.json_response_tooltip = Tooltip(self.json_response_check, "")
+
+        # Row 13 - 용어집 준수 검사
+        self.enforce_glossary_check = ctk.CTkCheckBox(
+            self,
+            text="",
+            variable=self.main_app.enforce_glossary_var,
+            onvalue=True,
+            offvalue=False
+        )
+        self.enforce_glossary_check.grid(row=13, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
+        self.enforce_glossary_tooltip = Tooltip(self.enforce_glossary_check, "")
+
+        # Row 14 - 증분 번역
+        self.incremental_translation_check = ctk.CTkCheckBox(
+            self,
+            text="",
+            variable=self.main_app.incremental_translation_var,
+            onvalue=True,
+            offvalue=False
+        )
+        self.incremental_translation_check.grid(row=14, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
+        self.incremental_translation_tooltip = Tooltip(self.incremental_translation_check, "")
+
+        # Row 15 - 빈칸 채우기
+        self.gap_fill_mode_check = ctk.CTkCheckBox(
+            self,
+            text="",
+            variable=self.main_app.gap_fill_mode_var,
+            onvalue=True,
+            offvalue=False
+        )
+        self.gap_fill_mode_check.grid(row=15, column=0, columnspan=4, sticky="w", padx=10, pady=(10,5))
+        self.gap_fill_mode_tooltip = Tooltip(self.gap_fill_mode_check, "")
+
         self.update_language()
 
     def update_language(self):
@@ -107,8 +197,6 @@ class DetailedSettingsPanel(ctk.CTkFrame):
         self.max_workers_spinbox_tooltip.update_text(texts.get("concurrent_files_tooltip"))
         self.max_output_tokens_label_widget.configure(text=texts.get("max_output_tokens_label"))
         self.max_tokens_spinbox_tooltip.update_text(texts.get("max_output_tokens_tooltip"))
-        self.batch_delay_label_widget.configure(text=texts.get("batch_delay_label"))
-        self.delay_spinbox_tooltip.update_text(texts.get("batch_delay_tooltip"))
         
         self.split_threshold_label.configure(text=texts.get("split_threshold_label"))
         self.split_threshold_tooltip.update_text(texts.get("split_threshold_tooltip"))
@@ -119,6 +207,13 @@ class DetailedSettingsPanel(ctk.CTkFrame):
         self.max_retries_label.configure(text=texts.get("max_retries_label"))
         self.max_retries_tooltip.update_text(texts.get("max_retries_tooltip"))
 
+        self.requests_per_minute_label.configure(text=texts.get("requests_per_minute_label"))
+        self.requests_per_minute_tooltip.update_text(texts.get("requests_per_minute_tooltip"))
+        self.tokens_per_minute_label.configure(text=texts.get("tokens_per_minute_label"))
+        self.tokens_per_minute_tooltip.update_text(texts.get("tokens_per_minute_tooltip"))
+        self.batch_token_budget_label.configure(text=texts.get("batch_token_budget_label"))
+        self.batch_token_budget_tooltip.update_text(texts.get("batch_token_budget_tooltip"))
+
         self.lang_def_option_check_widget.configure(text=texts.get("keep_identifier_label"))
         self.lang_def_option_check_tooltip.update_text(texts.get("keep_identifier_tooltip"))
         self.internal_lang_check_widget.configure(text=texts.get("check_internal_lang_label"))
@@ -128,4 +223,25 @@ class DetailedSettingsPanel(ctk.CTkFrame):
         self.skip_translated_tooltip.update_text(texts.get("skip_already_translated_tooltip"))
 
         self.backup_check.configure(text=texts.get("enable_backup_label"))
-        self.backup_tooltip.update_text(texts.get("enable_backup_tooltip"))
\ No newline at end of file
+        self.backup_tooltip.update_text(texts.get("enable_backup_tooltip"))
+
+        self.translation_memory_check.configure(text=texts.get("use_translation_memory_label"))
+        self.translation_memory_tooltip.update_text(texts.get("use_translation_memory_tooltip"))
+
+        self.async_engine_check.configure(text=texts.get("use_async_engine_label"))
+        self.async_engine_tooltip.update_text(texts.get("use_async_engine_tooltip"))
+
+        self.values_only_payload_check.configure(text=texts.get("use_values_only_payload_label"))
+        self.values_only_payload_tooltip.update_text(texts.get("use_values_only_payload_tooltip"))
+
+        self.json_response_check.configure(text=texts.get("use_json_response_label"))
+        self.json_response_tooltip.update_text(texts.get("use_json_response_tooltip"))
+
+        self.enforce_glossary_check.configure(text=texts.get("enforce_glossary_label"))
+        self.enforce_glossary_tooltip.update_text(texts.get("enforce_glossary_tooltip"))
+
+        self.incremental_translation_check.configure(text=texts.get("incremental_translation_label"))
+        self.incremental_translation_tooltip.update_text(texts.get("incremental_translation_tooltip"))
+
+        self.gap_fill_mode_check.configure(text=texts.get("gap_fill_mode_label"))
+        self.gap_fill_mode_tooltip.update_text(texts.get("gap_fill_mode_tooltip"))
\ No newline at end of file
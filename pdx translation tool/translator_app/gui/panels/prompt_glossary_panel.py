@@ -64,6 +64,15 @@ class PromptGlossaryPanel(ctk.CTkFrame):
         self.add_glossary_btn.grid(row=2, column=0, pady=(8, 0), sticky="ew")
         self.add_glossary_btn_tooltip = Tooltip(self.add_glossary_btn, "")
 
+        # 용어 찾기 - 입력한 글자로 시작하는 용어를 불러온 용어집에서 조회
+        self.glossary_search_entry = ctk.CTkEntry(glossary_manage_subframe)
+        self.glossary_search_entry.grid(row=3, column=0, pady=(8, 0), sticky="ew")
+        self.glossary_search_entry.bind("<KeyRelease>", self.update_glossary_search_results)
+        self.glossary_search_entry_tooltip = Tooltip(self.glossary_search_entry, "")
+
+        self.glossary_search_result_label = ctk.CTkLabel(glossary_manage_subframe, text="", anchor="w", justify="left")
+        self.glossary_search_result_label.grid(row=4, column=0, pady=(4, 0), sticky="ew")
+
         self.update_language()
 
     def get_prompt_text(self):
@@ -105,6 +114,17 @@ class PromptGlossaryPanel(ctk.CTkFrame):
             remove_btn = ctk.CTkButton(item_frame, text="X", width=30, height=20, command=lambda fp=file_path: self.main_app._remove_glossary_file(fp))
             remove_btn.grid(row=0, column=1, sticky="e")
 
+    def update_glossary_search_results(self, event=None):
+        prefix = self.glossary_search_entry.get()
+        if not prefix.strip():
+            self.glossary_search_result_label.configure(text="")
+            return
+        matches = self.main_app._lookup_glossary_terms(prefix)
+        if not matches:
+            self.glossary_search_result_label.configure(text=self.main_app.texts.get("glossary_search_no_results", "일치하는 용어 없음"))
+            return
+        self.glossary_search_result_label.configure(text="\n".join(f"{term} → {translation}" for term, translation in matches[:5]))
+
     def update_language(self):
         texts = self.main_app.texts
         self.pg_title_label.configure(text=texts.get("prompt_glossary_frame_title"))
@@ -119,6 +139,9 @@ class PromptGlossaryPanel(ctk.CTkFrame):
         self.glossary_manage_title_label.configure(text=texts.get("glossary_management_frame_title"))
         self.add_glossary_btn.configure(text=texts.get("add_glossary_button"))
         self.add_glossary_btn_tooltip.update_text(texts.get("add_glossary_button_tooltip"))
+        self.glossary_search_entry.configure(placeholder_text=texts.get("glossary_search_placeholder"))
+        self.glossary_search_entry_tooltip.update_text(texts.get("glossary_search_tooltip"))
+        self.update_glossary_search_results()
         
     def get_prompt(self):
 
@@ -2,10 +2,10 @@ import customtkinter as ctk
 import os
 import yaml
 import threading
-import codecs
 from collections import defaultdict
 from tkinter import filedialog, messagebox
 from ...utils.localization import get_text
+from ...core.yml_lexer import read_yml_file
 
 
 class TermConsistencyChecker(ctk.CTkToplevel):
@@ -322,40 +322,25 @@ class TermConsistencyChecker(ctk.CTkToplevel):
                 print(f"File does not exist: {filepath}")
                 return {}
                 
-            with codecs.open(filepath, 'r', 'utf-8-sig') as f:
-                content = f.read()
-            
-            if not content.strip():
+            records = read_yml_file(filepath)
+            if not records:
                 print(f"File is empty: {filepath}")
                 return {}
                 
-            # Handle YAML files that might not be properly formatted
+            # Same parser as the translator: key without version, value inside quotes (comments stripped)
             data = {}
             line_count = 0
-            for line_num, line in enumerate(content.split('\n'), 1):
-                line = line.strip()
-                if ':' in line and not line.startswith('#') and line:
-                    try:
-                        # Handle cases where there might be multiple colons
-                        colon_index = line.find(':')
-                        key = line[:colon_index].strip()
-                        value = line[colon_index + 1:].strip()
-                        
-                        # Extract quoted strings
-                        if value.startswith('"') and value.endswith('"') and len(value) > 1:
-                            value = value[1:-1]
-                        elif value.startswith("'") and value.endswith("'") and len(value) > 1:
-                            value = value[1:-1]
-                        
-                        # Skip empty values or keys with special characters that aren't translations
-                        if key and value and not key.startswith(' ') and len(value) > 1:
-                            # Skip lines that look like comments or structural YAML
-                            if not any(char in key for char in ['[', ']', '{', '}', '@', '$']):
-                                data[key] = value
-                                line_count += 1
-                    except Exception as e:
-                        print(f"Error parsing line {line_num} in {filepath}: {e}")
-                        continue
+            for record in records:
+                if not record.is_entry:
+                    continue
+                key = record.key
+                value = record.value
+                # Skip empty values or keys with special characters that aren't translations
+                if value and len(value) > 1:
+                    # Skip lines that look like comments or structural YAML
+                    if not any(char in key for char in ['[', ']', '{', '}', '@', '$']):
+                        data[key] = value
+                        line_count += 1
             
             print(f"Loaded {line_count} entries from {filepath}")
             return data
@@ -79,13 +79,11 @@ LANGUAGES = {
         # 2.5. 번역 상세 설정 (Detailed Translation Settings)
         "detailed_settings_frame": "번역 상세 설정",
         "batch_size_label": "배치 크기:",
-        "batch_size_tooltip": "한 번에 API로 보내 번역할 텍스트 라인(줄)의 수입니다.\n너무 크면 API가 응답하지 않거나 오류가 발생할 수 있습니다.",
-        "concurrent_files_label": "동시 파일 수:",
-        "concurrent_files_tooltip": "여러 파일을 동시에 번역할 때, 한 번에 몇 개까지 병렬로 처리할지 설정합니다.\n컴퓨터 성능에 따라 조절하세요.",
+        "batch_size_tooltip": "한 번에 API로 보내 번역할 텍스트 라인(줄) 수의 상한입니다.\n배치는 배치 토큰 예산에 맞춰 나뉘므로 긴 문장이 많으면 이보다 적게 보냅니다.",
+        "concurrent_files_label": "동시 작업 수:",
+        "concurrent_files_tooltip": "모든 파일의 배치를 한 번에 몇 개까지 병렬로 번역할지 설정합니다.\n파일 수나 크기와 관계없이 이 수만큼의 작업 스레드만 사용합니다.",
         "max_output_tokens_label": "최대 출력 토큰:",
         "max_output_tokens_tooltip": "번역 결과물(텍스트)의 최대 길이를 토큰 단위로 제한합니다.\n선택한 모델의 최대 토큰 한도를 넘지 않도록 주의하세요.",
-        "batch_delay_label": "배치 간 대기(초):",
-        "batch_delay_tooltip": "각 번역 배치 요청 사이에 얼마 동안 대기할지 설정합니다 (초 단위).\nAPI의 분당 요청 한도를 초과하지 않도록 돕습니다.",
         "max_retries_label": "재시도 횟수:",
         "max_retries_tooltip": "번역 실패 시 최대 재시도 횟수를 설정합니다. (1-10)",
         "split_threshold_label": "파일 분할 기준(줄):",
@@ -98,6 +96,26 @@ LANGUAGES = {
         "skip_already_translated_tooltip": "대상 언어의 문자가 포함된 라인은 이미 번역된 것으로 간주하고 건너뜁니다.",
         "enable_backup_label": "자동 백업 활성화",
         "enable_backup_tooltip": "파일을 덮어쓰기 전에 백업을 생성합니다",
+        "use_translation_memory_label": "번역 메모리 사용",
+        "use_translation_memory_tooltip": "이전에 번역한 동일한 문장(같은 언어쌍/모델/프롬프트/용어집)은 API를 호출하지 않고 재사용합니다.",
+        "requests_per_minute_label": "분당 요청 한도(RPM):",
+        "requests_per_minute_tooltip": "모든 작업 스레드가 공유하는 분당 API 요청 수 한도입니다. 사용 중인 API 등급에 맞게 설정하세요. (0이면 제한 안 함)",
+        "tokens_per_minute_label": "분당 토큰 한도(TPM):",
+        "tokens_per_minute_tooltip": "모든 작업 스레드가 공유하는 분당 토큰 수 한도입니다. 한도에 도달하면 429 오류 대신 대기열에서 기다립니다. (0이면 제한 안 함)",
+        "use_async_engine_label": "비동기 엔진 사용 (asyncio)",
+        "use_async_engine_tooltip": "스레드 대신 asyncio로 요청을 보냅니다. 적은 수의 스레드로 '동시 작업 수'만큼의 요청을 동시에 처리하며, 중지 시 진행 중인 요청도 취소됩니다.",
+        "batch_token_budget_label": "배치 토큰 예산:",
+        "batch_token_budget_tooltip": "배치 하나의 예상 출력 토큰 수 상한입니다. 라인별 토큰 수(대상 언어에 따른 증가율 포함)를 추정해 이 예산에 맞게 배치를 나누고, 요청마다 최대 출력 토큰도 추정치에 맞춰 설정합니다.",
+        "use_values_only_payload_label": "값만 전송 (키는 로컬에서 재구성)",
+        "use_values_only_payload_tooltip": "체크 시: 키, 버전 번호, 주석, 빈 줄 없이 따옴표 안의 값만 짧은 번호와 함께 API로 보냅니다.\n응답은 번호로 원래 라인에 맞춰 넣으므로 키가 사라지지 않고 요청 토큰이 크게 줄어듭니다.",
+        "use_json_response_label": "JSON 응답 모드 (id별 정렬)",
+        "use_json_response_tooltip": "체크 시: 모델에게 id별 JSON 객체로 응답하도록 요청합니다(응답 스키마 사용).\n결과는 위치가 아닌 id로 맞추며, 빠지거나 잘못된 id만 다시 요청합니다. 값만 전송 형식을 함께 사용합니다.",
+        "enforce_glossary_label": "용어집 준수 검사",
+        "enforce_glossary_tooltip": "체크 시: 번역 후 원문에 나온 용어집 용어의 번역어가 결과에 있는지 검사합니다.\n원문 용어가 그대로 남은 경우는 바로 치환하고, 나머지 위반 라인만 한 번 다시 요청합니다. 파일별 준수율을 로그에 표시합니다.",
+        "incremental_translation_label": "증분 번역 (바뀐 키만 번역)",
+        "incremental_translation_tooltip": "체크 시: 출력 파일 옆에 키별 원문 해시를 담은 매니페스트(.manifest.json)를 저장합니다.\n다음 실행에서 새로 생겼거나 바뀐 키만 번역하고, 나머지는 기존 출력의 번역을 그대로 씁니다. 모델/프롬프트/용어집이 바뀌면 전체를 다시 번역합니다.",
+        "gap_fill_mode_label": "빈칸 채우기 (대상 파일에 없는 키만 번역)",
+        "gap_fill_mode_tooltip": "체크 시: 출력 폴더에 이미 있는 대상 파일(부분 번역이나 수동 번역)을 키 기준으로 읽어, 그 파일에 없는 키만 번역합니다.\n기존 라인은 바이트 그대로 유지하고, 결과는 원본 파일 순서로 합칩니다. 매니페스트가 있는 파일은 증분 번역을 우선합니다.",
 
         # 2.6. 프롬프트 및 용어집 (Prompt & Glossary)
         "prompt_glossary_frame_title": "프롬프트 및 용어집 관리",
@@ -124,6 +142,9 @@ LANGUAGES = {
         "glossary_error_not_found": "파일 없음",
         "glossary_error_empty": "빈 파일",
         "glossary_error_no_valid": "유효 항목 없음",
+        "glossary_search_placeholder": "용어 찾기 (앞 글자 입력)",
+        "glossary_search_tooltip": "입력한 글자로 시작하는 용어를 불러온 용어집에서 찾아 번역과 함께 보여줍니다.",
+        "glossary_search_no_results": "일치하는 용어 없음",
 
         # 2.7. 제어판 및 진행상황 (Control Panel & Progress)
         "translate_button": "번역 시작",
@@ -185,7 +206,6 @@ LANGUAGES = {
         "log_first_line_change": "  파일 첫 줄 식별자를 '{0}'에서 '{1}'(으)로 변경합니다.",
         "log_output_filename_change": "  출력 파일명을 '{0}'에서 '{1}'(으)로 변경합니다.",
         "log_backup_created": "백업 파일 생성: {0}",
-        "log_checkpoint_found": "파일 '{0}'의 체크포인트 발견. {1}줄부터 재개합니다.",
         "log_translation_complete_save": "번역 완료! 파일 '{0}'(으)로 저장되었습니다.",
         "log_all_translation_done": "모든 파일의 번역 작업이 완료되었습니다!",
         "log_stop_requested": "작업 중지 요청됨...",
@@ -199,6 +219,16 @@ LANGUAGES = {
         "log_combined_glossary_empty": "병합된 용어집이 비어있습니다.",
         "log_combined_glossary_info": "병합된 용어집에서 {0}개 유효 항목을 사용합니다.",
         "log_retrying_missing_lines": "누락된 {0}개 라인 재번역 시도 중... (시도 {1}/3)",
+        "log_glossary_conflicts": "용어집에서 번역이 서로 다른 용어 {0}개를 발견했습니다: {1}",
+        "log_journal_resume": "파일 '{0}'의 번역 기록 발견. 완료된 배치 {1}개({2}줄)를 복원하고 남은 배치만 번역합니다.",
+        "log_journal_discarded": "파일 '{0}'의 원본 또는 번역 설정이 바뀌어 이전 번역 기록을 버리고 새로 시작합니다.",
+        "log_incremental_plan": "[{0}] 증분 번역: 재사용 {1}개, 새로 번역 {2}개, 삭제된 키 {3}개",
+        "log_manifest_error": "[{0}] 매니페스트 저장 오류: {1}",
+        "log_gap_fill_mode": "빈칸 채우기 모드: 기존 대상 파일에 없는 키만 번역합니다.",
+        "log_gap_fill_plan": "[{0}] 빈칸 채우기: 기존 라인 {1}개 유지, 누락된 키 {2}개 번역, 원본에 없는 키 {3}개 제외",
+        "log_passthrough_values": "[{0}] 번역할 필요가 없는 값 {1}개(코드/숫자/경로/GFX_/키 그대로)는 API로 보내지 않고 원문 그대로 둡니다.",
+        "log_file_no_translatable_values": "[{0}] 번역할 값이 없어 API 호출 없이 원문 그대로 저장합니다.",
+        "log_file_all_reused": "[{0}] 바뀐 라인이 없어 기존 번역을 그대로 재사용해 저장합니다 (API 호출 없음).",
 
         # 3.2. 오류/경고 로그 (Error/Warning Logs)
         "error_api_key_needed": "Gemini API 키를 입력해야 합니다.",
@@ -281,6 +311,27 @@ LANGUAGES = {
         "log_source_remnant_detected": "Source language remnant detected in line {}: {}...",
         "log_batch_retry_source_remnants": "Retrying batch due to source language remnants ({}/{} lines affected). Retry {}/{}",
 
+        # 3.5. 성능 최적화 관련 로그 (Optimization Logs)
+        "log_tm_batch_hits": "파일 '{0}': 번역 메모리에서 {1}개 라인 재사용 (배치 {2}줄)",
+        "log_tm_summary": "번역 메모리: 적중 {0}, 미적중 {1} (적중률 {2}), 저장된 항목 {3}개",
+        "log_tm_error": "번역 메모리 오류: {0}",
+        "log_dedup_scan_result": "중복 제거 분석: 전체 값 {0}개, 고유 값 {1}개, 여러 번 등장하는 값 {2}개",
+        "log_duplicate_files_detected": "내용이 동일한 파일 {0}개 발견 ({1}개 그룹) - 각 그룹은 한 번만 번역합니다.",
+        "log_duplicate_file_copied": "파일 '{0}'은(는) '{1}'과(와) 내용이 같아 번역 결과를 복사했습니다.",
+        "log_dedup_summary": "중복 제거로 {0}개 값의 번역 결과를 공유했습니다.",
+        "log_rate_limited_backoff": "파일 '{0}': API 요청 한도 초과(429). 모든 요청을 {1}초 동안 멈춘 뒤 재시도합니다. ({2}/{3})",
+        "log_batch_retry_failed_lines": "파일 '{0}': 요청한 {2}줄 중 실패한 {1}줄(원본 언어 잔존 {3}줄)만 다시 요청합니다. ({4}/{5})",
+        "log_prompt_static_tokens": "프롬프트의 고정 부분(규칙/게임 설명/용어집, 약 {0} 토큰)을 시스템 지시로 한 번만 전달합니다.",
+        "log_prompt_cache_created": "고정 프롬프트(약 {0} 토큰)를 캐시된 콘텐츠로 등록했습니다.",
+        "log_prompt_cache_unavailable": "프롬프트 캐시를 사용할 수 없어 시스템 지시로 대체합니다: {0}",
+        "log_prompt_token_summary": "프롬프트 토큰(추정): 고정 부분 {0} 토큰, 요청 {1}회의 배치 부분 합계 {2} 토큰, API가 보고한 캐시 적중 {3} 토큰",
+        "log_glossary_index_built": "용어집 {0}개 항목의 색인을 만들었습니다. 요청마다 배치에 나오는 용어만 넣습니다.",
+        "log_glossary_injection_summary": "용어집: 요청당 평균 {0}개 항목만 전송 (전체 {1}개 항목)",
+        "log_glossary_rerequest": "[{0}] 용어집을 따르지 않은 {1}개 라인을 다시 요청합니다.",
+        "log_glossary_compliance": "[{0}] 용어집 준수율 {1}% ({2}/{3}개 라인, 로컬 치환 {4}개)",
+        "log_check_cache_summary": "검사 결과 캐시: 적중 {0}회, 미스 {1}회, 한도 초과로 제거 {2}개",
+        "log_dedup_template_result": "템플릿 중복 제거: 게임 코드/숫자만 다른 값을 묶어 고유 값 {0}개를 템플릿 {1}개로 번역합니다.",
+
         # ======================================================================
         # 4. 도구 (Tools)
         # ======================================================================
@@ -462,13 +513,11 @@ LANGUAGES = {
         # 2.5. Detailed Translation Settings
         "detailed_settings_frame": "Detailed Translation Settings",
         "batch_size_label": "Batch Size:",
-        "batch_size_tooltip": "The number of text lines to send to the API for translation at once.\nIf too large, the API may not respond or an error may occur.",
-        "concurrent_files_label": "Concurrent Files:",
-        "concurrent_files_tooltip": "When translating multiple files concurrently, set how many to process in parallel at once.\nAdjust according to your computer's performance.",
+        "batch_size_tooltip": "The maximum number of text lines sent to the API for translation at once.\nBatches are also cut by the batch token budget, so fewer lines are sent when they are long.",
+        "concurrent_files_label": "Concurrent Workers:",
+        "concurrent_files_tooltip": "Set how many batches (from all files) are translated in parallel at once.\nOnly this many worker threads are used, regardless of the number or size of files.",
         "max_output_tokens_label": "Max Output Tokens:",
         "max_output_tokens_tooltip": "Limits the maximum length of the translated text in tokens.\nBe careful not to exceed the maximum token limit of the selected model.",
-        "batch_delay_label": "Delay Between Batches (sec):",
-        "batch_delay_tooltip": "Sets how long to wait between each translation batch request (in seconds).\nHelps prevent exceeding the API's requests per minute limit.",
         "max_retries_label": "Max Retries:",
         "max_retries_tooltip": "Set the maximum number of retry attempts for failed translations. (1-10)",
         "split_threshold_label": "File Split Threshold (lines):",
@@ -481,6 +530,26 @@ LANGUAGES = {
         "skip_already_translated_tooltip": "Lines containing target language characters will be considered already translated and skipped.",
         "enable_backup_label": "Enable Automatic Backups",
         "enable_backup_tooltip": "Creates a backup before overwriting a file.",
+        "use_translation_memory_label": "Use Translation Memory",
+        "use_translation_memory_tooltip": "Reuses previous translations of identical strings (same language pair, model, prompt and glossary) without calling the API.",
+        "requests_per_minute_label": "Requests per Minute (RPM):",
+        "requests_per_minute_tooltip": "API request budget per minute shared by all worker threads. Set it to match your API tier. (0 = unlimited)",
+        "tokens_per_minute_label": "Tokens per Minute (TPM):",
+        "tokens_per_minute_tooltip": "Token budget per minute shared by all worker threads. When the budget is used up, requests wait in a queue instead of hitting 429 errors. (0 = unlimited)",
+        "use_async_engine_label": "Use Async Engine (asyncio)",
+        "use_async_engine_tooltip": "Sends requests with asyncio instead of threads. Keeps up to 'Concurrent Workers' requests in flight with only a few threads, and cancels in-flight requests when stopped.",
+        "batch_token_budget_label": "Batch Token Budget:",
+        "batch_token_budget_tooltip": "Upper bound on the estimated output tokens of one batch. Lines are packed into batches by their estimated token count (including target-language expansion), and each request's max output tokens is set from that estimate.",
+        "use_values_only_payload_label": "Send Values Only (Rebuild Keys Locally)",
+        "use_values_only_payload_tooltip": "Checked: Only the quoted values are sent to the API, each with a short numeric id, without keys, version numbers, comments or blank lines.\nResponses are matched back to their lines by id, so keys cannot be lost and request tokens drop substantially.",
+        "use_json_response_label": "JSON Response Mode (Align by ID)",
+        "use_json_response_tooltip": "Checked: Asks the model to reply with a JSON object keyed by line id (using a response schema).\nResults are aligned by id instead of position, and only missing or invalid ids are requested again. Implies the values-only payload.",
+        "enforce_glossary_label": "Enforce glossary",
+        "enforce_glossary_tooltip": "Checked: After translation, checks that each glossary term found in the source has its required translation in the result.\nTerms left untranslated are replaced locally, and only the remaining non-compliant lines are requested once more. Logs a compliance rate per file.",
+        "incremental_translation_label": "Incremental translation (changed keys only)",
+        "incremental_translation_tooltip": "Checked: Saves a manifest (.manifest.json) next to each output file with a hash of every key's source value.\nThe next run translates only new or changed keys and reuses the existing output for the rest. Changing the model, prompt, or glossary re-translates everything.",
+        "gap_fill_mode_label": "Gap-fill (translate only keys missing from the target file)",
+        "gap_fill_mode_tooltip": "Checked: Reads the existing target file in the output folder (a partial or hand-edited translation) by key and translates only the keys it lacks.\nExisting lines stay byte-identical and results are merged in source order. Files with a manifest use incremental translation first.",
 
         # 2.6. Prompt & Glossary
         "prompt_glossary_frame_title": "Prompt & Glossary Management",
@@ -507,6 +576,9 @@ LANGUAGES = {
         "glossary_error_not_found": "File Not Found",
         "glossary_error_empty": "Empty File",
         "glossary_error_no_valid": "No Valid Entries",
+        "glossary_search_placeholder": "Find term (type the beginning)",
+        "glossary_search_tooltip": "Shows terms from the loaded glossaries that start with the typed text, with their translations.",
+        "glossary_search_no_results": "No matching terms",
 
         # 2.7. Control Panel & Progress
         "translate_button": "Start Translation",
@@ -570,7 +642,6 @@ LANGUAGES = {
         "log_first_line_change": "  Changing the first line identifier from '{0}' to '{1}'.",
         "log_output_filename_change": "  Changing output filename from '{0}' to '{1}'.",
         "log_backup_created": "Backup file created: {0}",
-        "log_checkpoint_found": "Checkpoint found for file '{0}'. Resuming from line {1}.",
         "log_translation_complete_save": "Translation complete! Saved to file '{0}'.",
         "log_all_translation_done": "Translation of all files completed!",
         "log_stop_requested": "Stop process requested...",
@@ -584,6 +655,16 @@ LANGUAGES = {
         "log_combined_glossary_empty": "Combined glossary is empty.",
         "log_combined_glossary_info": "Using {0} valid items from the combined glossary.",
         "log_retrying_missing_lines": "Retrying {0} missing lines... (attempt {1}/3)",
+        "log_glossary_conflicts": "Found {0} glossary terms with conflicting translations: {1}",
+        "log_journal_resume": "Translation journal found for file '{0}'. Restored {1} completed batches ({2} lines); translating only the remaining batches.",
+        "log_journal_discarded": "The source or translation settings of file '{0}' changed. Discarding the previous translation journal and starting over.",
+        "log_incremental_plan": "[{0}] Incremental: reusing {1} keys, translating {2} new or changed keys, {3} keys removed",
+        "log_manifest_error": "[{0}] Error saving manifest: {1}",
+        "log_gap_fill_mode": "Gap-fill mode: translating only keys missing from existing target files.",
+        "log_gap_fill_plan": "[{0}] Gap-fill: keeping {1} existing lines, translating {2} missing keys, dropping {3} keys not in the source",
+        "log_passthrough_values": "[{0}] {1} values that never need translation (codes, numbers, paths, GFX_ ids, key copies) are kept as-is without an API call.",
+        "log_file_no_translatable_values": "[{0}] No translatable values; saving the source lines as-is without an API call.",
+        "log_file_all_reused": "[{0}] Nothing changed; saving with the existing translations reused (no API call).",
 
         # 3.2. Error/Warning Logs
         "error_api_key_needed": "Gemini API key is required.",
@@ -666,6 +747,27 @@ LANGUAGES = {
         "log_source_remnant_detected": "Source language remnant detected in line {}: {}...",
         "log_batch_retry_source_remnants": "Retrying batch due to source language remnants ({}/{} lines affected). Retry {}/{}",
 
+        # 3.5. Optimization Logs
+        "log_tm_batch_hits": "File '{0}': Reused {1} lines from translation memory (batch of {2} lines)",
+        "log_tm_summary": "Translation memory: {0} hits, {1} misses (hit rate {2}), {3} stored entries",
+        "log_tm_error": "Translation memory error: {0}",
+        "log_dedup_scan_result": "Deduplication scan: {0} values, {1} unique, {2} repeated across the run",
+        "log_duplicate_files_detected": "Found {0} byte-identical files ({1} groups) - each group is translated once.",
+        "log_duplicate_file_copied": "File '{0}' is identical to '{1}'; copied its translation.",
+        "log_dedup_summary": "Deduplication shared translations for {0} values.",
+        "log_rate_limited_backoff": "File '{0}': API rate limit hit (429). Pausing all requests for {1}s before retrying. ({2}/{3})",
+        "log_batch_retry_failed_lines": "File '{0}': Re-requesting only the {1} failed lines out of {2} ({3} with source-language remnants). ({4}/{5})",
+        "log_prompt_static_tokens": "Sending the static part of the prompt (rules/game context/glossary, ~{0} tokens) once as the system instruction.",
+        "log_prompt_cache_created": "Registered the static prompt (~{0} tokens) as cached content.",
+        "log_prompt_cache_unavailable": "Prompt cache unavailable, using the system instruction instead: {0}",
+        "log_prompt_token_summary": "Prompt tokens (estimated): static part {0} tokens, batch parts {2} tokens in total over {1} requests, cached tokens reported by the API: {3}",
+        "log_glossary_index_built": "Built an index of {0} glossary entries. Each request includes only the terms found in its batch.",
+        "log_glossary_injection_summary": "Glossary: sent {0} entries per request on average (of {1} entries)",
+        "log_glossary_rerequest": "[{0}] Requesting {1} lines again that did not follow the glossary.",
+        "log_glossary_compliance": "[{0}] Glossary compliance {1}% ({2}/{3} lines, {4} terms fixed locally)",
+        "log_check_cache_summary": "Check result cache: {0} hits, {1} misses, {2} evicted by size limits",
+        "log_dedup_template_result": "Template deduplication: {0} unique values reduce to {1} templates that differ only in game codes or numbers.",
+
         # ======================================================================
         # 4. Tools
         # ======================================================================
@@ -907,13 +1009,11 @@ LANGUAGES = {
         # 2.5. 翻译详细设置 (Detailed Translation Settings)
         "detailed_settings_frame": "翻译详细设置",
         "batch_size_label": "批处理大小：",
-        "batch_size_tooltip": "一次发送到 API 进行翻译的文本行数。\n如果设置过大，API 可能无响应或发生错误。",
-        "concurrent_files_label": "并发文件数：",
-        "concurrent_files_tooltip": "同时翻译多个文件时，设置一次并行处理的文件数量。\n请根据您的计算机性能进行调整。",
+        "batch_size_tooltip": "一次发送到 API 进行翻译的文本行数上限。\n批次还会按批次令牌预算拆分，因此长文本较多时发送的行数会更少。",
+        "concurrent_files_label": "并发任务数：",
+        "concurrent_files_tooltip": "设置一次并行翻译多少个批次（来自所有文件）。\n无论文件数量或大小如何，都只使用这么多工作线程。",
         "max_output_tokens_label": "最大输出令牌数：",
         "max_output_tokens_tooltip": "以令牌为单位限制翻译结果（文本）的最大长度。\n请注意不要超过所选模型的最大令牌限制。",
-        "batch_delay_label": "批次间延迟（秒）：",
-        "batch_delay_tooltip": "设置每个翻译批处理请求之间的等待时间（以秒为单位）。\n有助于避免超出 API 每分钟请求限制。",
         "max_retries_label": "最大重试次数：",
         "max_retries_tooltip": "设置翻译失败时的最大重试次数。(1-10)",
         "split_threshold_label": "文件拆分阈值(行)：",
@@ -926,6 +1026,26 @@ LANGUAGES = {
         "skip_already_translated_tooltip": "包含目标语言字符的行将被视为已翻译并跳过。",
         "enable_backup_label": "启用自动备份",
         "enable_backup_tooltip": "在覆盖文件前创建备份。",
+        "use_translation_memory_label": "使用翻译记忆",
+        "use_translation_memory_tooltip": "对之前翻译过的相同文本（相同语言对、模型、提示词和术语表）直接复用，不再调用 API。",
+        "requests_per_minute_label": "每分钟请求上限（RPM）：",
+        "requests_per_minute_tooltip": "所有工作线程共享的每分钟 API 请求数上限。请根据您的 API 等级设置。（0 表示不限制）",
+        "tokens_per_minute_label": "每分钟令牌上限（TPM）：",
+        "tokens_per_minute_tooltip": "所有工作线程共享的每分钟令牌数上限。达到上限时请求会排队等待，而不是触发 429 错误。（0 表示不限制）",
+        "use_async_engine_label": "使用异步引擎（asyncio）",
+        "use_async_engine_tooltip": "使用 asyncio 而非线程发送请求。仅用少量线程即可同时处理“并发任务数”个请求，停止时也会取消正在进行的请求。",
+        "batch_token_budget_label": "批次令牌预算：",
+        "batch_token_budget_tooltip": "单个批次预计输出令牌数的上限。会按每行的预计令牌数（含目标语言扩展比例）打包批次，并据此为每个请求设置最大输出令牌数。",
+        "use_values_only_payload_label": "仅发送值（在本地重建键）",
+        "use_values_only_payload_tooltip": "选中时：仅将引号内的值连同简短编号发送到 API，不发送键、版本号、注释和空行。\n响应按编号放回原始行，因此键不会丢失，请求令牌也会大幅减少。",
+        "use_json_response_label": "JSON 响应模式（按 ID 对齐）",
+        "use_json_response_tooltip": "选中时：要求模型返回按行 ID 组织的 JSON 对象（使用响应架构）。\n结果按 ID 而非位置对齐，只重新请求缺失或无效的 ID。同时使用仅发送值格式。",
+        "enforce_glossary_label": "术语表合规检查",
+        "enforce_glossary_tooltip": "选中时：翻译后检查原文中出现的术语表术语在结果中是否使用了指定译文。\n未翻译的原文术语会在本地直接替换，只对其余不合规的行重新请求一次。日志中显示每个文件的合规率。",
+        "incremental_translation_label": "增量翻译（仅翻译更改的键）",
+        "incremental_translation_tooltip": "选中时：在每个输出文件旁保存包含各键原文哈希的清单（.manifest.json）。\n下次运行只翻译新增或更改的键，其余沿用现有输出的译文。更改模型/提示词/术语表时将全部重新翻译。",
+        "gap_fill_mode_label": "补全模式（仅翻译目标文件中缺失的键）",
+        "gap_fill_mode_tooltip": "选中时：按键读取输出文件夹中已有的目标文件（部分翻译或手动翻译），只翻译其中缺失的键。\n已有行保持逐字节不变，结果按原文件顺序合并。有清单的文件优先使用增量翻译。",
 
         # 2.6. 提示词与术语表 (Prompt & Glossary)
         "prompt_glossary_frame_title": "提示词与术语表管理",
@@ -952,6 +1072,9 @@ LANGUAGES = {
         "glossary_error_not_found": "文件未找到",
         "glossary_error_empty": "空文件",
         "glossary_error_no_valid": "无有效条目",
+        "glossary_search_placeholder": "查找术语（输入开头）",
+        "glossary_search_tooltip": "在已加载的术语表中查找以输入内容开头的术语，并显示其译文。",
+        "glossary_search_no_results": "没有匹配的术语",
 
         # 2.7. 控制面板与进度 (Control Panel & Progress)
         "translate_button": "开始翻译",
@@ -1015,7 +1138,6 @@ LANGUAGES = {
         "log_first_line_change": "  将文件首行标识符从 '{0}' 更改为 '{1}'。",
         "log_output_filename_change": "  将输出文件名从 '{0}' 更改为 '{1}'。",
         "log_backup_created": "已创建备份文件：{0}",
-        "log_checkpoint_found": "找到文件 '{0}' 的检查点。从第 {1} 行恢复。",
         "log_translation_complete_save": "翻译完成！已保存到文件 '{0}'。",
         "log_all_translation_done": "所有文件的翻译任务已完成！",
         "log_stop_requested": "已请求停止任务...",
@@ -1029,6 +1151,16 @@ LANGUAGES = {
         "log_combined_glossary_empty": "合并后的术语表为空。",
         "log_combined_glossary_info": "正在使用合并后术语表中的 {0} 个有效条目。",
         "log_retrying_missing_lines": "正在重试 {0} 个缺失行...（第 {1}/3 次尝试）",
+        "log_glossary_conflicts": "术语表中发现 {0} 个译法冲突的术语：{1}",
+        "log_journal_resume": "找到文件 '{0}' 的翻译记录。已恢复 {1} 个完成的批次（{2} 行），只翻译剩余批次。",
+        "log_journal_discarded": "文件 '{0}' 的原文或翻译设置已更改。丢弃之前的翻译记录并重新开始。",
+        "log_incremental_plan": "[{0}] 增量翻译：沿用 {1} 个键，翻译 {2} 个新增或更改的键，删除 {3} 个键",
+        "log_manifest_error": "[{0}] 保存清单时出错：{1}",
+        "log_gap_fill_mode": "补全模式：只翻译现有目标文件中缺失的键。",
+        "log_gap_fill_plan": "[{0}] 补全：保留 {1} 个现有行，翻译 {2} 个缺失的键，排除 {3} 个原文中不存在的键",
+        "log_passthrough_values": "[{0}] {1} 个无需翻译的值（代码/数字/路径/GFX_ 标识/与键相同）不发送到 API，保持原样。",
+        "log_file_no_translatable_values": "[{0}] 没有需要翻译的值，不调用 API，直接按原文保存。",
+        "log_file_all_reused": "[{0}] 没有变化的行，直接复用现有译文保存（不调用 API）。",
 
         # 3.2. 错误/警告日志 (Error/Warning Logs)
         "error_api_key_needed": "需要输入 Gemini API 密钥。",
@@ -1111,6 +1243,27 @@ LANGUAGES = {
         "log_source_remnant_detected": "在行 {} 中检测到源语言残留: {}...",
         "log_batch_retry_source_remnants": "因源语言残留而重试批处理 (影响了 {}/{} 行)。重试 {}/{}",
 
+        # 3.5. 性能优化相关日志 (Optimization Logs)
+        "log_tm_batch_hits": "文件 '{0}'：从翻译记忆中复用 {1} 行（批次 {2} 行）",
+        "log_tm_summary": "翻译记忆：命中 {0}，未命中 {1}（命中率 {2}），已存储 {3} 条",
+        "log_tm_error": "翻译记忆错误：{0}",
+        "log_dedup_scan_result": "去重分析：共 {0} 个值，唯一值 {1} 个，重复出现的值 {2} 个",
+        "log_duplicate_files_detected": "发现 {0} 个内容完全相同的文件（{1} 组）- 每组只翻译一次。",
+        "log_duplicate_file_copied": "文件 '{0}' 与 '{1}' 内容相同，已复制其翻译结果。",
+        "log_dedup_summary": "去重共享了 {0} 个值的翻译结果。",
+        "log_rate_limited_backoff": "文件 '{0}'：触发 API 速率限制（429）。所有请求暂停 {1} 秒后重试。（{2}/{3}）",
+        "log_batch_retry_failed_lines": "文件 '{0}'：仅重新请求 {2} 行中失败的 {1} 行（其中 {3} 行残留源语言）。（{4}/{5}）",
+        "log_prompt_static_tokens": "提示词的固定部分（规则/游戏说明/术语表，约 {0} 个令牌）作为系统指令只发送一次。",
+        "log_prompt_cache_created": "已将固定提示词（约 {0} 个令牌）注册为缓存内容。",
+        "log_prompt_cache_unavailable": "无法使用提示词缓存，改用系统指令：{0}",
+        "log_prompt_token_summary": "提示词令牌（估算）：固定部分 {0} 个令牌，{1} 次请求的批次部分共 {2} 个令牌，API 报告的缓存命中 {3} 个令牌",
+        "log_glossary_index_built": "已为 {0} 个术语表条目建立索引。每个请求只包含批次中出现的术语。",
+        "log_glossary_injection_summary": "术语表：每个请求平均只发送 {0} 个条目（共 {1} 个条目）",
+        "log_glossary_rerequest": "[{0}] 重新请求 {1} 行未遵循术语表的内容。",
+        "log_glossary_compliance": "[{0}] 术语表合规率 {1}%（{2}/{3} 行，本地替换 {4} 处）",
+        "log_check_cache_summary": "检查结果缓存：命中 {0} 次，未命中 {1} 次，因容量限制移除 {2} 个",
+        "log_dedup_template_result": "模板去重：将仅游戏代码/数字不同的值合并，{0} 个唯一值归为 {1} 个模板进行翻译。",
+
         # ======================================================================
         # 4. 工具 (Tools)
         # ======================================================================